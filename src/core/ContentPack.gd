@@ -0,0 +1,117 @@
+extends Node
+## ContentPack - Reads shipped content from the single-file pack
+## Format written by tools/content_pack.py; falls back to loose res:// files
+## only when no pack is present (editor runs), so an entry missing from an
+## exported pack fails instead of being masked by a stray loose copy
+
+const PACK_NAME := "content.pack"
+const MAGIC := "WLCP"
+const FORMAT_VERSION := 1
+const COMPRESSION_NONE := 0
+const COMPRESSION_DEFLATE := 1
+
+var pack_file: FileAccess = null
+var pack_path := ""
+var entries: Dictionary = {}  # path (without res://) -> [compression, offset, stored size, size]
+
+
+func _ready() -> void:
+	_open_pack()
+
+
+func _open_pack() -> void:
+	# tools/export_demo_full.py writes the pack next to the exported executable
+	for candidate in [OS.get_executable_path().get_base_dir().path_join(PACK_NAME), "res://" + PACK_NAME]:
+		if FileAccess.file_exists(candidate):
+			pack_path = candidate
+			break
+	if pack_path.is_empty():
+		return
+
+	var file := FileAccess.open(pack_path, FileAccess.READ)
+	if file == null:
+		push_error("[ContentPack] Failed to open %s" % pack_path)
+		return
+
+	if file.get_buffer(4).get_string_from_ascii() != MAGIC:
+		push_error("[ContentPack] %s is not a content pack" % pack_path)
+		return
+	var version := file.get_16()
+	if version != FORMAT_VERSION:
+		push_error("[ContentPack] Unsupported pack version %d" % version)
+		return
+	file.get_16()  # Payload alignment, only needed by the writer
+	var count := file.get_32()
+	var names_size := file.get_32()
+	file.get_64()  # Reserved
+
+	# The index is small; read it once rather than binary-searching on disk
+	var records := []
+	for i in range(count):
+		var name_offset := file.get_32()
+		var name_length := file.get_16()
+		var compression := file.get_8()
+		file.get_8()  # Padding
+		var offset := file.get_64()
+		var stored := file.get_32()
+		var size := file.get_32()
+		file.get_buffer(32)  # SHA-256, checked by content_pack.py verify
+		records.append([name_offset, name_length, [compression, offset, stored, size]])
+
+	var names := file.get_buffer(names_size)
+	if names.size() != names_size:
+		push_error("[ContentPack] Truncated index in %s" % pack_path)
+		return
+
+	for record in records:
+		var entry_name := names.slice(record[0], record[0] + record[1]).get_string_from_utf8()
+		entries[entry_name] = record[2]
+
+	pack_file = file
+	print("[ContentPack] Loaded %d entries from %s" % [entries.size(), pack_path])
+
+
+func _entry_name(path: String) -> String:
+	return path.trim_prefix("res://")
+
+
+## Check whether the pack (or, without a pack, the loose files) provides a path
+func file_exists(path: String) -> bool:
+	if pack_file == null:
+		return FileAccess.file_exists(path)
+	return entries.has(_entry_name(path))
+
+
+## Raw bytes of a packed entry, or of the loose file without a pack; empty on failure
+func get_buffer(path: String) -> PackedByteArray:
+	var entry_name := _entry_name(path)
+	if pack_file == null:
+		var file := FileAccess.open(path, FileAccess.READ)
+		if file == null:
+			return PackedByteArray()
+		var loose := file.get_buffer(file.get_length())
+		file.close()
+		return loose
+
+	if not entries.has(entry_name):
+		push_error("[ContentPack] Not in %s: %s" % [pack_path, entry_name])
+		return PackedByteArray()
+
+	var entry: Array = entries[entry_name]
+	pack_file.seek(entry[1])
+	var data := pack_file.get_buffer(entry[2])
+	if entry[0] == COMPRESSION_DEFLATE:
+		data = data.decompress(entry[3], FileAccess.COMPRESSION_DEFLATE)
+	elif entry[0] != COMPRESSION_NONE:
+		push_error("[ContentPack] Unknown compression %d for %s" % [entry[0], entry_name])
+		return PackedByteArray()
+
+	if data.size() != entry[3]:
+		push_error("[ContentPack] Corrupt entry: %s" % entry_name)
+		return PackedByteArray()
+	return data
+
+
+## UTF-8 text of a packed entry, or of the loose file without a pack; empty on failure
+func get_as_text(path: String) -> String:
+	return get_buffer(path).get_string_from_utf8()
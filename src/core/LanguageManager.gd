@@ -7,31 +7,37 @@ signal translation_missing(key: String, lang_code: String)
 
 const LANGUAGE_REGISTRY_PATH := "res://locales/_meta/language_registry.json"
 const FALLBACK_RULES_PATH := "res://locales/_meta/fallback_rules.json"
+## Compiled by tools/compile_locales.py: one key table shared by all languages
+const LOCALE_KEYS_PATH := "res://content/locales/keys.json"
+const LOCALE_STRINGS_PATH := "res://content/locales/%s.json"
 
 var language_registry := {}
 var fallback_rules := {}
 var current_language := "english"
-var translations := {}  # Cache of loaded translations
+var ui_keys := []  # Key ID -> key
+var key_ids := {}  # Key -> index into every language's string array
+var keys_hash := ""
+var translations := {}  # Cache of loaded string arrays (null = untranslated)
 var missing_keys := {}  # Track missing keys per language
 
 
 func _ready() -> void:
 	_load_language_registry()
 	_load_fallback_rules()
+	_load_key_table()
 	_detect_initial_language()
 	print("[LanguageManager] Initialized with language: %s" % current_language)
 
 
 ## Load language registry from JSON
 func _load_language_registry() -> void:
-	var file := FileAccess.open(LANGUAGE_REGISTRY_PATH, FileAccess.READ)
-	if not file:
+	var json_text := ContentPack.get_as_text(LANGUAGE_REGISTRY_PATH)
+	if json_text.is_empty():
 		push_error("[LanguageManager] Failed to load language registry")
 		return
 
 	var json := JSON.new()
-	var parse_result := json.parse(file.get_as_text())
-	file.close()
+	var parse_result := json.parse(json_text)
 
 	if parse_result != OK:
 		push_error("[LanguageManager] Failed to parse language registry JSON")
@@ -45,14 +51,13 @@ func _load_language_registry() -> void:
 
 ## Load fallback rules from JSON
 func _load_fallback_rules() -> void:
-	var file := FileAccess.open(FALLBACK_RULES_PATH, FileAccess.READ)
-	if not file:
+	var json_text := ContentPack.get_as_text(FALLBACK_RULES_PATH)
+	if json_text.is_empty():
 		push_error("[LanguageManager] Failed to load fallback rules")
 		return
 
 	var json := JSON.new()
-	var parse_result := json.parse(file.get_as_text())
-	file.close()
+	var parse_result := json.parse(json_text)
 
 	if parse_result != OK:
 		push_error("[LanguageManager] Failed to parse fallback rules JSON")
@@ -64,6 +69,24 @@ func _load_fallback_rules() -> void:
 		print("[LanguageManager] Loaded fallback rules for %d languages" % fallback_rules.size())
 
 
+## Load the shared key table
+func _load_key_table() -> void:
+	var json_text := ContentPack.get_as_text(LOCALE_KEYS_PATH)
+	if json_text.is_empty():
+		push_error("[LanguageManager] Failed to load locale key table")
+		return
+
+	var json := JSON.new()
+	if json.parse(json_text) != OK:
+		push_error("[LanguageManager] Failed to parse locale key table")
+		return
+
+	ui_keys = json.data.get("keys", [])
+	keys_hash = json.data.get("keys_hash", "")
+	for i in ui_keys.size():
+		key_ids[ui_keys[i]] = i
+
+
 ## Detect initial language from Steam, system, or default
 func _detect_initial_language() -> void:
 	var detected_lang := "english"
@@ -225,55 +248,79 @@ func _load_translations(lang_code: String) -> void:
 	if translations.has(lang_code):
 		return  # Already loaded
 
-	var locale_path := "res://locales/%s/ui.json" % lang_code
-	var file := FileAccess.open(locale_path, FileAccess.READ)
+	var locale_path := LOCALE_STRINGS_PATH % lang_code
+	var json_text := ContentPack.get_as_text(locale_path)
 
-	if not file:
+	if json_text.is_empty():
 		push_warning("[LanguageManager] Translation file not found: %s" % locale_path)
-		translations[lang_code] = {}
+		translations[lang_code] = []
 		return
 
 	var json := JSON.new()
-	var parse_result := json.parse(file.get_as_text())
-	file.close()
+	var parse_result := json.parse(json_text)
 
 	if parse_result != OK:
 		push_error("[LanguageManager] Failed to parse translations for %s" % lang_code)
-		translations[lang_code] = {}
+		translations[lang_code] = []
+		return
+
+	# Arrays are indexed by key ID, so they must match the loaded key table
+	if json.data.get("keys_hash", "") != keys_hash:
+		push_error("[LanguageManager] Translations for %s were built against another key table" % lang_code)
+		translations[lang_code] = []
 		return
 
-	translations[lang_code] = json.data as Dictionary
+	translations[lang_code] = json.data.get("strings", [])
 	print("[LanguageManager] Loaded %d translation keys for %s" % [translations[lang_code].size(), lang_code])
 
 
+## Translate a key in the current language, formatted with args if given
+func get_text(key: String, args: Array = []) -> String:
+	var text := get_text_by_id(key_ids.get(key, -1), "", key)
+	return text % args if not args.is_empty() else text
+
+
 ## Translate a key
 func tr(key: String, lang_code: String = "") -> String:
-	if lang_code == "":
-		lang_code = current_language
+	return get_text_by_id(key_ids.get(key, -1), lang_code, key)
 
-	# Ensure translations are loaded
-	if not translations.has(lang_code):
-		_load_translations(lang_code)
 
-	# Try to find translation
-	if translations[lang_code].has(key):
-		return translations[lang_code][key]
+## Key ID for get_text_by_id(), for text looked up every frame (-1 if unknown)
+func get_key_id(key: String) -> int:
+	return key_ids.get(key, -1)
 
-	# Try fallback chain
-	if fallback_rules.has(lang_code):
-		var fallback_chain: Array = fallback_rules[lang_code]
-		for fallback_lang in fallback_chain:
-			if not translations.has(fallback_lang):
-				_load_translations(fallback_lang)
 
-			if translations[fallback_lang].has(key):
-				return translations[fallback_lang][key]
+## Translate by key ID, walking the fallback chain by array index
+func get_text_by_id(key_id: int, lang_code: String = "", key: String = "") -> String:
+	if lang_code == "":
+		lang_code = current_language
+	if key == "" and key_id >= 0 and key_id < ui_keys.size():
+		key = ui_keys[key_id]
+
+	if key_id >= 0:
+		var text = _lookup(key_id, lang_code)
+		if text != null:
+			return text
+
+		for fallback_lang in fallback_rules.get(lang_code, []):
+			text = _lookup(key_id, fallback_lang)
+			if text != null:
+				return text
 
 	# No translation found
 	_log_missing_key(key, lang_code)
 	return "[%s]" % key  # Return key in brackets to indicate missing translation
 
 
+## One language's string for a key ID, or null
+func _lookup(key_id: int, lang_code: String) -> Variant:
+	if not translations.has(lang_code):
+		_load_translations(lang_code)
+
+	var strings: Array = translations[lang_code]
+	return strings[key_id] if key_id >= 0 and key_id < strings.size() else null
+
+
 ## Log missing translation key
 func _log_missing_key(key: String, lang_code: String) -> void:
 	if not missing_keys.has(lang_code):
@@ -325,7 +372,7 @@ func validate_all_languages(required_keys: Array) -> Dictionary:
 
 		var missing := []
 		for key in required_keys:
-			if not translations[lang_code].has(key):
+			if _lookup(key_ids.get(key, -1), lang_code) == null:
 				missing.append(key)
 
 		if missing.size() > 0:
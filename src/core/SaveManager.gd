@@ -11,13 +11,34 @@ const SETTINGS_DIR := "user://settings/"
 const MAX_MANUAL_SLOTS := 100
 const MAX_AUTO_SLOTS := 10
 const SAVE_EXTENSION := ".json"
+## Slot metadata sidecar, so startup needs one small read instead of a full
+## parse per save. Format shared with tools/save_tool.py.
+const INDEX_PATH := SAVE_DIR + "index.json"
+const INDEX_FORMAT := 1
+const INDEX_FIELDS := [
+	"slot", "created_at", "updated_at", "chapter", "playtime_seconds",
+	"file_size", "modified_time", "hash", "schema_version", "build_flavor"
+]
+const INDEX_INT_FIELDS := ["slot", "chapter", "playtime_seconds", "file_size", "modified_time", "schema_version"]
+## Compact save encoding, shared with tools/save_codec.py
+const SAVE_ENCODING := 1
+const NODE_TABLE_PATH := "res://content/main/node_table.json"
+const ACHIEVEMENT_TABLE_PATH := "res://content/achievements/achievement_table.json"
+const EVENT_QUESTION := 0
+const EVENT_HINT := 1
 
 var save_slots := {}  # Cache of save metadata
 var current_slot := -1  # Currently loaded slot (-1 = none)
+var node_table := []  # Append-only node IDs, bit positions for seen_nodes
+var node_positions := {}  # node ID -> index in node_table
+var achievement_table := []  # Append-only achievement IDs, bit positions for achievements_unlocked
+var achievement_positions := {}  # achievement ID -> index in achievement_table
 
 
 func _ready() -> void:
 	_ensure_directories()
+	_load_node_table()
+	_load_achievement_table()
 	_scan_save_slots()
 	print("[SaveManager] Initialized with %d saves found" % save_slots.size())
 
@@ -34,6 +55,8 @@ func _ensure_directories() -> void:
 
 
 ## Scan all save slots and build metadata cache
+## Saves listed in the slot index with an unchanged modified time are not
+## opened; anything else is parsed and the index is rewritten.
 func _scan_save_slots() -> void:
 	save_slots.clear()
 
@@ -42,6 +65,9 @@ func _scan_save_slots() -> void:
 		push_warning("[SaveManager] Could not open save directory")
 		return
 
+	var indexed := _load_slot_index()
+	var index_dirty := false
+
 	dir.list_dir_begin()
 	var file_name := dir.get_next()
 
@@ -49,16 +75,82 @@ func _scan_save_slots() -> void:
 		if not dir.current_is_dir() and file_name.ends_with(SAVE_EXTENSION):
 			var slot_num := _extract_slot_number(file_name)
 			if slot_num >= 0:
-				var metadata := _load_save_metadata(slot_num)
-				if metadata:
-					save_slots[slot_num] = metadata
+				if file_name.begins_with("auto_"):
+					slot_num += 1000
+
+				var cached: Dictionary = indexed.get(slot_num, {})
+				indexed.erase(slot_num)
+
+				if not cached.is_empty() and cached.modified_time == FileAccess.get_modified_time(SAVE_DIR + file_name):
+					save_slots[slot_num] = cached
+				else:
+					index_dirty = true
+					var metadata := _load_save_metadata(slot_num)
+					if metadata:
+						save_slots[slot_num] = metadata
 
 		file_name = dir.get_next()
 
 	dir.list_dir_end()
+
+	# Leftover index rows belong to saves that no longer exist
+	if index_dirty or not indexed.is_empty():
+		_write_slot_index()
+
 	save_list_updated.emit()
 
 
+## Load the slot index as slot -> metadata ({} if missing or unusable)
+func _load_slot_index() -> Dictionary:
+	if not FileAccess.file_exists(INDEX_PATH):
+		return {}
+
+	var json := JSON.new()
+	if json.parse(FileAccess.get_file_as_string(INDEX_PATH)) != OK or not json.data is Dictionary:
+		push_warning("[SaveManager] Slot index unreadable, rescanning saves")
+		return {}
+
+	var index := json.data as Dictionary
+	if index.get("format", 0) != INDEX_FORMAT or index.get("fields", []) != INDEX_FIELDS:
+		return {}
+
+	var slots := {}
+	for row in index.get("slots", []):
+		if row.size() != INDEX_FIELDS.size():
+			continue
+		var metadata := {}
+		for i in INDEX_FIELDS.size():
+			var field: String = INDEX_FIELDS[i]
+			# JSON numbers come back as floats
+			metadata[field] = int(row[i]) if field in INDEX_INT_FIELDS else row[i]
+		metadata.is_auto = metadata.slot >= 1000
+		slots[metadata.slot] = metadata
+
+	return slots
+
+
+## Write the slot index from the metadata cache
+func _write_slot_index() -> void:
+	var slots := save_slots.keys()
+	slots.sort()
+
+	var rows := []
+	for slot in slots:
+		var metadata: Dictionary = save_slots[slot]
+		var row := []
+		for field in INDEX_FIELDS:
+			row.append(metadata.get(field, ""))
+		rows.append(row)
+
+	var file := FileAccess.open(INDEX_PATH, FileAccess.WRITE)
+	if not file:
+		push_warning("[SaveManager] Failed to write slot index: %s" % INDEX_PATH)
+		return
+
+	file.store_string(JSON.stringify({"format": INDEX_FORMAT, "fields": INDEX_FIELDS, "slots": rows}))
+	file.close()
+
+
 ## Extract slot number from filename
 func _extract_slot_number(filename: String) -> int:
 	# Format: save_001.json or auto_001.json
@@ -83,30 +175,263 @@ func _load_save_metadata(slot: int) -> Dictionary:
 	if not file:
 		return {}
 
-	var json := JSON.new()
-	var parse_result := json.parse(file.get_as_text())
+	var content := file.get_as_text()
 	file.close()
 
-	if parse_result != OK:
+	var json := JSON.new()
+	if json.parse(content) != OK:
 		push_error("[SaveManager] Failed to parse save file: %s" % path)
 		return {}
 
-	var data := json.data as Dictionary
+	return _metadata_from_state(slot, json.data as Dictionary, path, content)
 
-	# Extract metadata
+
+## Build slot metadata from save data and its serialized form
+func _metadata_from_state(slot: int, data: Dictionary, path: String, content: String) -> Dictionary:
 	return {
 		"slot": slot,
-		"is_auto": is_auto,
+		"is_auto": slot >= 1000,
 		"created_at": data.get("meta", {}).get("created_at", ""),
 		"updated_at": data.get("meta", {}).get("updated_at", ""),
 		"playtime_seconds": data.get("meta", {}).get("playtime_seconds", 0),
 		"chapter": data.get("main", {}).get("chapter", 1),
 		"build_flavor": data.get("version", {}).get("build_flavor", ""),
 		"schema_version": data.get("version", {}).get("schema_version", 0),
-		"file_size": FileAccess.get_file_as_bytes(path).size()
+		"file_size": content.to_utf8_buffer().size(),
+		"modified_time": FileAccess.get_modified_time(path),
+		"hash": content.sha256_text()
 	}
 
 
+## Load the node table used by the compact encoding
+func _load_node_table() -> void:
+	if not ContentPack.file_exists(NODE_TABLE_PATH):
+		push_warning("[SaveManager] Node table not found, seen nodes saved uncompressed")
+		return
+
+	var json := JSON.new()
+	if json.parse(ContentPack.get_as_text(NODE_TABLE_PATH)) != OK:
+		push_error("[SaveManager] Failed to parse node table")
+		return
+
+	node_table = json.data.get("nodes", [])
+	for i in node_table.size():
+		node_positions[node_table[i]] = i
+
+
+## Load the achievement table used by the compact encoding
+func _load_achievement_table() -> void:
+	if not ContentPack.file_exists(ACHIEVEMENT_TABLE_PATH):
+		push_warning("[SaveManager] Achievement table not found, achievements saved uncompressed")
+		return
+
+	var json := JSON.new()
+	if json.parse(ContentPack.get_as_text(ACHIEVEMENT_TABLE_PATH)) != OK:
+		push_error("[SaveManager] Failed to parse achievement table")
+		return
+
+	achievement_table = json.data.get("achievements", [])
+	for i in achievement_table.size():
+		achievement_positions[achievement_table[i]] = i
+
+
+## IDs as a base64 bitset over an append-only table; IDs missing from the
+## table go to "extra", in order
+func _encode_bitset(ids: Array, table: Array, positions: Dictionary) -> Dictionary:
+	var bits := PackedByteArray()
+	bits.resize((table.size() + 7) / 8)
+	bits.fill(0)
+	var extra := []
+	for id in ids:
+		if positions.has(id):
+			var i: int = positions[id]
+			bits[i >> 3] |= 1 << (i & 7)
+		elif id not in extra:
+			extra.append(id)
+	return {"bits": Marshalls.raw_to_base64(bits), "extra": extra}
+
+
+func _decode_bitset(encoded: String, extra: Array, table: Array, table_size: int) -> Array:
+	var bits := Marshalls.base64_to_raw(encoded)
+	var ids := []
+	for i in mini(table_size, bits.size() * 8):
+		if bits[i >> 3] & (1 << (i & 7)):
+			ids.append(table[i])
+	ids.append_array(extra)
+	return ids
+
+
+## Encode save data for writing: seen_nodes and achievements_unlocked as
+## bitsets over their tables, replay events as packed records. Mutates data
+## (a copy from to_dict()).
+func _encode_compact(data: Dictionary) -> Dictionary:
+	var main: Dictionary = data.get("main", {})
+	if main.has("seen_nodes"):
+		var seen := _encode_bitset(main.seen_nodes, node_table, node_positions)
+		main.erase("seen_nodes")
+		main["seen_nodes_bits"] = seen.bits
+		main["seen_nodes_extra"] = seen.extra
+
+	var flags: Dictionary = data.get("flags", {})
+	if flags.has("achievements_unlocked"):
+		var unlocked := _encode_bitset(flags.achievements_unlocked, achievement_table, achievement_positions)
+		flags.erase("achievements_unlocked")
+		flags["achievements_bits"] = unlocked.bits
+		flags["achievements_extra"] = unlocked.extra
+
+	var replay: Dictionary = data.get("side", {}).get("replay", {})
+	if replay.has("events"):
+		var packed := _pack_events(replay.events)
+		# Events of an unknown shape are kept as-is
+		if not packed.is_empty():
+			replay.erase("events")
+			replay["events_packed"] = packed.data
+			replay["event_strings"] = packed.strings
+
+	data.version["save_encoding"] = SAVE_ENCODING
+	data.version["node_table_size"] = node_table.size()
+	data.version["achievement_table_size"] = achievement_table.size()
+	return data
+
+
+## Decode a compact save back into GameState's layout ({} on failure)
+func _decode_compact(data: Dictionary) -> Dictionary:
+	var version: Dictionary = data.get("version", {})
+	if not version.has("save_encoding"):
+		return data
+
+	if int(version.save_encoding) != SAVE_ENCODING:
+		push_error("[SaveManager] Unsupported save encoding: %s" % version.save_encoding)
+		return {}
+
+	var table_size := int(version.get("node_table_size", 0))
+	if table_size > node_table.size():
+		push_error("[SaveManager] Save needs a newer node table (%d > %d)" % [table_size, node_table.size()])
+		return {}
+	# Absent in saves written before achievements were encoded
+	var achievement_table_size := int(version.get("achievement_table_size", 0))
+	if achievement_table_size > achievement_table.size():
+		push_error("[SaveManager] Save needs a newer achievement table (%d > %d)" % [achievement_table_size, achievement_table.size()])
+		return {}
+	version.erase("save_encoding")
+	version.erase("node_table_size")
+	version.erase("achievement_table_size")
+
+	var main: Dictionary = data.get("main", {})
+	if main.has("seen_nodes_bits"):
+		main["seen_nodes"] = _decode_bitset(main.seen_nodes_bits, main.get("seen_nodes_extra", []), node_table, table_size)
+		main.erase("seen_nodes_bits")
+		main.erase("seen_nodes_extra")
+
+	var flags: Dictionary = data.get("flags", {})
+	if flags.has("achievements_bits"):
+		flags["achievements_unlocked"] = _decode_bitset(flags.achievements_bits, flags.get("achievements_extra", []), achievement_table, achievement_table_size)
+		flags.erase("achievements_bits")
+		flags.erase("achievements_extra")
+
+	var replay: Dictionary = data.get("side", {}).get("replay", {})
+	if replay.has("events_packed"):
+		var events = _unpack_events(replay.events_packed, replay.get("event_strings", []))
+		if events == null:
+			push_error("[SaveManager] Corrupt replay events in save")
+			return {}
+		replay.erase("events_packed")
+		replay.erase("event_strings")
+		replay["events"] = events
+
+	return data
+
+
+## Pack replay events; {} if any event has a shape the format doesn't cover
+func _pack_events(events: Array) -> Dictionary:
+	var out := PackedByteArray()
+	var strings := []
+	var string_ids := {}
+
+	for event in events:
+		if not event is Dictionary or not _is_count(event.get("turn")):
+			return {}
+
+		if event.get("type") == "question" and event.size() == 4 and event.has_all(["question_id", "answer"]):
+			if not event.question_id is String or not event.answer is String:
+				return {}
+			out.append(EVENT_QUESTION)
+			_write_varint(out, int(event.turn))
+			for text in [event.question_id, event.answer]:
+				if not string_ids.has(text):
+					string_ids[text] = strings.size()
+					strings.append(text)
+				_write_varint(out, string_ids[text])
+		elif event.get("type") == "hint" and event.size() == 3 and _is_count(event.get("hint_index")):
+			out.append(EVENT_HINT)
+			_write_varint(out, int(event.turn))
+			_write_varint(out, int(event.hint_index))
+		else:
+			return {}
+
+	return {"data": Marshalls.raw_to_base64(out), "strings": strings}
+
+
+## Unpack replay events; null if the data is corrupt
+func _unpack_events(encoded: String, strings: Array) -> Variant:
+	var data := Marshalls.base64_to_raw(encoded)
+	var events := []
+	var reader := [0]  # Read offset, shared with _read_varint
+
+	while reader[0] < data.size():
+		var kind := data[reader[0]]
+		reader[0] += 1
+		var turn := _read_varint(data, reader)
+
+		if kind == EVENT_QUESTION:
+			var question := _read_varint(data, reader)
+			var answer := _read_varint(data, reader)
+			if question < 0 or answer < 0 or question >= strings.size() or answer >= strings.size():
+				return null
+			events.append({"type": "question", "turn": turn, "question_id": strings[question], "answer": strings[answer]})
+		elif kind == EVENT_HINT:
+			var hint_index := _read_varint(data, reader)
+			if hint_index < 0:
+				return null
+			events.append({"type": "hint", "turn": turn, "hint_index": hint_index})
+		else:
+			return null
+
+		if turn < 0:
+			return null
+
+	return events
+
+
+## Whole non-negative number (JSON numbers may arrive as floats)
+func _is_count(value: Variant) -> bool:
+	if typeof(value) != TYPE_INT and typeof(value) != TYPE_FLOAT:
+		return false
+	return value >= 0 and value == floor(value)
+
+
+## Unsigned LEB128
+func _write_varint(out: PackedByteArray, value: int) -> void:
+	while value >= 0x80:
+		out.append((value & 0x7F) | 0x80)
+		value >>= 7
+	out.append(value)
+
+
+## Read an unsigned LEB128 at reader[0]; -1 if truncated
+func _read_varint(data: PackedByteArray, reader: Array) -> int:
+	var value := 0
+	var shift := 0
+	while reader[0] < data.size():
+		var byte := data[reader[0]]
+		reader[0] += 1
+		value |= (byte & 0x7F) << shift
+		if byte < 0x80:
+			return value
+		shift += 7
+	return -1
+
+
 ## Save game to slot
 func save_game(slot: int, is_auto: bool = false) -> bool:
 	if not is_auto and (slot < 1 or slot > MAX_MANUAL_SLOTS):
@@ -123,8 +448,8 @@ func save_game(slot: int, is_auto: bool = false) -> bool:
 	# Update timestamps
 	state_data.meta.updated_at = Time.get_datetime_string_from_system()
 
-	# Serialize to JSON
-	var json_string := JSON.stringify(state_data, "\t")
+	# Serialize to compact JSON
+	var json_string := JSON.stringify(_encode_compact(state_data))
 
 	# Write to file
 	var path := _get_save_path(slot, is_auto)
@@ -138,9 +463,10 @@ func save_game(slot: int, is_auto: bool = false) -> bool:
 	file.store_string(json_string)
 	file.close()
 
-	# Update cache
+	# Update cache from what was just written, without re-reading it
 	var actual_slot := slot if not is_auto else slot + 1000
-	save_slots[actual_slot] = _load_save_metadata(actual_slot)
+	save_slots[actual_slot] = _metadata_from_state(actual_slot, state_data, path, json_string)
+	_write_slot_index()
 
 	current_slot = actual_slot
 	save_list_updated.emit()
@@ -182,7 +508,7 @@ func load_game(slot: int) -> bool:
 		load_completed.emit(slot, false)
 		return false
 
-	var data := json.data as Dictionary
+	var data := _decode_compact(json.data as Dictionary)
 
 	# Validate save data
 	if not _validate_save_data(data):
@@ -242,6 +568,7 @@ func delete_save(slot: int) -> bool:
 		return false
 
 	save_slots.erase(slot)
+	_write_slot_index()
 	save_list_updated.emit()
 
 	print("[SaveManager] Deleted save slot %d" % slot)
@@ -361,7 +688,7 @@ func import_save(import_path: String, target_slot: int) -> bool:
 		push_error("[SaveManager] Invalid save file format")
 		return false
 
-	var data := json.data as Dictionary
+	var data := _decode_compact(json.data as Dictionary)
 	if not _validate_save_data(data):
 		push_error("[SaveManager] Save data validation failed")
 		return false
@@ -378,6 +705,7 @@ func import_save(import_path: String, target_slot: int) -> bool:
 
 	# Update cache
 	save_slots[target_slot] = _load_save_metadata(target_slot)
+	_write_slot_index()
 	save_list_updated.emit()
 
 	print("[SaveManager] Save imported to slot %d" % target_slot)
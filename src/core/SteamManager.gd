@@ -8,15 +8,23 @@ signal cloud_sync_completed(success: bool)
 
 const STEAM_APP_ID := 480  # TEST ONLY - Must change for release
 const STEAM_APP_ID_FILE := "steam_appid.txt"
+## Per-flavor table from tools/compile_achievements.py
+const ACHIEVEMENTS_PATH := "res://content/achievements/achievements_%s.json"
 
 var steam_available := false
 var steam_id := 0
 var steam_username := ""
 var achievements_cache := {}
+var achievements := []  # This flavor's achievement definitions, in table order
+var achievement_bits := {}  # achievement ID -> bit in the append-only achievement table
+var unlocked_bits := PackedByteArray()  # Bitset mirror of flags.achievements_unlocked
+var _writing_unlocks := false
 
 
 func _ready() -> void:
 	_initialize_steam()
+	# BuildConfig (which picks the flavor) loads after this autoload
+	_load_achievement_table.call_deferred()
 
 
 ## Initialize Steamworks
@@ -165,14 +173,68 @@ func _load_achievements() -> void:
 	print("[SteamManager] Loaded %d achievements" % achievements_cache.size())
 
 
+## Load this flavor's achievement table and index it by ID
+func _load_achievement_table() -> void:
+	var path := ACHIEVEMENTS_PATH % BuildConfig.get_build_flavor()
+	if not ContentPack.file_exists(path):
+		push_error("[SteamManager] Achievement table not found: %s" % path)
+		return
+
+	var json := JSON.new()
+	if json.parse(ContentPack.get_as_text(path)) != OK:
+		push_error("[SteamManager] Failed to parse achievement table: %s" % path)
+		return
+
+	achievements = json.data.get("achievements", [])
+	for achievement in achievements:
+		achievement_bits[achievement.id] = int(achievement.bit)
+	unlocked_bits.resize((int(json.data.get("table_size", 0)) + 7) / 8)
+
+	GameState.state_changed.connect(_on_state_changed)
+	SaveManager.load_completed.connect(_on_save_loaded)
+	_sync_unlocked_bits()
+
+
+## Rebuild the bitset from GameState (after a load or an outside change)
+func _sync_unlocked_bits() -> void:
+	unlocked_bits.fill(0)
+	for achievement_id in GameState.get_value("flags", "achievements_unlocked", []):
+		var bit: int = achievement_bits.get(achievement_id, -1)
+		if bit >= 0:
+			unlocked_bits[bit >> 3] |= 1 << (bit & 7)
+
+
+func _on_state_changed(domain: String, key: String, _value: Variant) -> void:
+	if _writing_unlocks:
+		return
+	if domain == "flags" and key in ["", "achievements_unlocked"]:
+		_sync_unlocked_bits()
+
+
+func _on_save_loaded(_slot: int, success: bool) -> void:
+	if success:
+		_sync_unlocked_bits()
+
+
+func _is_unlocked_locally(bit: int) -> bool:
+	return unlocked_bits[bit >> 3] & (1 << (bit & 7)) != 0
+
+
 ## Unlock achievement
 func unlock_achievement(achievement_id: String) -> bool:
+	var bit: int = achievement_bits.get(achievement_id, -1)
+	if bit < 0:
+		push_warning("[SteamManager] Unknown achievement for this build: %s" % achievement_id)
+		return false
+
 	# Always track locally
-	if GameState:
+	if not _is_unlocked_locally(bit):
+		unlocked_bits[bit >> 3] |= 1 << (bit & 7)
 		var unlocked: Array = GameState.get_value("flags", "achievements_unlocked", [])
-		if achievement_id not in unlocked:
-			unlocked.append(achievement_id)
-			GameState.set_value("flags", "achievements_unlocked", unlocked)
+		unlocked.append(achievement_id)
+		_writing_unlocks = true
+		GameState.set_value("flags", "achievements_unlocked", unlocked)
+		_writing_unlocks = false
 
 	if not steam_available:
 		print("[SteamManager] Achievement unlocked (offline): %s" % achievement_id)
@@ -201,11 +263,8 @@ func is_achievement_unlocked(achievement_id: String) -> bool:
 		return achievements_cache.get(achievement_id, false)
 
 	# Check local cache
-	if GameState:
-		var unlocked: Array = GameState.get_value("flags", "achievements_unlocked", [])
-		return achievement_id in unlocked
-
-	return false
+	var bit: int = achievement_bits.get(achievement_id, -1)
+	return bit >= 0 and _is_unlocked_locally(bit)
 
 
 ## Get achievement progress (for progress-based achievements)
@@ -30,30 +30,32 @@ const INTERNAL_TO_EXTERNAL := {
 }
 
 var vocabulary_database: Dictionary = {}
+var vocabulary_index: Dictionary = {}  # Per-language level index from tools/compile_vocab.py
+var word_positions: Dictionary = {}  # lang -> word_id -> position in vocabulary_index word_ids
+var injection_index: Dictionary = {}  # target lang -> node_id -> text lang -> {length, hash, spans: [[word_id, start, end], ...]}
 var current_quiz: Dictionary = {}
 
 
 func _ready() -> void:
 	_load_vocabulary_database()
+	_load_vocabulary_index()
+	_load_injection_index()
 
 
 func _load_vocabulary_database() -> void:
 	# Load vocabulary database from JSON
 	var db_path := "res://content/vocabulary/vocab_database.json"
 
-	if not FileAccess.file_exists(db_path):
+	if not ContentPack.file_exists(db_path):
 		push_warning("[VocabularyManager] Vocabulary database not found, creating placeholder")
 		_create_placeholder_database()
 		return
 
-	var file := FileAccess.open(db_path, FileAccess.READ)
-	if file == null:
+	var json_text := ContentPack.get_as_text(db_path)
+	if json_text.is_empty():
 		push_error("[VocabularyManager] Failed to open vocabulary database")
 		return
 
-	var json_text := file.get_as_text()
-	file.close()
-
 	var json := JSON.new()
 	if json.parse(json_text) == OK:
 		vocabulary_database = json.data
@@ -84,31 +86,97 @@ func _create_placeholder_database() -> void:
 	}
 
 
+func _load_vocabulary_index() -> void:
+	# Load the compiled level index; without it we fall back to scanning
+	var index_path := "res://content/vocabulary/vocab_index.json"
+
+	if not ContentPack.file_exists(index_path):
+		push_warning("[VocabularyManager] Vocabulary index not found, run tools/compile_vocab.py")
+		return
+
+	var json_text := ContentPack.get_as_text(index_path)
+	if json_text.is_empty():
+		push_error("[VocabularyManager] Failed to open vocabulary index")
+		return
+
+	var json := JSON.new()
+	if json.parse(json_text) == OK:
+		vocabulary_index = json.data.get("languages", {})
+		for lang in vocabulary_index:
+			var positions := {}
+			var word_ids: Array = vocabulary_index[lang].word_ids
+			for i in word_ids.size():
+				positions[word_ids[i]] = i
+			word_positions[lang] = positions
+	else:
+		push_error("[VocabularyManager] Failed to parse vocabulary index: %s" % json.get_error_message())
+
+
+func _load_injection_index() -> void:
+	# Precomputed word occurrences per story node, from tools/compile_content.py
+	var index_path := "res://content/vocabulary/injection_index.json"
+
+	if not ContentPack.file_exists(index_path):
+		return
+
+	var json_text := ContentPack.get_as_text(index_path)
+	if json_text.is_empty():
+		push_error("[VocabularyManager] Failed to open injection index")
+		return
+
+	var json := JSON.new()
+	if json.parse(json_text) == OK:
+		injection_index = json.data.get("languages", {})
+	else:
+		push_error("[VocabularyManager] Failed to parse injection index: %s" % json.get_error_message())
+
+
+## Get IDs of words at or below a level
+func _get_word_ids_for_level(target_lang: String, level: int) -> Array:
+	if vocabulary_index.has(target_lang):
+		# Words are sorted by level; level_end[L] counts words with level <= L
+		var lang_index: Dictionary = vocabulary_index[target_lang]
+		var level_end: Array = lang_index.level_end
+		var end := int(level_end[clampi(level, 0, level_end.size() - 1)])
+		return lang_index.word_ids.slice(0, end)
+
+	var word_ids: Array = []
+	var lang_vocab: Dictionary = vocabulary_database[target_lang]
+	for word_id in lang_vocab:
+		if lang_vocab[word_id].get("level", 1) <= level:
+			word_ids.append(word_id)
+	return word_ids
+
+
 ## Get vocabulary for current target language and level
 func get_vocabulary_for_level(target_lang: String, level: int) -> Array:
 	if not vocabulary_database.has(target_lang):
 		return []
 
 	var words: Array = []
-	var lang_vocab: Dictionary = vocabulary_database[target_lang]
-
-	for word_id in lang_vocab:
-		var word_data: Dictionary = lang_vocab[word_id]
-		if word_data.get("level", 1) <= level:
-			words.append({
-				"id": word_id,
-				"word": word_data.word,
-				"translation": word_data.translation,
-				"level": word_data.level,
-				"context": word_data.get("context", ""),
-				"part_of_speech": word_data.get("part_of_speech", "")
-			})
+	for word_id in _get_word_ids_for_level(target_lang, level):
+		words.append(_word_data(target_lang, word_id))
 
 	return words
 
 
+## Word dictionary as returned by get_vocabulary_for_level
+func _word_data(target_lang: String, word_id: String) -> Dictionary:
+	var word_entry: Dictionary = vocabulary_database[target_lang][word_id]
+	return {
+		"id": word_id,
+		"word": word_entry.word,
+		"translation": word_entry.translation,
+		"level": word_entry.level,
+		"context": word_entry.get("context", ""),
+		"part_of_speech": word_entry.get("part_of_speech", "")
+	}
+
+
 ## Inject vocabulary into a sentence (immersion mode)
-func inject_vocabulary(sentence: String, target_lang: String) -> Dictionary:
+## With node_id and text_lang the precomputed occurrence offsets are used to
+## replace a word in place; otherwise the whole line is replaced.
+func inject_vocabulary(sentence: String, target_lang: String, node_id: String = "", text_lang: String = "") -> Dictionary:
 	# Check if immersion is enabled
 	if not GameState.get_value("learning", "immersion_enabled", false):
 		return {"text": sentence, "injected": false}
@@ -121,16 +189,22 @@ func inject_vocabulary(sentence: String, target_lang: String) -> Dictionary:
 	# Get current level
 	var level: int = GameState.get_value("learning", "level_estimate", 5)
 
+	var mastered := {}
+	for word_id in GameState.get_value("learning", "mastered_words", []):
+		mastered[word_id] = true
+
+	if node_id != "" and injection_index.has(target_lang):
+		return _inject_in_place(sentence, target_lang, node_id, text_lang, level, mastered)
+
 	# Get available vocabulary
 	var available_words := get_vocabulary_for_level(target_lang, level)
 	if available_words.is_empty():
 		return {"text": sentence, "injected": false}
 
-	# Filter out mastered words
-	var mastered: Array = GameState.get_value("learning", "mastered_words", [])
+	# Filter out mastered words (hashed lookup instead of an Array scan per word)
 	var unmastered_words: Array = []
 	for word in available_words:
-		if word.id not in mastered:
+		if not mastered.has(word.id):
 			unmastered_words.append(word)
 
 	if unmastered_words.is_empty():
@@ -152,28 +226,80 @@ func inject_vocabulary(sentence: String, target_lang: String) -> Dictionary:
 	return result
 
 
-## Generate a quiz question
-func generate_quiz(target_lang: String) -> Dictionary:
-	var level: int = GameState.get_value("learning", "level_estimate", 5)
-	var available_words := get_vocabulary_for_level(target_lang, level)
+func _inject_in_place(sentence: String, target_lang: String, node_id: String, text_lang: String, level: int, mastered: Dictionary) -> Dictionary:
+	var entry: Dictionary = injection_index[target_lang].get(node_id, {}).get(text_lang, {})
+	if entry.is_empty():
+		return {"text": sentence, "injected": false}
 
-	if available_words.is_empty():
-		return {}
+	# Offsets only fit the compiled text: not an edited, formatted or BBCode'd line
+	if int(entry.get("length", -1)) != sentence.length() or entry.get("hash", "") != sentence.sha256_text().left(16):
+		push_warning("[VocabularyManager] %s (%s) differs from the compiled text; not injecting" % [node_id, text_lang])
+		return {"text": sentence, "injected": false}
 
-	# Pick a random word
-	var correct_word: Dictionary = available_words[randi() % available_words.size()]
+	var spans: Array = entry.spans
+	var lang_vocab: Dictionary = vocabulary_database.get(target_lang, {})
 
-	# Generate distractors (wrong answers)
-	var distractors: Array = []
-	var all_words := available_words.duplicate()
-	all_words.erase(correct_word)
+	var candidates: Array = []
+	for span in spans:
+		var word_id: String = span[0]
+		if mastered.has(word_id) or not lang_vocab.has(word_id):
+			continue
+		if lang_vocab[word_id].get("level", 1) <= level:
+			candidates.append(span)
 
-	for i in range(3):
-		if all_words.is_empty():
-			break
-		var distractor: Dictionary = all_words[randi() % all_words.size()]
-		distractors.append(distractor)
-		all_words.erase(distractor)
+	if candidates.is_empty():
+		return {"text": sentence, "injected": false}
+
+	var span: Array = candidates[randi() % candidates.size()]
+	var word_id: String = span[0]
+	var start := int(span[1])
+	var end := int(span[2])
+
+	var word_data := _word_data(target_lang, word_id)
+
+	var injected_text := "%s[color=yellow][url=%s]%s[/url][/color]%s" % [
+		sentence.substr(0, start),
+		word_id,
+		word_data.word,
+		sentence.substr(end)
+	]
+
+	vocabulary_injected.emit(word_data)
+	return {
+		"text": injected_text,
+		"injected": true,
+		"word_data": word_data,
+		"original_sentence": sentence
+	}
+
+
+## Generate a quiz question
+## With a compiled index this is constant time: the answer is picked by
+## position among the words at or below the level, and its distractors come
+## from the precomputed table
+func generate_quiz(target_lang: String) -> Dictionary:
+	if not vocabulary_database.has(target_lang):
+		return {}
+
+	var level: int = GameState.get_value("learning", "level_estimate", 5)
+	var correct_word: Dictionary
+	var distractors: Array
+
+	if vocabulary_index.has(target_lang):
+		var lang_index: Dictionary = vocabulary_index[target_lang]
+		var level_end: Array = lang_index.level_end
+		var end := int(level_end[clampi(level, 0, level_end.size() - 1)])
+		if end == 0:
+			return {}
+		correct_word = _word_data(target_lang, lang_index.word_ids[randi() % end])
+		# Fewer than 3 ranked candidates means fewer options, not a scan
+		distractors = _get_precomputed_distractors(target_lang, correct_word.id, 3)
+	else:
+		var available_words := get_vocabulary_for_level(target_lang, level)
+		if available_words.is_empty():
+			return {}
+		correct_word = available_words[randi() % available_words.size()]
+		distractors = _get_random_distractors(available_words, correct_word, 3)
 
 	# Create quiz question
 	current_quiz = {
@@ -197,6 +323,46 @@ func generate_quiz(target_lang: String) -> Dictionary:
 	return current_quiz
 
 
+## Random distractors, for languages without a compiled index
+func _get_random_distractors(available_words: Array, correct_word: Dictionary, count: int) -> Array:
+	var distractors: Array = []
+	var all_words := available_words.duplicate()
+	all_words.erase(correct_word)
+
+	for i in range(count):
+		if all_words.is_empty():
+			break
+		var distractor: Dictionary = all_words[randi() % all_words.size()]
+		distractors.append(distractor)
+		all_words.erase(distractor)
+
+	return distractors
+
+
+## Pick distractors from the ranked candidates built by tools/compile_vocab.py
+func _get_precomputed_distractors(target_lang: String, word_id: String, count: int) -> Array:
+	if not word_positions.has(target_lang) or not word_positions[target_lang].has(word_id):
+		return []
+
+	var lang_index: Dictionary = vocabulary_index[target_lang]
+	if not lang_index.has("distractors"):
+		return []
+
+	var candidates: Array = lang_index.distractors[word_positions[target_lang][word_id]].duplicate()
+	candidates.shuffle()
+
+	var lang_vocab: Dictionary = vocabulary_database[target_lang]
+	var distractors: Array = []
+	for position in candidates.slice(0, count):
+		var distractor_id: String = lang_index.word_ids[int(position)]
+		distractors.append({
+			"id": distractor_id,
+			"translation": lang_vocab[distractor_id].translation
+		})
+
+	return distractors
+
+
 ## Submit quiz answer
 func submit_quiz_answer(selected_index: int) -> bool:
 	if current_quiz.is_empty():
@@ -19,6 +19,14 @@ const SEAL_TYPES := [
 	"suppress"      # 压制不报 - Suppress/conceal
 ]
 
+## Stance deltas applied when sealing (also read by tools/simulate_endings.py)
+const SEAL_STANCE_EFFECTS := {
+	"routine": {},
+	"confidential": {"axis_truth": -5},
+	"imperial": {"axis_truth": 10},
+	"suppress": {"axis_truth": -15}
+}
+
 var current_chapter: int = 1
 var collected_evidence: Array = []
 
@@ -200,23 +208,12 @@ func _on_seal_pressed() -> void:
 
 
 func _apply_seal_stance_effects(seal_type: String) -> void:
-	# Different seal types affect stance differently
-	match seal_type:
-		"routine":
-			# Neutral - no major stance changes
-			pass
-		"confidential":
-			# Slightly favor suppressing truth
-			var current_truth: int = GameState.get_value("stance", "axis_truth", 0)
-			GameState.set_value("stance", "axis_truth", current_truth - 5)
-		"imperial":
-			# Favor allowing truth to reach emperor
-			var current_truth: int = GameState.get_value("stance", "axis_truth", 0)
-			GameState.set_value("stance", "axis_truth", current_truth + 10)
-		"suppress":
-			# Strongly suppress truth
-			var current_truth: int = GameState.get_value("stance", "axis_truth", 0)
-			GameState.set_value("stance", "axis_truth", current_truth - 15)
+	# Routine is neutral, confidential and suppress bury the truth,
+	# imperial lets it reach the emperor
+	var effects: Dictionary = SEAL_STANCE_EFFECTS.get(seal_type, {})
+	for axis in effects:
+		var current: int = GameState.get_value("stance", axis, 0)
+		GameState.set_value("stance", axis, clamp(current + effects[axis], -100, 100))
 
 
 func _on_back_pressed() -> void:
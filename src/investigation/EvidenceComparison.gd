@@ -1,6 +1,11 @@
 extends Control
 ## EvidenceComparison - Side-by-side document comparison with diff highlighting
 
+## Diff spans precomputed by tools/compile_evidence.py; they index the
+## document text in the same file, so documents are always shown from there
+const EVIDENCE_INDEX_PATH := "res://content/evidence/evidence_index.json"
+const HIGHLIGHT_COLOR := "#ffcccc"
+
 @onready var title_label := $Title
 @onready var left_title := $SplitContainer/LeftPanel/MarginContainer/VBoxContainer/LeftTitle
 @onready var left_source := $SplitContainer/LeftPanel/MarginContainer/VBoxContainer/LeftSource
@@ -20,10 +25,13 @@ var right_document := {}
 var sync_scrolling := true
 var differences_highlighted := false
 var contradictions_found := []
+var comparison_index := {}
+var document_index := {}
 
 
 func _ready() -> void:
 	_update_ui_text()
+	_load_evidence_index()
 	_load_comparison_data()
 
 	# Connect scroll signals
@@ -45,6 +53,28 @@ func _update_ui_text() -> void:
 	back_button.text = LanguageManager.tr("ui.confirm.cancel")
 
 
+func _load_evidence_index() -> void:
+	"""Load compiled documents by ID and precomputed comparisons, keyed by left and right document ID"""
+	if not ContentPack.file_exists(EVIDENCE_INDEX_PATH):
+		push_warning("[EvidenceComparison] Evidence index not found: %s" % EVIDENCE_INDEX_PATH)
+		return
+
+	var json_text := ContentPack.get_as_text(EVIDENCE_INDEX_PATH)
+	if json_text.is_empty():
+		push_error("[EvidenceComparison] Failed to open evidence index: %s" % EVIDENCE_INDEX_PATH)
+		return
+
+	var json := JSON.new()
+	var error := json.parse(json_text)
+
+	if error != OK:
+		push_error("[EvidenceComparison] JSON parse error: %s" % json.get_error_message())
+		return
+
+	document_index = json.data.get("documents", {})
+	comparison_index = json.data.get("comparisons", {})
+
+
 func _load_comparison_data() -> void:
 	"""Load documents to compare from GameState"""
 	if not GameState:
@@ -58,10 +88,10 @@ func _load_comparison_data() -> void:
 		_load_placeholder_data()
 		return
 
-	# Load most recent comparison
+	# Load most recent comparison; saved copies may predate the compiled text
 	var comparison := compare_history[-1]
-	left_document = comparison.get("left", {})
-	right_document = comparison.get("right", {})
+	left_document = _compiled_document(comparison.get("left", {}))
+	right_document = _compiled_document(comparison.get("right", {}))
 
 	_display_documents()
 
@@ -94,9 +124,16 @@ func _load_placeholder_data() -> void:
 		"keywords": ["decree", "four", "candidates"]
 	}
 
+	left_document = _compiled_document(left_document)
+	right_document = _compiled_document(right_document)
 	_display_documents()
 
 
+func _compiled_document(document: Dictionary) -> Dictionary:
+	"""The evidence index's copy of a document, which the compiled spans were computed on"""
+	return document_index.get(document.get("id", ""), document)
+
+
 func _display_documents() -> void:
 	"""Display the documents in the comparison view"""
 	var lang := LanguageManager.current_language if LanguageManager else "english"
@@ -145,38 +182,64 @@ func _on_highlight_pressed() -> void:
 
 
 func _highlight_differences() -> void:
-	"""Highlight differences between documents"""
+	"""Highlight differences between documents using the precomputed spans"""
 	print("[EvidenceComparison] Highlighting differences...")
 
-	# Simple keyword-based highlighting
-	var left_keywords := left_document.get("keywords", [])
-	var right_keywords := right_document.get("keywords", [])
+	var left_id: String = left_document.get("id", "")
+	var right_id: String = right_document.get("id", "")
+	var lang := LanguageManager.current_language if LanguageManager else "english"
 
-	# Find unique keywords
-	var left_unique := []
-	var right_unique := []
+	var left_content := _document_text(left_document, lang)
+	var right_content := _document_text(right_document, lang)
+	var left_spans := []
+	var right_spans := []
+	if comparison_index.has("%s|%s" % [left_id, right_id]):
+		var spans: Dictionary = comparison_index["%s|%s" % [left_id, right_id]].spans.get(lang, {})
+		left_spans = _checked_spans(spans, "left", left_id, left_content)
+		right_spans = _checked_spans(spans, "right", right_id, right_content)
+	elif comparison_index.has("%s|%s" % [right_id, left_id]):
+		# Compiled the other way round: swap sides
+		var spans: Dictionary = comparison_index["%s|%s" % [right_id, left_id]].spans.get(lang, {})
+		left_spans = _checked_spans(spans, "right", left_id, left_content)
+		right_spans = _checked_spans(spans, "left", right_id, right_content)
+	else:
+		push_warning("[EvidenceComparison] No compiled comparison for %s / %s" % [left_id, right_id])
 
-	for keyword in left_keywords:
-		if keyword not in right_keywords:
-			left_unique.append(keyword)
+	left_text.text = _apply_spans(left_content, left_spans)
+	right_text.text = _apply_spans(right_content, right_spans)
 
-	for keyword in right_keywords:
-		if keyword not in left_keywords:
-			right_unique.append(keyword)
+	print("  Found differences: Left=%d, Right=%d" % [left_spans.size(), right_spans.size()])
 
-	# Highlight in left document
-	var left_content := left_text.text
-	for keyword in left_unique:
-		left_content = left_content.replace(keyword, "[bgcolor=#ffcccc]%s[/bgcolor]" % keyword)
-	left_text.text = left_content
 
-	# Highlight in right document
-	var right_content := right_text.text
-	for keyword in right_unique:
-		right_content = right_content.replace(keyword, "[bgcolor=#ffcccc]%s[/bgcolor]" % keyword)
-	right_text.text = right_content
+func _checked_spans(spans: Dictionary, side: String, document_id: String, content: String) -> Array:
+	"""One side's spans, or none if they were compiled for text of another length"""
+	if spans.is_empty():
+		return []
+	if int(spans.get(side + "_length", -1)) != content.length():
+		push_warning("[EvidenceComparison] %s text differs from the compiled comparison; not highlighting it" % document_id)
+		return []
+	return spans.get(side, [])
+
+
+func _document_text(document: Dictionary, lang: String) -> String:
+	var text_data: Dictionary = document.get("text", {})
+	return text_data.get(lang, text_data.get("english", "No content"))
+
+
+func _apply_spans(content: String, spans: Array) -> String:
+	"""Wrap [start, end) character ranges in highlight tags, escaping BBCode in the text"""
+	var parts := PackedStringArray()
+	var position := 0
+
+	for span in spans:
+		var start := int(span[0])
+		var end := int(span[1])
+		parts.append(content.substr(position, start - position).replace("[", "[lb]"))
+		parts.append("[bgcolor=%s]%s[/bgcolor]" % [HIGHLIGHT_COLOR, content.substr(start, end - start).replace("[", "[lb]")])
+		position = end
 
-	print("  Found differences: Left=%d, Right=%d" % [left_unique.size(), right_unique.size()])
+	parts.append(content.substr(position).replace("[", "[lb]"))
+	return "".join(parts)
 
 
 func _clear_highlights() -> void:
@@ -258,8 +321,8 @@ func _on_language_changed(_lang_code: String) -> void:
 ## Public API for loading specific documents
 func load_documents(left_doc: Dictionary, right_doc: Dictionary) -> void:
 	"""Load specific documents for comparison"""
-	left_document = left_doc
-	right_document = right_doc
+	left_document = _compiled_document(left_doc)
+	right_document = _compiled_document(right_doc)
 	_display_documents()
 
 
@@ -1,6 +1,11 @@
 extends Control
 ## Interrogation - Structured questioning system for investigation
 
+## Compiled by tools/compile_interrogations.py
+const INTERROGATION_DIR := "res://content/interrogation/"
+const INTERROGATION_INDEX_PATH := "res://content/interrogation/interrogation_index.json"
+const DEFAULT_INTERROGATION := "INT_001"
+
 @onready var title_label := $Title
 @onready var subject_label := $SubjectPanel/MarginContainer/VBoxContainer/SubjectLabel
 @onready var context_label := $SubjectPanel/MarginContainer/VBoxContainer/ContextLabel
@@ -11,11 +16,14 @@ extends Control
 @onready var continue_button := $ControlPanel/ContinueButton
 @onready var back_button := $ControlPanel/BackButton
 
+var interrogation_id := ""
 var current_subject := ""
 var current_context := ""
 var available_questions := []
 var asked_questions := []
 var current_response := ""
+var question_index := {}  # question ID -> position in available_questions
+var unlocked_questions := {}  # question ID -> true
 
 
 func _ready() -> void:
@@ -39,24 +47,35 @@ func _update_ui_text() -> void:
 
 func _load_interrogation_data() -> void:
 	"""Load interrogation scenario"""
-	if not GameState:
-		_load_placeholder_data()
-		return
+	var target_id := DEFAULT_INTERROGATION
 
-	# Get interrogation log from GameState
-	var interrogate_log: Array = GameState.get_value("evidence", "interrogate_log", [])
+	# Resume the most recent interrogation
+	if GameState:
+		var interrogate_log: Array = GameState.get_value("evidence", "interrogate_log", [])
+		if not interrogate_log.is_empty():
+			target_id = interrogate_log[-1].get("interrogation_id", DEFAULT_INTERROGATION)
 
-	if interrogate_log.is_empty():
+	if not load_compiled_interrogation(target_id):
 		_load_placeholder_data()
-		return
 
-	# Load most recent interrogation
-	var interrogation := interrogate_log[-1]
-	current_subject = interrogation.get("subject", "Unknown")
-	current_context = interrogation.get("context", "")
-	available_questions = interrogation.get("questions", [])
 
-	_display_interrogation()
+func _read_json(path: String) -> Variant:
+	if not ContentPack.file_exists(path):
+		return null
+
+	var json_text := ContentPack.get_as_text(path)
+	if json_text.is_empty():
+		push_error("[Interrogation] Failed to open: %s" % path)
+		return null
+
+	var json := JSON.new()
+	var error := json.parse(json_text)
+
+	if error != OK:
+		push_error("[Interrogation] JSON parse error in %s: %s" % [path, json.get_error_message()])
+		return null
+
+	return json.data
 
 
 func _load_placeholder_data() -> void:
@@ -110,6 +129,8 @@ func _load_placeholder_data() -> void:
 		}
 	]
 
+	_index_questions()
+
 	_display_interrogation()
 
 
@@ -138,7 +159,7 @@ func _populate_questions() -> void:
 			continue
 
 		# Skip if locked
-		if question.get("locked", false):
+		if not unlocked_questions.has(question_id):
 			continue
 
 		# Create question button
@@ -182,6 +203,7 @@ func _on_question_selected(question: Dictionary) -> void:
 	if GameState:
 		var interrogate_log: Array = GameState.get_value("evidence", "interrogate_log", [])
 		interrogate_log.append({
+			"interrogation_id": interrogation_id,
 			"subject": current_subject,
 			"question_id": question_id,
 			"response": current_response,
@@ -209,27 +231,40 @@ func _apply_stance_changes(stance_change: Dictionary) -> void:
 		var new_truth := current_truth + stance_change["axis_truth"]
 		GameState.set_value("stance", "axis_truth", clamp(new_truth, -100, 100))
 
-	# Apply loyalty changes
-	if stance_change.has("axis_loyalty"):
-		var loyalty_changes: Dictionary = stance_change["axis_loyalty"]
-		var current_loyalty := GameState.get_value("stance", "axis_loyalty", {})
+	# Apply per-POV loyalty and blame changes
+	for axis in ["axis_loyalty", "axis_blame"]:
+		if not stance_change.has(axis):
+			continue
+		var pov_changes: Dictionary = stance_change[axis]
+		var current_values := GameState.get_value("stance", axis, {})
 
-		for pov in loyalty_changes.keys():
-			var current := current_loyalty.get(pov, 0)
-			var change := loyalty_changes[pov]
-			current_loyalty[pov] = clamp(current + change, -100, 100)
+		for pov in pov_changes.keys():
+			var current := current_values.get(pov, 0)
+			var change := pov_changes[pov]
+			current_values[pov] = clamp(current + change, -100, 100)
 
-		GameState.set_value("stance", "axis_loyalty", current_loyalty)
+		GameState.set_value("stance", axis, current_values)
 
 	print("[Interrogation] Stance updated: %s" % stance_change)
 
 
-func _unlock_questions(unlock_ids: Array) -> void:
-	"""Unlock new questions"""
-	for question in available_questions:
-		if question.get("id", "") in unlock_ids:
-			question["locked"] = false
-			print("[Interrogation] Unlocked question: %s" % question["id"])
+func _unlock_questions(unlocks: Array) -> void:
+	"""Unlock new questions (compiled files list positions, placeholder data lists IDs)"""
+	for target in unlocks:
+		var unlock_id: String = target if target is String else available_questions[int(target)].id
+		if not unlocked_questions.has(unlock_id):
+			unlocked_questions[unlock_id] = true
+			print("[Interrogation] Unlocked question: %s" % unlock_id)
+
+
+func _index_questions() -> void:
+	"""Index uncompiled questions; those not marked locked start unlocked"""
+	question_index.clear()
+	unlocked_questions.clear()
+	for i in available_questions.size():
+		question_index[available_questions[i].id] = i
+		if not available_questions[i].get("locked", false):
+			unlocked_questions[available_questions[i].id] = true
 
 
 func _on_continue_pressed() -> void:
@@ -258,8 +293,45 @@ func _on_language_changed(_lang_code: String) -> void:
 ## Public API
 func load_interrogation(subject: String, context: String, questions: Array) -> void:
 	"""Load specific interrogation scenario"""
+	interrogation_id = ""
 	current_subject = subject
 	current_context = context
 	available_questions = questions
 	asked_questions.clear()
+	_index_questions()
+	_display_interrogation()
+
+
+func load_compiled_interrogation(target_id: String) -> bool:
+	"""Load a compiled interrogation and restore progress from the interrogate log"""
+	var index = _read_json(INTERROGATION_INDEX_PATH)
+	if index == null or not index.get("interrogations", {}).has(target_id):
+		push_warning("[Interrogation] No compiled interrogation: %s" % target_id)
+		return false
+
+	var data = _read_json(INTERROGATION_DIR + index.interrogations[target_id].file)
+	if data == null:
+		return false
+
+	interrogation_id = target_id
+	current_subject = data.subject
+	current_context = data.context
+	available_questions = data.questions
+	asked_questions.clear()
+
+	question_index.clear()
+	for q_id in data.question_index:
+		question_index[q_id] = int(data.question_index[q_id])
+
+	unlocked_questions.clear()
+	for position in data.initial:
+		unlocked_questions[available_questions[int(position)].id] = true
+
+	if GameState:
+		for entry in GameState.get_value("evidence", "interrogate_log", []):
+			if entry.get("interrogation_id", "") == target_id and question_index.has(entry.question_id):
+				asked_questions.append(entry.question_id)
+				_unlock_questions(available_questions[question_index[entry.question_id]].get("unlocks", []))
+
 	_display_interrogation()
+	return true
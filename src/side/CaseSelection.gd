@@ -28,16 +28,13 @@ func _load_cases() -> void:
 	# Load all case files
 	for i in range(1, 4):  # 3 cases
 		var case_path := "res://content/side/case_%d.json" % i
-		if not FileAccess.file_exists(case_path):
+		if not ContentPack.file_exists(case_path):
 			continue
 
-		var file := FileAccess.open(case_path, FileAccess.READ)
-		if file == null:
+		var json_text := ContentPack.get_as_text(case_path)
+		if json_text.is_empty():
 			continue
 
-		var json_text := file.get_as_text()
-		file.close()
-
 		var json := JSON.new()
 		if json.parse(json_text) == OK:
 			cases.append(json.data)
@@ -2,6 +2,8 @@ extends Control
 ## TurtleSoup - Lateral thinking puzzle game (海龟汤)
 ## Players ask yes/no questions to solve mysteries
 
+const SHARE_CODE_VERSION := 1
+
 @onready var title_label: Label = $Panel/MarginContainer/VBoxContainer/TitleLabel
 @onready var difficulty_label: Label = $Panel/MarginContainer/VBoxContainer/DifficultyLabel
 @onready var scenario_text: RichTextLabel = $Panel/MarginContainer/VBoxContainer/ScenarioPanel/ScenarioText
@@ -13,9 +15,10 @@ extends Control
 @onready var status_label: Label = $Panel/MarginContainer/VBoxContainer/StatusLabel
 
 var current_case: Dictionary = {}
-var available_questions: Array = []
+var available_questions: Array = []  # Questions shown in question_list, same order
 var asked_questions: Array = []
-var unlocked_question_ids: Array = []
+var unlocked_questions := {}  # Question ID (or "SOLUTION") -> true
+var question_index := {}  # Question ID -> position in current_case.questions
 var hints_used: int = 0
 var turn_count: int = 0
 var case_solved: bool = false
@@ -44,18 +47,15 @@ func _load_case() -> void:
 
 	# Load case data
 	var case_path := "res://content/side/case_%s.json" % case_id.substr(5, 1)
-	if not FileAccess.file_exists(case_path):
+	if not ContentPack.file_exists(case_path):
 		push_error("[TurtleSoup] Case file not found: %s" % case_path)
 		return
 
-	var file := FileAccess.open(case_path, FileAccess.READ)
-	if file == null:
+	var json_text := ContentPack.get_as_text(case_path)
+	if json_text.is_empty():
 		push_error("[TurtleSoup] Failed to open case file: %s" % case_path)
 		return
 
-	var json_text := file.get_as_text()
-	file.close()
-
 	var json := JSON.new()
 	var error := json.parse(json_text)
 
@@ -64,6 +64,7 @@ func _load_case() -> void:
 		return
 
 	current_case = json.data
+	_load_case_graph()
 
 	# Initialize state
 	turn_count = GameState.get_value("side", "turn", 0)
@@ -71,24 +72,48 @@ func _load_case() -> void:
 	hints_used = GameState.get_value("side", "hints_used", 0)
 	case_solved = GameState.get_value("side", "state", "init") == "solved"
 
-	# Start with first questions unlocked
-	if unlocked_question_ids.is_empty():
-		_unlock_initial_questions()
+	# Start with first questions unlocked, plus whatever was unlocked before
+	_unlock_initial_questions()
+	for q_id in asked_questions:
+		var question := _find_question_by_id(q_id)
+		for unlock_id in question.get("unlocks", []):
+			unlocked_questions[unlock_id] = true
 
+	_rebuild_question_list()
 	_update_ui()
 
 
+## Question lookup table precomputed by tools/compile_content.py
+func _load_case_graph() -> void:
+	question_index.clear()
+	var graph: Dictionary = current_case.get("graph", {})
+
+	if graph.has("question_index"):
+		for q_id in graph.question_index:
+			question_index[q_id] = int(graph.question_index[q_id])
+	else:
+		# Uncompiled case: build the table once
+		for i in current_case.questions.size():
+			question_index[current_case.questions[i].id] = i
+
+
 func _unlock_initial_questions() -> void:
-	# Unlock questions that have no prerequisites (first questions)
+	unlocked_questions.clear()
+	var graph: Dictionary = current_case.get("graph", {})
+
+	if graph.has("initial"):
+		for position in graph.initial:
+			unlocked_questions[current_case.questions[int(position)].id] = true
+		return
+
+	# Uncompiled case: questions no other question unlocks
+	var targets := {}
 	for question in current_case.questions:
-		var is_initial := true
-		# Check if this question is unlocked by any other question
-		for other_q in current_case.questions:
-			if question.id in other_q.get("unlocks", []):
-				is_initial = false
-				break
-		if is_initial and question.id not in unlocked_question_ids:
-			unlocked_question_ids.append(question.id)
+		for unlock_id in question.get("unlocks", []):
+			targets[unlock_id] = true
+	for question in current_case.questions:
+		if not targets.has(question.id):
+			unlocked_questions[question.id] = true
 
 
 func _update_ui() -> void:
@@ -107,9 +132,6 @@ func _update_ui() -> void:
 	scenario_text.clear()
 	scenario_text.append_text(current_case.scenario.get(lang, current_case.scenario.english))
 
-	# Update question list
-	_refresh_question_list()
-
 	# Update history
 	_refresh_history()
 
@@ -133,24 +155,25 @@ func _update_ui() -> void:
 		status_label.text = LanguageManager.get_text("side.status_turn") % turn_count
 
 
-func _refresh_question_list() -> void:
+## Fill the question list from scratch (on load only; asking a question
+## updates it in place)
+func _rebuild_question_list() -> void:
 	question_list.clear()
 	available_questions.clear()
 
-	var lang := GameState.get_value("settings", "lang_primary", "english")
+	var asked := {}
+	for q_id in asked_questions:
+		asked[q_id] = true
 
 	for question in current_case.questions:
-		var q_id: String = question.id
-		# Skip already asked questions
-		if q_id in asked_questions:
-			continue
-		# Only show unlocked questions
-		if q_id not in unlocked_question_ids:
-			continue
+		if unlocked_questions.has(question.id) and not asked.has(question.id):
+			_add_available_question(question)
 
-		available_questions.append(question)
-		var q_text: String = question.text.get(lang, question.text.english)
-		question_list.add_item(q_text)
+
+func _add_available_question(question: Dictionary) -> void:
+	var lang := GameState.get_value("settings", "lang_primary", "english")
+	available_questions.append(question)
+	question_list.add_item(question.text.get(lang, question.text.english))
 
 
 func _refresh_history() -> void:
@@ -201,15 +224,14 @@ func _refresh_history() -> void:
 
 
 func _find_question_by_id(q_id: String) -> Dictionary:
-	for question in current_case.questions:
-		if question.id == q_id:
-			return question
-	return {}
+	if not question_index.has(q_id):
+		return {}
+	return current_case.questions[question_index[q_id]]
 
 
 func _can_attempt_solution() -> bool:
 	# Player can attempt solution if they've unlocked the SOLUTION marker
-	return "SOLUTION" in unlocked_question_ids and not case_solved
+	return unlocked_questions.has("SOLUTION") and not case_solved
 
 
 func _on_question_activated(index: int) -> void:
@@ -222,11 +244,17 @@ func _on_question_activated(index: int) -> void:
 	# Mark as asked
 	asked_questions.append(q_id)
 	turn_count += 1
+	available_questions.remove_at(index)
+	question_list.remove_item(index)
 
 	# Unlock next questions
 	for unlock_id in question.get("unlocks", []):
-		if unlock_id not in unlocked_question_ids:
-			unlocked_question_ids.append(unlock_id)
+		if unlocked_questions.has(unlock_id):
+			continue
+		unlocked_questions[unlock_id] = true
+		var unlocked := _find_question_by_id(unlock_id)
+		if not unlocked.is_empty():
+			_add_available_question(unlocked)
 
 	# Save state
 	GameState.set_value("side", "asked_questions", asked_questions)
@@ -279,7 +307,7 @@ func _on_solve_pressed() -> void:
 	GameState.set_value("side", "state", "solved")
 	GameState.set_value("side", "result", "success")
 
-	# Generate share code
+	# Generate share code (empty if the replay cannot be packed)
 	var share_code := _generate_share_code()
 	var replay_data := GameState.get_value("side", "replay", {})
 	replay_data["share_code"] = share_code
@@ -287,30 +315,72 @@ func _on_solve_pressed() -> void:
 
 	# Update flags
 	var case_num := int(current_case.case_id.substr(5, 1))
-	var flags: Dictionary = GameState.get_value("flags", "achievements_unlocked", [])
-	var achievement_id := "SIDE_CASE_%d" % case_num
-	if achievement_id not in flags:
-		flags.append(achievement_id)
-		GameState.set_value("flags", "achievements_unlocked", flags)
+	SteamManager.unlock_achievement("SIDE_CASE_%d" % case_num)
 
 	_update_ui()
 
 	# Show share code dialog
-	_show_share_code_dialog(share_code)
+	if not share_code.is_empty():
+		_show_share_code_dialog(share_code)
 
 
+## Compact, versioned share code (format documented in tools/share_code.py)
+## Empty when an ID is not CASE_<digits> / Q<digits>, like ShareCodeError there
 func _generate_share_code() -> String:
-	# Generate base64 encoded replay data
-	var replay_data := {
-		"case_id": current_case.case_id,
-		"turns": turn_count,
-		"hints": hints_used,
-		"events": GameState.get_value("side", "replay", {}).get("events", [])
-	}
-
-	var json_str := JSON.stringify(replay_data)
-	var bytes := json_str.to_utf8_buffer()
-	return Marshalls.raw_to_base64(bytes)
+	var case_number := _id_number(current_case.case_id, "CASE_")
+	if case_number < 0:
+		push_error("[TurtleSoup] Cannot pack case ID '%s' into a share code" % current_case.case_id)
+		return ""
+
+	var body := PackedByteArray()
+	_write_varint(body, case_number)
+	_write_varint(body, turn_count)
+	_write_varint(body, hints_used)
+
+	var events: Array = GameState.get_value("side", "replay", {}).get("events", [])
+	_write_varint(body, events.size())
+
+	var previous_turn := 0
+	for event in events:
+		if event.type == "question":
+			var question_number := _id_number(event.question_id, "Q")
+			if question_number < 0:
+				push_error("[TurtleSoup] Cannot pack question ID '%s' into a share code" % event.question_id)
+				return ""
+			_write_varint(body, question_number << 1)
+		else:
+			_write_varint(body, int(event.hint_index) << 1 | 1)
+		_write_varint(body, int(event.turn) - previous_turn)
+		previous_turn = int(event.turn)
+
+	# Header byte: format version << 1 | compressed flag
+	var payload := PackedByteArray([SHARE_CODE_VERSION << 1])
+	var compressed := body.compress(FileAccess.COMPRESSION_DEFLATE)
+	if compressed.size() < body.size():
+		payload[0] |= 1
+		payload.append_array(compressed)
+	else:
+		payload.append_array(body)
+
+	return Marshalls.raw_to_base64(payload).replace("+", "-").replace("/", "_").replace("=", "")
+
+
+## The number in <prefix><digits>, or -1 for any other ID
+func _id_number(id: String, prefix: String) -> int:
+	if not id.begins_with(prefix):
+		return -1
+	var digits := id.trim_prefix(prefix)
+	if not digits.is_valid_int() or not digits[0].is_valid_int():
+		return -1
+	return digits.to_int()
+
+
+## Unsigned LEB128
+func _write_varint(out: PackedByteArray, value: int) -> void:
+	while value >= 0x80:
+		out.append((value & 0x7F) | 0x80)
+		value >>= 7
+	out.append(value)
 
 
 func _show_share_code_dialog(share_code: String) -> void:
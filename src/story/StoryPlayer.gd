@@ -92,26 +92,25 @@ func _load_chapter_data(chapter: int) -> void:
 	# Load chapter story data from content directory
 	var chapter_path := "res://content/main/chapter_%d.json" % chapter
 
-	if not FileAccess.file_exists(chapter_path):
+	if not ContentPack.file_exists(chapter_path):
 		push_warning("[StoryPlayer] Chapter data not found: %s" % chapter_path)
 		# Use placeholder data
 		story_data = _get_placeholder_story_data(chapter)
 		return
 
-	var file := FileAccess.open(chapter_path, FileAccess.READ)
-	if not file:
+	var json_text := ContentPack.get_as_text(chapter_path)
+	if json_text.is_empty():
 		push_error("[StoryPlayer] Failed to open chapter data")
 		story_data = _get_placeholder_story_data(chapter)
 		return
 
 	var json := JSON.new()
-	if json.parse(file.get_as_text()) != OK:
+	if json.parse(json_text) != OK:
 		push_error("[StoryPlayer] Failed to parse chapter data")
 		story_data = _get_placeholder_story_data(chapter)
 		return
 
 	story_data = json.data
-	file.close()
 
 
 func _get_placeholder_story_data(chapter: int) -> Dictionary:
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+Toolchain Benchmark
+Generates synthetic corpora at multiples of the current content size, times
+the compiler, validators, content export and placeholder generator against
+them, and records wall time, peak RSS and per-phase breakdowns to a history
+that later runs are compared with
+"""
+
+import functools
+import importlib
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+import json_io
+from json_io import JSONDecodeError, read_json, write_json
+
+PROJECT_ROOT = Path(__file__).parent.parent
+TOOLS_DIR = PROJECT_ROOT / "tools"
+HISTORY_PATH = PROJECT_ROOT / "tools" / "logs" / "benchmark_history.json"
+LANGUAGE_REGISTRY_PATH = PROJECT_ROOT / "locales" / "_meta" / "language_registry.json"
+
+# 1x corpus: the shipped chapter layout and registry languages, with the
+# vocabulary and save counts a release is expected to carry
+BASE_CORPUS = {
+    "chapters": 7,
+    "nodes_per_chapter": 13,
+    "vocab_languages": 4,
+    "words_per_language": 50,
+    "ui_keys": 127,
+    "saves": 20,
+}
+DEFAULT_SCALES = [1, 10, 100]
+
+# Copied into each workspace so the tools resolve PROJECT_ROOT there
+WORKSPACE_FILES = [
+    "tools/*.py",
+    "src/core/GameState.gd",
+    "project.godot",
+    "locales/_meta/*.json",
+    "content/side/srs_config.json",
+    "content/side/vocab*.json",
+]
+
+# Regression: slower (or larger) than the recent median by this fraction...
+DEFAULT_THRESHOLD = 0.25
+# ...and by at least this much, so sub-noise timings never fail a run
+MIN_REGRESSION_SECONDS = 0.05
+MIN_REGRESSION_BYTES = 8 * 1024 * 1024
+# Baseline = median of this many previous runs at the same scale
+BASELINE_RUNS = 5
+
+# Scripts without word spaces, and the code points synthetic words use
+UNSPACED_SCRIPTS = {"Hans", "Hant", "Jpan", "Thai"}
+SCRIPT_RANGES = {
+    "Hans": (0x4E00, 0x9FA5),
+    "Hant": (0x4E00, 0x9FA5),
+    "Jpan": (0x3041, 0x3096),
+    "Kore": (0xAC00, 0xD7A3),
+    "Cyrl": (0x0430, 0x044F),
+    "Grek": (0x03B1, 0x03C9),
+    "Arab": (0x0627, 0x064A),
+    "Hebr": (0x05D0, 0x05EA),
+    "Thai": (0x0E01, 0x0E2E),
+}
+LATIN_RANGE = (0x61, 0x7A)
+
+
+def _entry_save_tool(module):
+    tool = module.SaveTool(PROJECT_ROOT / "saves", jobs=1)
+    tool.analyze()
+    tool.print_report()
+
+
+def _entry_filter_content(module):
+    module.filter_content(module.FULL_CONFIG, PROJECT_ROOT / "export" / "full")
+
+
+# (name, module, entry, timed phases, scales with the corpus)
+# entry is "Class.method", "function" or a callable taking the module;
+# phases are "Class.method" or "function" names in that module
+TARGETS = [
+    ("compile_content", "compile_content", "ContentCompiler.compile_all", [
+        "ContentCompiler.compile_main_story", "ContentCompiler.compile_scenes",
+        "ContentCompiler.strip_dead_content", "ContentCompiler.write_player_index",
+        "ContentCompiler.update_node_table", "ContentCompiler.build_injection_index",
+        "ContentCompiler.compile_side_stories", "ContentCompiler.generate_manifest",
+    ], True),
+    ("compile_vocab", "compile_vocab", "VocabCompiler.compile_all", [
+        "VocabCompiler.compile_database", "build_level_index", "build_distractor_table",
+        "VocabCompiler.compile_side_vocab",
+    ], True),
+    ("validate_content", "validate_content", "main", [
+        "check_manifest", "check_chapters", "check_side_stories", "check_node_links",
+    ], True),
+    ("validate_locales", "validate_locales", "main", [
+        "check_registry", "check_locale_files", "check_translation_keys",
+        "check_rtl_languages", "check_fallback_rules",
+    ], True),
+    ("compile_locales", "compile_locales", "LocaleCompiler.compile_all", [
+        "LocaleCompiler.flatten_language", "LocaleCompiler.update_key_table", "LocaleCompiler.write_tables",
+    ], True),
+    ("save_tool analyze", "save_tool", _entry_save_tool, [
+        "SaveTool.collect_saves", "SaveTool.run", "SaveTool.print_report",
+    ], True),
+    ("filter_content", "export_demo_full", _entry_filter_content, [
+        "collect_entries", "write_pack",
+    ], True),
+    # Fixed asset list: independent of corpus size, so timed once
+    ("placeholders", "generate_placeholders", "PlaceholderGenerator.generate_all", [
+        "PlaceholderGenerator.create_background", "PlaceholderGenerator.create_character_sprite",
+        "PlaceholderGenerator.create_ui_element",
+    ], False),
+]
+
+
+def synthetic_word(rng: random.Random, script: str) -> str:
+    low, high = SCRIPT_RANGES.get(script, LATIN_RANGE)
+    length = rng.randint(1, 3) if script in ("Hans", "Hant") else rng.randint(3, 8)
+    return "".join(chr(rng.randint(low, high)) for _ in range(length))
+
+
+def synthetic_sentence(rng: random.Random, script: str, words: List[str]) -> str:
+    """About a dozen words, some drawn from the vocabulary so injection has matches"""
+    parts = [rng.choice(words) if words and rng.random() < 0.2 else synthetic_word(rng, script)
+             for _ in range(rng.randint(8, 16))]
+    return ("" if script in UNSPACED_SCRIPTS else " ").join(parts) + "."
+
+
+def generate_corpus(root: Path, scale: int, seed: int = 14) -> Dict[str, int]:
+    """Write scene sources, vocabulary, locales and saves for one scale under root"""
+    rng = random.Random(seed)
+    registry = read_json(LANGUAGE_REGISTRY_PATH)["languages"]
+    scripts = {lang: info.get("script", "Latn") for lang, info in registry.items()}
+
+    chapters = BASE_CORPUS["chapters"]
+    nodes_per_chapter = BASE_CORPUS["nodes_per_chapter"] * scale
+    words_per_language = BASE_CORPUS["words_per_language"] * scale
+
+    # Vocabulary: IDs are unique across languages, as compile_vocab requires
+    vocab_languages = [lang for lang, info in registry.items() if info.get("is_modern")][:BASE_CORPUS["vocab_languages"]]
+    database = {}
+    words = {}
+    for lang in vocab_languages:
+        entries = {}
+        for i in range(words_per_language):
+            word = synthetic_word(rng, scripts[lang])
+            translation = synthetic_word(rng, "Latn")
+            entries[f"{lang}_{i:06d}"] = {
+                "word": word,
+                "translation": translation,
+                "level": rng.randint(1, 12),
+                "context": synthetic_sentence(rng, scripts[lang], [word]),
+                "part_of_speech": rng.choice(["noun", "verb", "adjective"])
+            }
+        database[lang] = entries
+        words[lang] = [entry["word"] for entry in entries.values()]
+    words["english"] = [entry["translation"] for lang in vocab_languages for entry in database[lang].values()]
+
+    vocab_dir = root / "content" / "vocabulary"
+    vocab_dir.mkdir(parents=True, exist_ok=True)
+    write_json(vocab_dir / "vocab_database.json", database, indent=2)
+
+    # Scenes: one file per chapter, a choice every tenth node
+    story_dir = root / "content" / "story"
+    story_dir.mkdir(parents=True, exist_ok=True)
+    scenes = []
+    node_ids = []
+    for chapter in range(1, chapters + 1):
+        ids = [f"CH{chapter}_START"] + [f"CH{chapter}_{i:05d}" for i in range(1, nodes_per_chapter)]
+        node_ids.extend(ids)
+        following = f"CH{chapter + 1}_START" if chapter < chapters else "ENDING"
+        lines = [f"# Chapter {chapter}", f"@chapter {chapter}", "@pov emperor", "@speaker narrator", ""]
+
+        for position, node_id in enumerate(ids):
+            lines.append(f"## {node_id}")
+            for lang, script in scripts.items():
+                lines.append(f"{lang}: {synthetic_sentence(rng, script, words.get(lang, []))}")
+            if position % 10 == 9 and position + 2 < len(ids):
+                for target in (ids[position + 1], ids[position + 2]):
+                    lines.append(f"* -> {target}")
+                    lines.append(f"  english: {synthetic_sentence(rng, 'Latn', words['english'])}")
+                    lines.append("  @effect stance.axis_truth +1")
+            elif position == len(ids) - 1:
+                lines.append(f"-> {following}")
+            lines.append("")
+
+        scene_file = story_dir / f"chapter_{chapter}.md"
+        scene_file.write_text("\n".join(lines), encoding='utf-8')
+        scenes.append({"sceneId": f"BENCH_CH{chapter}", "file": f"content/story/{scene_file.name}"})
+
+    write_json(root / "content" / "story_index.json", {"version": "1.0", "scenes": scenes}, indent=2)
+
+    # Locales: every registry language complete, so validation walks them all
+    ui_keys = [f"bench.key_{i:05d}" for i in range(BASE_CORPUS["ui_keys"] * scale)]
+    for lang, script in scripts.items():
+        locale_dir = root / "locales" / lang
+        locale_dir.mkdir(parents=True, exist_ok=True)
+        write_json(locale_dir / "ui.json", {key: synthetic_word(rng, script) for key in ui_keys}, indent=2)
+
+    # Saves: batches of 100, as QA report directories are laid out
+    schema_version = int(importlib.import_module("save_tool").read_schema_version())
+    domains = importlib.import_module("save_tool").DOMAINS
+    save_count = BASE_CORPUS["saves"] * scale
+    for i in range(save_count):
+        batch_dir = root / "saves" / f"batch_{i // 100:03d}"
+        batch_dir.mkdir(parents=True, exist_ok=True)
+        data = {domain: {} for domain in domains}
+        seen = rng.sample(node_ids, rng.randint(1, min(len(node_ids), nodes_per_chapter * 3)))
+        data["meta"] = {"playtime_seconds": rng.randint(60, 36000), "created_at": "", "updated_at": ""}
+        data["main"] = {"chapter": rng.randint(1, chapters), "seen_nodes": seen}
+        data["version"] = {"schema_version": schema_version}
+        write_json(batch_dir / f"save_{i % 100 + 1:03d}.json", data, indent="\t")
+
+    return {
+        "nodes": len(node_ids),
+        "languages": len(scripts),
+        "vocab_words": words_per_language * len(vocab_languages),
+        "ui_keys": len(ui_keys),
+        "saves": save_count,
+    }
+
+
+def build_workspace(root: Path, scale: int) -> Dict[str, int]:
+    project = root / "project"
+    for pattern in WORKSPACE_FILES:
+        for path in PROJECT_ROOT.glob(pattern):
+            target = project / path.relative_to(PROJECT_ROOT)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(path, target)
+    return generate_corpus(project, scale)
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak RSS of this process and any worker processes it waited for"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def instrument(module, names: List[str], phases: Dict[str, Dict[str, float]]):
+    """Wrap each named function or method with an inclusive timer"""
+    for name in names:
+        owner_name, _, attribute = name.rpartition(".")
+        owner = getattr(module, owner_name) if owner_name else module
+        original = getattr(owner, attribute)
+
+        @functools.wraps(original)
+        def timed(*args, _original=original, _name=name, **kwargs):
+            start = time.perf_counter()
+            try:
+                return _original(*args, **kwargs)
+            finally:
+                phase = phases.setdefault(_name, {"seconds": 0.0, "calls": 0})
+                phase["seconds"] += time.perf_counter() - start
+                phase["calls"] += 1
+
+        setattr(owner, attribute, timed)
+
+
+def run_target_in_process(name: str) -> Dict[str, Any]:
+    """Child side: run one target with its output discarded and report measurements"""
+    _, module_name, entry, phase_names, _ = next(target for target in TARGETS if target[0] == name)
+    module = importlib.import_module(module_name)
+    phases = {}
+    instrument(module, phase_names, phases)
+
+    if callable(entry):
+        run = functools.partial(entry, module)
+    else:
+        owner_name, _, attribute = entry.rpartition(".")
+        run = getattr(getattr(module, owner_name)(), attribute) if owner_name else getattr(module, attribute)
+
+    # Entry points that parse arguments must see a bare invocation, not --child
+    sys.argv = [f"{module_name}.py"]
+    exit_code = 0
+    start = time.perf_counter()
+    try:
+        run()
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    seconds = time.perf_counter() - start
+
+    return {"seconds": seconds, "peak_rss": peak_rss_bytes(), "exit_code": exit_code, "phases": phases}
+
+
+class Benchmark:
+    def __init__(self, scales: List[int], repeat: int, threshold: float, only: Optional[List[str]] = None):
+        self.scales = scales
+        self.repeat = repeat
+        self.threshold = threshold
+        self.targets = [target for target in TARGETS if not only or target[0] in only]
+        self.results = {}
+        self.corpora = {}
+        self.errors = []
+        self.warnings = []
+
+    def run(self):
+        print("[Benchmark] Starting...")
+        print(f"Scales: {', '.join(f'{scale}x' for scale in self.scales)}, {self.repeat} run(s) each")
+
+        with tempfile.TemporaryDirectory(prefix="toolchain_bench_") as temp:
+            for scale in self.scales:
+                label = f"{scale}x"
+                start = time.perf_counter()
+                corpus = build_workspace(Path(temp) / label, scale)
+                self.corpora[label] = corpus
+                print(f"\n[{label}] Corpus: {corpus['nodes']:,} nodes, {corpus['languages']} languages, "
+                      f"{corpus['vocab_words']:,} words, {corpus['ui_keys']:,} UI keys, {corpus['saves']:,} saves "
+                      f"({time.perf_counter() - start:.1f}s to generate)")
+
+                results = {}
+                for name, _, _, _, scaled in self.targets:
+                    if not scaled and scale != self.scales[0]:
+                        continue
+                    result = self.measure(Path(temp) / label / "project", name)
+                    if result is None:
+                        continue
+                    results[name] = result
+                    rss = f"{result['peak_rss'] / 2**20:.0f} MB" if result["peak_rss"] else "n/a"
+                    print(f"  [OK] {name}: {result['seconds']:.3f}s, peak {rss}")
+                    for phase, timing in sorted(result["phases"].items(), key=lambda item: -item[1]["seconds"])[:4]:
+                        print(f"       {phase}: {timing['seconds']:.3f}s ({timing['calls']}x)")
+                self.results[label] = results
+
+    def measure(self, project: Path, name: str) -> Optional[Dict[str, Any]]:
+        """Best of `repeat` runs, each in a fresh interpreter inside the workspace"""
+        runs = []
+        for _ in range(self.repeat):
+            with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as handle:
+                result_path = Path(handle.name)
+            wall_start = time.perf_counter()
+            process = subprocess.run(
+                [sys.executable, str(project / "tools" / "benchmark.py"), "--child", name, "--result", str(result_path)],
+                cwd=project / "tools",
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+            wall = time.perf_counter() - wall_start
+            try:
+                result = read_json(result_path)
+            except (OSError, JSONDecodeError):
+                tail = process.stderr.strip().splitlines()[-1:] or ["no output"]
+                self.errors.append(f"{name}: benchmark run crashed ({tail[0]})")
+                return None
+            finally:
+                result_path.unlink(missing_ok=True)
+            result["process_seconds"] = wall
+            runs.append(result)
+
+        best = min(runs, key=lambda run: run["seconds"])
+        if best["exit_code"]:
+            self.warnings.append(f"{name}: tool exited with {best['exit_code']} on the synthetic corpus")
+        return best
+
+    def load_history(self) -> List[Dict[str, Any]]:
+        if not HISTORY_PATH.exists():
+            return []
+        return read_json(HISTORY_PATH).get("runs", [])
+
+    def compare(self, history: List[Dict[str, Any]]):
+        """Flag targets slower or larger than the median of recent runs"""
+        print("\n[Comparison] Against the median of the last "
+              f"{BASELINE_RUNS} recorded runs (threshold {self.threshold:.0%})")
+        for label, results in self.results.items():
+            for name, result in results.items():
+                previous = [run["results"][label][name] for run in history[-BASELINE_RUNS:]
+                            if name in run.get("results", {}).get(label, {})]
+                if not previous:
+                    print(f"  [--] {label} {name}: no baseline yet")
+                    continue
+
+                baseline = statistics.median(run["seconds"] for run in previous)
+                change = result["seconds"] / baseline - 1 if baseline else 0.0
+                if change > self.threshold and result["seconds"] - baseline > MIN_REGRESSION_SECONDS:
+                    self.errors.append(f"{label} {name}: {result['seconds']:.3f}s vs {baseline:.3f}s ({change:+.0%})")
+                    marker = "[X]"
+                else:
+                    marker = "[OK]"
+                print(f"  {marker} {label} {name}: {result['seconds']:.3f}s vs {baseline:.3f}s ({change:+.0%})")
+
+                rss_values = [run["peak_rss"] for run in previous if run.get("peak_rss")]
+                if result["peak_rss"] and rss_values:
+                    rss_baseline = statistics.median(rss_values)
+                    if (result["peak_rss"] > rss_baseline * (1 + self.threshold)
+                            and result["peak_rss"] - rss_baseline > MIN_REGRESSION_BYTES):
+                        self.errors.append(f"{label} {name}: peak RSS {result['peak_rss'] / 2**20:.0f} MB "
+                                           f"vs {rss_baseline / 2**20:.0f} MB")
+
+    def record(self, history: List[Dict[str, Any]]):
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                                capture_output=True, text=True).stdout.strip()
+        history.append({
+            "recorded_at": datetime.now().isoformat(),
+            "commit": commit,
+            "python": sys.version.split()[0],
+            "json_backend": json_io.BACKEND,
+            "corpora": self.corpora,
+            "results": self.results
+        })
+        HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+        write_json(HISTORY_PATH, {"version": 1, "runs": history}, indent=2)
+        print(f"\n[OK] Recorded run {len(history)} in {HISTORY_PATH}")
+
+    def print_report(self):
+        print("\n" + "="*60)
+        print("BENCHMARK REPORT")
+        print("="*60)
+
+        if self.errors:
+            print(f"\n[X] REGRESSIONS / ERRORS ({len(self.errors)}):")
+            for error in self.errors:
+                print(f"  - {error}")
+
+        if self.warnings:
+            print(f"\n[!] WARNINGS ({len(self.warnings)}):")
+            for warning in self.warnings:
+                print(f"  - {warning}")
+
+        if not self.errors:
+            print("\n[OK] No regressions")
+        else:
+            print("\n[X] Benchmark failed!")
+            sys.exit(1)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the content toolchain on synthetic corpora")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES, help="Corpus multiples (default: 1 10 100)")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per target; the fastest counts")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Fail when slower than the baseline by this fraction")
+    parser.add_argument("--only", nargs="+", choices=[target[0] for target in TARGETS], metavar="TARGET",
+                        help="Benchmark only these targets")
+    parser.add_argument("--no-record", action="store_true", help="Compare without adding this run to the history")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--result", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = run_target_in_process(args.child)
+        write_json(args.result, result)
+        return
+
+    benchmark = Benchmark(sorted(set(args.scales)), max(1, args.repeat), args.threshold, args.only)
+    benchmark.run()
+
+    history = benchmark.load_history()
+    benchmark.compare(history)
+    if not args.no_record:
+        benchmark.record(history)
+    benchmark.print_report()
+
+
+if __name__ == "__main__":
+    main()
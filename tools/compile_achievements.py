@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Achievement Compiler
+Validates Steam achievement and stat definitions against the content each
+trigger depends on, rejects ending and stance triggers no playthrough can
+reach (via simulate_endings.py), keeps the append-only achievement table
+that save bitsets index into and writes one runtime table per build flavor
+"""
+
+import re
+import sys
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Set
+
+from compile_interrogations import POV_AXES, SCALAR_AXES, STANCE_MAX, STANCE_MIN, read_stance_povs
+from export_demo_full import DEMO_CONFIG, FULL_CONFIG
+from json_io import read_json, write_json
+from simulate_endings import EndingSimulator
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CONTENT_DIR = PROJECT_ROOT / "content"
+ACHIEVEMENT_DIR = CONTENT_DIR / "achievements"
+SOURCE_PATH = ACHIEVEMENT_DIR / "achievements.json"
+TABLE_PATH = ACHIEVEMENT_DIR / "achievement_table.json"
+ENDINGS_PATH = CONTENT_DIR / "main" / "endings.json"
+DOCUMENTS_PATH = CONTENT_DIR / "evidence" / "documents.json"
+INTERROGATION_INDEX_PATH = CONTENT_DIR / "interrogation" / "interrogation_index.json"
+VOCAB_DATABASE_PATH = CONTENT_DIR / "vocabulary" / "vocab_database.json"
+GAME_STATE_PATH = PROJECT_ROOT / "src" / "core" / "GameState.gd"
+ARCHIVE_SEALING_PATH = PROJECT_ROOT / "src" / "investigation" / "ArchiveSealing.gd"
+SRC_DIR = PROJECT_ROOT / "src"
+
+FLAVORS = [DEMO_CONFIG, FULL_CONFIG]
+
+# Steamworks API names
+ID_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]*$")
+REQUIRED_FIELDS = ["id", "name", "description", "trigger"]
+
+# endings.json is evaluated once this chapter is done
+ENDING_CHAPTER = 7
+
+STAT_AGGREGATES = ["value", "count"]
+
+# Literal IDs passed to unlock_achievement() in GDScript
+UNLOCK_CALL_PATTERN = re.compile(r'unlock_achievement\(\s*"([^"%]+)"\s*\)')
+
+
+def runtime_path(flavor: str) -> Path:
+    return ACHIEVEMENT_DIR / f"achievements_{flavor}.json"
+
+
+def read_state_keys() -> Dict[str, Set[str]]:
+    """Keys of each GameState domain (and of main.flags), from the state defaults"""
+    text = GAME_STATE_PATH.read_text(encoding='utf-8')
+    match = re.search(r'^var state := \{$(.*?)^\}$', text, re.MULTILINE | re.DOTALL)
+    if not match:
+        print(f"[X] state defaults not found in {GAME_STATE_PATH}")
+        sys.exit(1)
+
+    keys = {}
+    path = []
+    for line in match.group(1).splitlines():
+        found = re.match(r'^(\t+)"(\w+)":', line)
+        if not found:
+            continue
+        depth = len(found.group(1))
+        path = path[:depth - 1] + [found.group(2)]
+        if depth > 1:
+            keys.setdefault(".".join(path[:-1]), set()).add(path[-1])
+    return keys
+
+
+def read_seal_types() -> List[str]:
+    text = ARCHIVE_SEALING_PATH.read_text(encoding='utf-8')
+    match = re.search(r'const SEAL_TYPES := \[(.*?)\]', text, re.DOTALL)
+    if not match:
+        print(f"[X] SEAL_TYPES not found in {ARCHIVE_SEALING_PATH}")
+        sys.exit(1)
+    return re.findall(r'"(\w+)"', match.group(1))
+
+
+def is_positive_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
+class AchievementCompiler:
+    def __init__(self):
+        self.errors = []
+        self.warnings = []
+        self.state_keys = read_state_keys()
+        self.seal_types = read_seal_types()
+        self.povs = read_stance_povs()
+        self.stance_ranges: Dict[str, List[int]] = {}
+        self.reachable_endings: Set[str] = set()
+        self.load_content()
+
+    def load_content(self):
+        """Everything a trigger can refer to"""
+        self.chapter_nodes = {}
+        for path in sorted((CONTENT_DIR / "main").glob("chapter_*.json")):
+            self.chapter_nodes[int(path.stem.split("_")[1])] = list(read_json(path).get("nodes", {}))
+        self.node_chapters = {node_id: chapter for chapter, nodes in self.chapter_nodes.items() for node_id in nodes}
+
+        self.cases = {int(path.stem.split("_")[1]) for path in (CONTENT_DIR / "side").glob("case_*.json")}
+        self.endings = [ending["id"] for ending in read_json(ENDINGS_PATH).get("endings", [])]
+        self.comparisons = {comparison["id"] for comparison in read_json(DOCUMENTS_PATH).get("comparisons", [])}
+        self.interrogations = set(read_json(INTERROGATION_INDEX_PATH).get("interrogations", {}))
+        self.vocab_words = {word_id for words in read_json(VOCAB_DATABASE_PATH).values() for word_id in words}
+
+    def simulate_playthroughs(self):
+        """Final stance ranges and reached endings over every playthrough"""
+        print("\n[Simulate] Exploring stance space...")
+        simulator = EndingSimulator(seed=0)
+        if simulator.errors:
+            self.errors.extend(f"simulate_endings: {error}" for error in simulator.errors)
+            return
+        exact = simulator.explore()
+        self.warnings.extend(f"simulate_endings: {warning}" for warning in simulator.warnings)
+        self.stance_ranges = exact["ranges"]
+        self.reachable_endings = {ending for ending, probability in exact["probabilities"].items()
+                                  if probability > 0 and ending in self.endings}
+
+    def compile_all(self):
+        print("[AchievementCompiler] Starting compilation...")
+        print(f"Source: {SOURCE_PATH}")
+        print(f"Output: {ACHIEVEMENT_DIR}")
+
+        if not SOURCE_PATH.exists():
+            self.errors.append(f"Source not found: {SOURCE_PATH}")
+            self.print_report()
+            return
+
+        self.simulate_playthroughs()
+        if self.errors:
+            self.print_report()
+            return
+
+        source = read_json(SOURCE_PATH)
+        stats = self.compile_stats(source.get("stats", []))
+
+        achievements = []
+        seen = set()
+        for position, achievement in enumerate(source.get("achievements", [])):
+            missing = [field for field in REQUIRED_FIELDS if field not in achievement]
+            if missing:
+                self.errors.append(f"achievement {position}: missing {', '.join(missing)}")
+                continue
+            name = achievement["id"]
+            if name in seen:
+                self.errors.append(f"duplicate achievement ID '{name}'")
+                continue
+            seen.add(name)
+            if not ID_PATTERN.match(name):
+                self.errors.append(f"{name}: IDs are Steam API names (A-Z, 0-9, _)")
+            for field in ["name", "description"]:
+                if "english" not in achievement[field]:
+                    self.errors.append(f"{name}: {field} has no english text")
+
+            flavors = self.trigger_flavors(name, achievement["trigger"], stats)
+            if flavors is None:
+                continue
+            wanted = [config["build_flavor"] for config in FLAVORS
+                      if achievement.get("demo", False) or config is FULL_CONFIG]
+            unreachable = [flavor for flavor in wanted if flavor not in flavors]
+            if unreachable:
+                self.errors.append(f"{name}: ships in {', '.join(unreachable)} but its trigger "
+                                   f"cannot fire there")
+            achievements.append((achievement, wanted))
+
+        used = {achievement["trigger"].get("stat") for achievement, _ in achievements}
+        for stat in stats:
+            if stat not in used:
+                self.warnings.append(f"stat {stat} triggers no achievement")
+
+        self.check_unlock_calls(seen)
+
+        for config in FLAVORS:
+            count = sum(1 for _, wanted in achievements if config["build_flavor"] in wanted)
+            if count != config["achievements"]:
+                self.errors.append(f"{config['build_flavor']}: {count} achievements defined, "
+                                   f"export config expects {config['achievements']}")
+
+        if not self.errors:
+            table = self.update_table([achievement["id"] for achievement, _ in achievements])
+            for config in FLAVORS:
+                self.write_runtime(config, achievements, stats, table)
+
+        self.print_report()
+
+    def compile_stats(self, stats: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        compiled = {}
+        for position, stat in enumerate(stats):
+            name = stat.get("id", f"stat {position}")
+            if name in compiled:
+                self.errors.append(f"duplicate stat ID '{name}'")
+                continue
+            if not ID_PATTERN.match(name):
+                self.errors.append(f"{name}: IDs are Steam API names (A-Z, 0-9, _)")
+
+            domain, _, key = stat.get("source", "").partition(".")
+            if key not in self.state_keys.get(domain, ()):
+                self.errors.append(f"{name}: source '{stat.get('source')}' is not a GameState value")
+                continue
+            if stat.get("aggregate") not in STAT_AGGREGATES:
+                self.errors.append(f"{name}: aggregate must be one of {', '.join(STAT_AGGREGATES)}")
+                continue
+            compiled[name] = {"id": name, "source": stat["source"], "aggregate": stat["aggregate"]}
+        return compiled
+
+    def stat_maximum(self, stat: Dict[str, Any], config: Dict[str, Any]) -> Optional[int]:
+        """Highest value a stat can reach in a flavor, where content bounds it"""
+        if stat["aggregate"] != "count":
+            return None
+        if stat["source"] == "main.seen_nodes":
+            return sum(len(self.chapter_nodes.get(chapter, [])) for chapter in config["chapters"])
+        if stat["source"] == "ending.unlocked_endings":
+            return len(self.reachable_endings) if ENDING_CHAPTER in config["chapters"] else 0
+        if stat["source"] == "learning.mastered_words":
+            return len(self.vocab_words)
+        return None
+
+    def trigger_flavors(self, name: str, trigger: Dict[str, Any], stats: Dict[str, Dict[str, Any]]) -> Optional[List[str]]:
+        """Flavors whose content can fire the trigger; None if it is invalid"""
+        kind = trigger.get("type")
+        everywhere = [config["build_flavor"] for config in FLAVORS]
+
+        def where(key: str, valid: bool, known: str) -> bool:
+            if not valid:
+                self.errors.append(f"{name}: {kind} trigger refers to unknown {key} "
+                                   f"{trigger.get(key)!r} ({known})")
+            return valid
+
+        if kind == "chapter_completed":
+            chapter = trigger.get("chapter")
+            if not where("chapter", chapter in self.chapter_nodes, f"chapters {sorted(self.chapter_nodes)}"):
+                return None
+            return [config["build_flavor"] for config in FLAVORS if chapter in config["chapters"]]
+
+        if kind == "side_case":
+            case = trigger.get("case")
+            if not where("case", case in self.cases, f"cases {sorted(self.cases)}"):
+                return None
+            # TurtleSoup unlocks solved cases by this name
+            if name != f"SIDE_CASE_{case}":
+                self.errors.append(f"{name}: side case achievements are unlocked as SIDE_CASE_{case}")
+                return None
+            return [config["build_flavor"] for config in FLAVORS if case in config["side_stories"]]
+
+        if kind == "ending":
+            ending = trigger.get("ending")
+            if not where("ending", ending in self.endings, ENDINGS_PATH.name):
+                return None
+            if ending not in self.reachable_endings:
+                self.errors.append(f"{name}: no playthrough reaches {ending} (see simulate_endings.py)")
+                return None
+            return [config["build_flavor"] for config in FLAVORS if ENDING_CHAPTER in config["chapters"]]
+
+        if kind == "node":
+            node_id = trigger.get("node")
+            if not where("node", node_id in self.node_chapters, "compiled chapters"):
+                return None
+            return [config["build_flavor"] for config in FLAVORS if self.node_chapters[node_id] in config["chapters"]]
+
+        if kind == "flag":
+            flags = self.state_keys.get("main.flags", set())
+            return everywhere if where("flag", trigger.get("flag") in flags, "GameState main.flags") else None
+
+        if kind == "interrogation":
+            valid = trigger.get("interrogation") in self.interrogations
+            return everywhere if where("interrogation", valid, INTERROGATION_INDEX_PATH.name) else None
+
+        if kind == "comparison":
+            valid = trigger.get("comparison") in self.comparisons
+            return everywhere if where("comparison", valid, DOCUMENTS_PATH.name) else None
+
+        if kind == "seal":
+            if not where("seal", trigger.get("seal") in self.seal_types, "ArchiveSealing.SEAL_TYPES"):
+                return None
+            if not is_positive_int(trigger.get("min")):
+                self.errors.append(f"{name}: seal trigger needs a positive integer min")
+                return None
+            return everywhere
+
+        if kind == "stance":
+            axis, _, pov = trigger.get("axis", "").partition(".")
+            valid = (axis in SCALAR_AXES and not pov) or (axis in POV_AXES and pov in self.povs[axis])
+            if not where("axis", valid, "GameState stance axes"):
+                return None
+            bounds = [trigger[key] for key in ["min", "max"] if key in trigger]
+            if len(bounds) != 1 or not isinstance(bounds[0], int) or isinstance(bounds[0], bool):
+                self.errors.append(f"{name}: stance trigger needs one integer min or max")
+                return None
+            if not STANCE_MIN <= bounds[0] <= STANCE_MAX:
+                self.errors.append(f"{name}: {trigger['axis']} bound {bounds[0]} is outside "
+                                   f"{STANCE_MIN}..{STANCE_MAX}")
+                return None
+            # Final stances only: a bound reached mid-run and lost again is
+            # rejected too, which is conservative but never ships a dead trigger
+            low, high = self.stance_ranges[trigger["axis"]]
+            if trigger.get("min", low) > high or trigger.get("max", high) < low:
+                self.errors.append(f"{name}: {trigger['axis']} needs {'min' if 'min' in trigger else 'max'} "
+                                   f"{bounds[0]}, playthroughs end within {low:+d}..{high:+d}")
+                return None
+            return everywhere
+
+        if kind == "stat":
+            stat = stats.get(trigger.get("stat"))
+            if not where("stat", stat is not None, "stats in the source"):
+                return None
+            if not is_positive_int(trigger.get("min")):
+                self.errors.append(f"{name}: stat trigger needs a positive integer min")
+                return None
+            flavors = []
+            for config in FLAVORS:
+                maximum = self.stat_maximum(stat, config)
+                if maximum is None or trigger["min"] <= maximum:
+                    flavors.append(config["build_flavor"])
+            if not flavors:
+                self.errors.append(f"{name}: {stat['id']} never reaches {trigger['min']} "
+                                   f"(at most {self.stat_maximum(stat, FULL_CONFIG)})")
+                return None
+            return flavors
+
+        self.errors.append(f"{name}: unknown trigger type {kind!r}")
+        return None
+
+    def check_unlock_calls(self, defined: Set[str]):
+        """unlock_achievement("...") calls in GDScript must name a defined achievement"""
+        for path in sorted(SRC_DIR.rglob("*.gd")):
+            for name in UNLOCK_CALL_PATTERN.findall(path.read_text(encoding='utf-8')):
+                if name not in defined:
+                    self.errors.append(f"{path.relative_to(PROJECT_ROOT)}: unlocks undefined achievement '{name}'")
+
+    def update_table(self, names: List[str]) -> List[str]:
+        """Append new achievement IDs to the append-only table
+
+        Saves store achievements_unlocked as bit positions in this table, so
+        existing entries never move and removed achievements keep their slot.
+        """
+        table = []
+        if TABLE_PATH.exists():
+            table = read_json(TABLE_PATH).get("achievements", [])
+
+        known = set(table)
+        added = [name for name in names if name not in known]
+        table.extend(added)
+
+        retired = sorted(known - set(names))
+        if retired:
+            self.warnings.append(f"no longer defined, bits kept: {', '.join(retired)}")
+
+        write_json(TABLE_PATH, {
+            "version": "1.0",
+            "achievements": table,
+            "metadata": {
+                "compiled_at": datetime.now().isoformat(),
+                "achievement_count": len(table)
+            }
+        }, indent=2)
+
+        print(f"  [OK] Achievement table: {len(table)} IDs ({len(added)} new)")
+        return table
+
+    def write_runtime(self, config: Dict[str, Any], achievements: List[Any], stats: Dict[str, Dict[str, Any]], table: List[str]):
+        flavor = config["build_flavor"]
+        bit = {name: position for position, name in enumerate(table)}
+
+        entries = []
+        for achievement, wanted in achievements:
+            if flavor not in wanted:
+                continue
+            entries.append({
+                "id": achievement["id"],
+                "bit": bit[achievement["id"]],
+                "name": achievement["name"],
+                "description": achievement["description"],
+                "hidden": achievement.get("hidden", False),
+                "trigger": achievement["trigger"]
+            })
+
+        used = {entry["trigger"].get("stat") for entry in entries}
+        stat_entries = []
+        for stat in stats.values():
+            if stat["id"] not in used:
+                continue
+            entry = dict(stat)
+            maximum = self.stat_maximum(stat, config)
+            if maximum is not None:
+                entry["max"] = maximum
+            stat_entries.append(entry)
+
+        # Compact: runtime-only file, no indentation
+        write_json(runtime_path(flavor), {
+            "version": "1.0",
+            "flavor": flavor,
+            "table_size": len(table),
+            "achievements": entries,
+            "stats": stat_entries,
+            "metadata": {
+                "compiled_at": datetime.now().isoformat(),
+                "compiler_version": "1.0.0"
+            }
+        })
+
+        print(f"  [OK] {flavor}: {len(entries)} achievements, {len(stat_entries)} stats")
+
+    def print_report(self):
+        print("\n" + "="*60)
+        print("ACHIEVEMENT COMPILATION REPORT")
+        print("="*60)
+
+        if self.errors:
+            print(f"\n[X] ERRORS ({len(self.errors)}):")
+            for error in self.errors:
+                print(f"  - {error}")
+
+        if self.warnings:
+            print(f"\n[!] WARNINGS ({len(self.warnings)}):")
+            for warning in self.warnings:
+                print(f"  - {warning}")
+
+        if not self.errors:
+            print("\n[OK] Compilation successful!")
+            print(f"   Output: {ACHIEVEMENT_DIR}")
+        else:
+            print("\n[X] Compilation failed!")
+            sys.exit(1)
+
+
+def main():
+    compiler = AchievementCompiler()
+    compiler.compile_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,20 +4,116 @@ Content Compiler - Converts source content to runtime format
 Processes story files from _source and generates JSON for the game
 """
 
-import json
+import hashlib
 import os
 import re
 import sys
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any
 
+from json_io import dump_bytes, read_json, write_json
+from profiling import profiler, add_profile_arguments, start_profiling
+from scene_parser import SceneParser
+from solve_cases import CaseSolver, rate_difficulty
+
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent
 SOURCE_DIR = PROJECT_ROOT.parent / "source" / "content" / "_source"
 OUTPUT_DIR = PROJECT_ROOT / "content"
-MAIN_SOURCE = SOURCE_DIR / "main"
 SIDE_SOURCE = SOURCE_DIR / "side"
+STORY_INDEX_PATH = OUTPUT_DIR / "story_index.json"
+PLAYER_INDEX_PATH = OUTPUT_DIR / "story_index.player.json"
+NODE_TABLE_PATH = OUTPUT_DIR / "main" / "node_table.json"
+LANGUAGE_REGISTRY_PATH = PROJECT_ROOT / "locales" / "_meta" / "language_registry.json"
+CHAPTER_COUNT = 7
+# Unlocking this enables the turtle soup solve button
+SOLUTION_ID = "SOLUTION"
+# Nodes with these tags never ship to players
+AUTHOR_ONLY_TAGS = {"debug", "author_only"}
+VOCAB_DB_PATH = OUTPUT_DIR / "vocabulary" / "vocab_database.json"
+INJECTION_INDEX_PATH = OUTPUT_DIR / "vocabulary" / "injection_index.json"
+
+# Vocabulary translations are English, so English text is matched against them
+TRANSLATION_LANGUAGE = "english"
+
+# Scripts written without spaces between words (Han, kana, Thai, Lao,
+# Myanmar, Khmer): a word in them may sit anywhere in the text. Words in any
+# other script only match whole words, so "chat" is not found in "chateau".
+UNSPACED_SCRIPT_PATTERN = re.compile("[\u0e00-\u0eff\u1000-\u109f\u1780-\u17ff"
+                                     "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]")
+
+
+class AhoCorasick:
+    """Multi-pattern matcher: one pass over the text finds every pattern"""
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = patterns
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+        for index, pattern in enumerate(patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                if char not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.goto[state][char] = len(self.goto) - 1
+                state = self.goto[state][char]
+            self.output[state].append(index)
+
+        # Breadth-first so a state's fail link is resolved before its children
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                if self.fail[child] == child:
+                    self.fail[child] = 0
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def find_all(self, text: str) -> List[tuple]:
+        """Return (start, end, pattern_index) for every occurrence"""
+        matches = []
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            for index in self.output[state]:
+                end = position + 1
+                matches.append((end - len(self.patterns[index]), end, index))
+        return matches
+
+
+def fold_case(text: str) -> str:
+    """Lowercase without changing length, so offsets stay valid for the original"""
+    return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+
+def text_hash(text: str) -> str:
+    """First 16 hex digits of SHA-256 over UTF-8, as GDScript's String.sha256_text()"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def select_non_overlapping(matches: List[tuple]) -> List[tuple]:
+    """Keep leftmost-longest matches so each span can be replaced in place"""
+    selected = []
+    last_end = 0
+    for start, end, index in sorted(matches, key=lambda m: (m[0], -(m[1] - m[0]))):
+        if start >= last_end:
+            selected.append((start, end, index))
+            last_end = end
+    return selected
 
 
 class ContentCompiler:
@@ -25,6 +121,10 @@ class ContentCompiler:
         self.node_counter = 0
         self.errors = []
         self.warnings = []
+        # node ID -> "file:line" of its scene source, for error messages
+        self.node_origins = {}
+        # Scene entries from story_index.json, in play order
+        self.scenes = []
 
     def compile_all(self):
         """Compile all content"""
@@ -40,6 +140,9 @@ class ContentCompiler:
         # Compile main story
         self.compile_main_story()
 
+        # Index vocabulary occurrences for immersion injection
+        self.build_injection_index()
+
         # Compile side stories
         self.compile_side_stories()
 
@@ -49,23 +152,236 @@ class ContentCompiler:
         # Report
         self.print_report()
 
+    @profiler.timed()
     def compile_main_story(self):
         """Compile main story chapters"""
         print("\n[Main Story] Compiling...")
 
-        if not MAIN_SOURCE.exists():
-            self.errors.append(f"Main source directory not found: {MAIN_SOURCE}")
-            return
+        compiled = self.compile_scenes()
+        chapters = {}
+        stripped_bytes = 0
+        stripped_nodes = 0
+
+        for chapter in range(1, CHAPTER_COUNT + 1):
+            if chapter in compiled:
+                chapter_data = self.build_chapter(chapter, compiled[chapter])
+                source = "scenes"
+            else:
+                # No scene sources yet for this chapter
+                chapter_data = self.generate_chapter_placeholder(chapter)
+                source = "placeholder"
+
+            with profiler.phase("strip_dead_content", chapter=chapter):
+                full_size = len(dump_bytes(chapter_data, indent=2))
+                full_count = len(chapter_data["nodes"])
+
+                chapter_data["nodes"] = self.strip_dead_content(chapter, chapter_data["nodes"])
+                chapter_data["metadata"]["node_count"] = len(chapter_data["nodes"])
 
-        # For now, generate placeholder chapters
-        for chapter in range(1, 8):  # 7 chapters
-            chapter_data = self.generate_chapter_placeholder(chapter)
             output_path = OUTPUT_DIR / "main" / f"chapter_{chapter}.json"
+            written = write_json(output_path, chapter_data, indent=2)
+            profiler.count("nodes shipped", len(chapter_data["nodes"]))
+            profiler.count("files written")
+            profiler.count("bytes written", written)
+
+            removed_bytes = full_size - written
+            removed_nodes = full_count - len(chapter_data["nodes"])
+            stripped_bytes += removed_bytes
+            stripped_nodes += removed_nodes
+            chapters[chapter] = chapter_data["nodes"]
+
+            stripped = f", stripped {removed_nodes} ({removed_bytes:,} bytes)" if removed_nodes else ""
+            print(f"  [OK] Chapter {chapter}: {len(chapter_data['nodes'])} nodes ({source}){stripped}")
+
+        self.write_player_index(chapters, stripped_nodes, stripped_bytes)
+        self.update_node_table(chapters)
+        print(f"  [OK] Dead content removed: {stripped_nodes} nodes, {stripped_bytes:,} bytes")
+
+    def load_languages(self) -> List[str]:
+        """Language keys allowed in scene text lines"""
+        return list(read_json(LANGUAGE_REGISTRY_PATH, cached=True).get("languages", {}).keys())
+
+    @profiler.timed()
+    def compile_scenes(self) -> Dict[int, Dict[str, Any]]:
+        """Parse the scene sources listed in story_index.json into chapter node graphs"""
+        if not STORY_INDEX_PATH.exists():
+            self.warnings.append(f"Story index not found: {STORY_INDEX_PATH}")
+            return {}
+
+        story_index = read_json(STORY_INDEX_PATH)
+
+        languages = self.load_languages()
+        chapters = {}
+        previous_tail = None
+
+        self.scenes = story_index.get("scenes", [])
+
+        for scene in self.scenes:
+            scene_path = PROJECT_ROOT / scene["file"]
+            if not scene_path.exists():
+                self.warnings.append(f"Scene {scene['sceneId']}: source not found: {scene['file']}")
+                continue
+
+            parser = SceneParser(scene_path, scene["sceneId"], languages, scene.get("defaultBg", ""))
+            tail = None
+            count = 0
+            profiler.count("files read")
+            profiler.count("bytes read", scene_path.stat().st_size)
+
+            for node in parser.parse():
+                chapter = node.pop("_chapter") or 0
+                origin = f"{scene['file']}:{node.pop('_line')}"
+                for choice in node.get("choices", []):
+                    choice.pop("_line")
+
+                nodes = chapters.setdefault(chapter, {})
+                if node["id"] in nodes:
+                    self.errors.append(f"{origin}: node '{node['id']}' already defined at {self.node_origins[node['id']]}")
+                    continue
+
+                nodes[node["id"]] = node
+                self.node_origins[node["id"]] = origin
+                tail = node
+                count += 1
+
+            # Scenes play in index order: an open-ended scene flows into the next
+            # one. Author-only scenes sit outside that flow.
+            if not scene.get("authorOnly"):
+                if previous_tail is not None and not previous_tail["next"] and "choices" not in previous_tail:
+                    previous_tail["next"] = parser.first_node_id or ""
+                previous_tail = tail
+
+            self.errors.extend(f"{scene['file']}:{error.line}: {error.message}" for error in parser.errors)
+            profiler.count("nodes parsed", count)
+            print(f"  [OK] Scene {scene['sceneId']}: {count} nodes")
+
+        for chapter, nodes in chapters.items():
+            self.check_chapter_links(chapter, nodes)
+
+        return chapters
+
+    def check_chapter_links(self, chapter: int, nodes: Dict[str, Any]):
+        """Every next/choice target must exist in this chapter or start the next one"""
+        if not 1 <= chapter <= CHAPTER_COUNT:
+            self.errors.append(f"Chapter {chapter} is outside 1-{CHAPTER_COUNT}")
+
+        start_id = f"CH{chapter}_START"
+        if start_id not in nodes:
+            self.errors.append(f"Chapter {chapter}: missing start node {start_id}")
+
+        allowed_external = {"ENDING", f"CH{chapter + 1}_START"}
+
+        for node_id, node in nodes.items():
+            targets = [node.get("next", "")] + [choice["next"] for choice in node.get("choices", [])]
+            for target in targets:
+                if target and target not in nodes and target not in allowed_external:
+                    self.errors.append(f"{self.node_origins[node_id]}: '{node_id}' links to unknown node '{target}'")
+
+    def strip_dead_content(self, chapter: int, nodes: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep only the nodes a player can reach from CHn_START
+
+        Author-only scenes and debug-tagged nodes are dropped first; choices
+        into them disappear with them, but a plain `next` into one is an error.
+        """
+        author_scenes = {scene["sceneId"] for scene in self.scenes if scene.get("authorOnly")}
+
+        def is_author_only(node: Dict[str, Any]) -> bool:
+            return (node.get("metadata", {}).get("scene") in author_scenes
+                    or not AUTHOR_ONLY_TAGS.isdisjoint(node.get("tags", [])))
+
+        kept = {node_id: node for node_id, node in nodes.items() if not is_author_only(node)}
+
+        reachable = {}
+        stack = [f"CH{chapter}_START"]
+        while stack:
+            node_id = stack.pop()
+            if node_id in reachable or node_id not in kept:
+                continue
+            node = kept[node_id]
+            reachable[node_id] = node
+
+            if node.get("next") in nodes and node["next"] not in kept:
+                origin = self.node_origins.get(node_id, f"chapter {chapter}")
+                self.errors.append(f"{origin}: '{node_id}' continues into author-only node '{node['next']}'")
+
+            if "choices" in node:
+                node["choices"] = [choice for choice in node["choices"] if choice["next"] not in nodes or choice["next"] in kept]
+                stack.extend(choice["next"] for choice in reversed(node["choices"]))
+            stack.append(node.get("next", ""))
+
+        # Preserve source order for readable diffs
+        return {node_id: node for node_id, node in nodes.items() if node_id in reachable}
+
+    @profiler.timed()
+    def write_player_index(self, chapters: Dict[int, Dict[str, Any]], stripped_nodes: int, stripped_bytes: int):
+        """Derive story_index.player.json from what survived stripping"""
+        shipped_scenes = {}
+        for chapter, nodes in chapters.items():
+            for node in nodes.values():
+                scene_id = node.get("metadata", {}).get("scene")
+                if scene_id:
+                    entry = shipped_scenes.setdefault(scene_id, {"sceneId": scene_id, "chapter": chapter, "nodes": 0})
+                    entry["nodes"] += 1
+
+        player_index = {
+            "version": "1.0",
+            "description": "玩家版主线索引 - 仅包含玩家可见内容",
+            "scenes": [shipped_scenes[scene["sceneId"]] for scene in self.scenes if scene["sceneId"] in shipped_scenes],
+            "chapters": [
+                {"chapter": chapter, "start": f"CH{chapter}_START", "nodes": len(nodes)}
+                for chapter, nodes in chapters.items()
+            ],
+            "metadata": {
+                "compiled_at": datetime.now().isoformat(),
+                "stripped_nodes": stripped_nodes,
+                "stripped_bytes": stripped_bytes
+            }
+        }
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(chapter_data, f, ensure_ascii=False, indent=2)
+        write_json(PLAYER_INDEX_PATH, player_index, indent=2)
 
-            print(f"  [OK] Chapter {chapter}: {len(chapter_data['nodes'])} nodes")
+    @profiler.timed()
+    def update_node_table(self, chapters: Dict[int, Dict[str, Any]]):
+        """Append newly shipped node IDs to the append-only node table
+
+        Compact saves store seen_nodes as bit positions in this table, so
+        existing entries never move and IDs that stop shipping keep their slot.
+        """
+        table = []
+        if NODE_TABLE_PATH.exists():
+            table = read_json(NODE_TABLE_PATH).get("nodes", [])
+
+        known = set(table)
+        added = [node_id for nodes in chapters.values() for node_id in nodes if node_id not in known]
+        table.extend(added)
+
+        write_json(NODE_TABLE_PATH, {
+            "version": "1.0",
+            "nodes": table,
+            "metadata": {
+                "compiled_at": datetime.now().isoformat(),
+                "node_count": len(table)
+            }
+        }, indent=2)
+
+        print(f"  [OK] Node table: {len(table)} IDs ({len(added)} new)")
+
+    def build_chapter(self, chapter: int, nodes: Dict[str, Any]) -> Dict[str, Any]:
+        """Wrap compiled scene nodes in the runtime chapter format"""
+        return {
+            "chapter": chapter,
+            "title": {
+                "english": f"Chapter {chapter}",
+                "schinese": f"第{chapter}章"
+            },
+            "nodes": nodes,
+            "metadata": {
+                "compiled_at": datetime.now().isoformat(),
+                "compiler_version": "1.0.0",
+                "node_count": len(nodes),
+                "source": "scene_sources"
+            }
+        }
 
     def generate_chapter_placeholder(self, chapter: int) -> Dict[str, Any]:
         """Generate placeholder chapter data with proper structure"""
@@ -175,6 +491,7 @@ class ContentCompiler:
             }
         }
 
+    @profiler.timed()
     def compile_side_stories(self):
         """Compile side stories (turtle soup cases)"""
         print("\n[Side Stories] Compiling...")
@@ -182,12 +499,76 @@ class ContentCompiler:
         # Generate placeholder turtle soup cases
         for case_num in range(1, 4):  # 3 cases for demo
             case_data = self.generate_turtle_soup_case(case_num)
+            errors_before = len(self.errors)
+            case_data["graph"] = self.compile_case_graph(f"case_{case_num}.json", case_data["questions"])
+
+            # Difficulty comes from the question structure, not the author
+            if len(self.errors) == errors_before:
+                case_data["solver"] = CaseSolver(case_data).solve()
+                case_data["difficulty"] = rate_difficulty(case_data["solver"]["expected_turns"])
+
             output_path = OUTPUT_DIR / "side" / f"case_{case_num}.json"
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(case_data, f, ensure_ascii=False, indent=2)
+            write_json(output_path, case_data, indent=2)
+            profiler.count("files written")
+
+            print(f"  [OK] Case {case_num}: {case_data['title']['english']} ({case_data['difficulty']})")
+
+    def compile_case_graph(self, name: str, questions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Validate a case's unlock DAG and precompute what TurtleSoup needs
+
+        question_index maps ID -> position in `questions`, initial is the
+        frontier of questions nothing unlocks, topo_order is a valid asking
+        order. SOLUTION may be a marker or a question of its own.
+        """
+        question_index = {}
+        for position, question in enumerate(questions):
+            if question["id"] in question_index:
+                self.errors.append(f"{name}: duplicate question ID '{question['id']}'")
+            question_index[question["id"]] = position
+
+        incoming = [0] * len(questions)
+        solution_sources = []
+        for question in questions:
+            for target in question.get("unlocks", []):
+                if target == SOLUTION_ID:
+                    solution_sources.append(question_index[question["id"]])
+                if target in question_index:
+                    incoming[question_index[target]] += 1
+                elif target != SOLUTION_ID:
+                    self.errors.append(f"{name}: '{question['id']}' unlocks unknown question '{target}'")
+
+        initial = [position for position, count in enumerate(incoming) if count == 0]
+        if not initial:
+            self.errors.append(f"{name}: no initial questions (every question is unlocked by another)")
+
+        # Kahn's algorithm; whatever never reaches in-degree 0 sits on a cycle
+        remaining = list(incoming)
+        queue = deque(initial)
+        topo_order = []
+        while queue:
+            position = queue.popleft()
+            topo_order.append(position)
+            for target in questions[position].get("unlocks", []):
+                if target in question_index:
+                    remaining[question_index[target]] -= 1
+                    if remaining[question_index[target]] == 0:
+                        queue.append(question_index[target])
+
+        if len(topo_order) < len(questions):
+            cyclic = sorted(questions[position]["id"] for position, count in enumerate(remaining) if count > 0)
+            self.errors.append(f"{name}: unlock cycle, unreachable questions: {', '.join(cyclic)}")
+
+        reachable = set(topo_order)
+        if not any(position in reachable for position in solution_sources) and \
+                question_index.get(SOLUTION_ID) not in reachable:
+            self.errors.append(f"{name}: {SOLUTION_ID} can never be unlocked")
 
-            print(f"  [OK] Case {case_num}: {case_data['title']['english']}")
+        return {
+            "question_index": question_index,
+            "initial": initial,
+            "topo_order": topo_order
+        }
 
     def generate_turtle_soup_case(self, case_num: int) -> Dict[str, Any]:
         """Generate placeholder turtle soup case"""
@@ -260,6 +641,82 @@ class ContentCompiler:
             }
         }
 
+    @profiler.timed()
+    def build_injection_index(self):
+        """Map each node's text to the vocabulary entries occurring in it
+
+        For every target language in the vocabulary database, node text in
+        that language is matched against the words themselves and English
+        text against their translations. Offsets are in characters, matching
+        GDScript String indexing, so the runtime can inject in place; each
+        entry carries the text's length and hash so the runtime only splices
+        into the exact text the offsets were computed on.
+        """
+        print("\n[Injection Index] Building...")
+
+        if not VOCAB_DB_PATH.exists():
+            self.warnings.append(f"Vocabulary database not found: {VOCAB_DB_PATH}")
+            return
+
+        database = read_json(VOCAB_DB_PATH)
+
+        # Cached: generate_manifest reads the same chapters again
+        chapters = []
+        for chapter_file in sorted((OUTPUT_DIR / "main").glob("chapter_*.json")):
+            chapters.append(read_json(chapter_file, cached=True))
+            profiler.count("files read")
+
+        index = {
+            "version": "1.0",
+            "languages": {},
+            "metadata": {
+                "compiled_at": datetime.now().isoformat(),
+                "compiler_version": "1.0.0"
+            }
+        }
+
+        for target_lang, lang_vocab in database.items():
+            word_ids = list(lang_vocab.keys())
+            with profiler.phase("build matchers", language=target_lang):
+                words = [lang_vocab[w]["word"] for w in word_ids]
+                translations = [fold_case(lang_vocab[w]["translation"]) for w in word_ids]
+                # Per pattern: whether a match must be a whole word
+                matchers = {
+                    target_lang: (AhoCorasick(words), [not UNSPACED_SCRIPT_PATTERN.search(word) for word in words], False),
+                    TRANSLATION_LANGUAGE: (AhoCorasick(translations), [True] * len(word_ids), True)
+                }
+
+            nodes_index = {}
+            match_count = 0
+            for chapter in chapters:
+                for node_id, node in chapter.get("nodes", {}).items():
+                    node_entry = {}
+                    for text_lang, text in node.get("text", {}).items():
+                        if text_lang not in matchers:
+                            continue
+                        matcher, whole_words, folded = matchers[text_lang]
+                        haystack = fold_case(text) if folded else text
+                        matches = [m for m in matcher.find_all(haystack)
+                                   if not whole_words[m[2]] or self._is_whole_word(haystack, m[0], m[1])]
+                        spans = [[word_ids[i], start, end] for start, end, i in select_non_overlapping(matches)]
+                        if spans:
+                            node_entry[text_lang] = {"length": len(text), "hash": text_hash(text), "spans": spans}
+                            match_count += len(spans)
+                    if node_entry:
+                        nodes_index[node_id] = node_entry
+
+            index["languages"][target_lang] = nodes_index
+            print(f"  [OK] {target_lang}: {match_count} occurrences in {len(nodes_index)} nodes")
+
+        write_json(INJECTION_INDEX_PATH, index, indent=2)
+
+    @staticmethod
+    def _is_whole_word(text: str, start: int, end: int) -> bool:
+        before = text[start - 1] if start > 0 else " "
+        after = text[end] if end < len(text) else " "
+        return not before.isalnum() and not after.isalnum()
+
+    @profiler.timed()
     def generate_manifest(self):
         """Generate content manifest"""
         print("\n[Manifest] Generating...")
@@ -277,35 +734,32 @@ class ContentCompiler:
         }
 
         # Count main story nodes
-        for chapter in range(1, 8):
+        for chapter in range(1, CHAPTER_COUNT + 1):
             chapter_file = OUTPUT_DIR / "main" / f"chapter_{chapter}.json"
             if chapter_file.exists():
-                with open(chapter_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    node_count = len(data.get('nodes', {}))
-                    manifest["content"]["total_nodes"] += node_count
-                    manifest["chapters"].append({
-                        "chapter": chapter,
-                        "file": f"main/chapter_{chapter}.json",
-                        "nodes": node_count
-                    })
+                data = read_json(chapter_file, cached=True)
+                node_count = len(data.get('nodes', {}))
+                manifest["content"]["total_nodes"] += node_count
+                manifest["chapters"].append({
+                    "chapter": chapter,
+                    "file": f"main/chapter_{chapter}.json",
+                    "nodes": node_count
+                })
 
         # List side cases
         for case_num in range(1, 4):
             case_file = OUTPUT_DIR / "side" / f"case_{case_num}.json"
             if case_file.exists():
-                with open(case_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    manifest["cases"].append({
-                        "case_id": data["case_id"],
-                        "file": f"side/case_{case_num}.json",
-                        "difficulty": data.get("difficulty", "medium")
-                    })
+                data = read_json(case_file)
+                manifest["cases"].append({
+                    "case_id": data["case_id"],
+                    "file": f"side/case_{case_num}.json",
+                    "difficulty": data.get("difficulty", "medium")
+                })
 
         # Write manifest
         manifest_path = OUTPUT_DIR / "manifest.json"
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        write_json(manifest_path, manifest, indent=2)
 
         print(f"  [OK] Manifest: {manifest['content']['total_nodes']} total nodes")
 
@@ -334,6 +788,12 @@ class ContentCompiler:
 
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compile scene sources and side content to runtime JSON")
+    add_profile_arguments(parser)
+    start_profiling("compile_content", parser.parse_args())
+
     compiler = ContentCompiler()
     compiler.compile_all()
 
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Evidence Compiler
+Diffs paired evidence documents at build time (token-level Myers diff,
+CJK-aware) and emits highlight spans per language, so EvidenceComparison
+only has to apply character ranges
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Any, Tuple
+
+from json_io import read_json, write_json
+
+PROJECT_ROOT = Path(__file__).parent.parent
+EVIDENCE_DIR = PROJECT_ROOT / "content" / "evidence"
+SOURCE_PATH = EVIDENCE_DIR / "documents.json"
+OUTPUT_PATH = EVIDENCE_DIR / "evidence_index.json"
+
+REQUIRED_DOCUMENT_FIELDS = ["id", "title", "source", "text"]
+
+# CJK ideographs, kana and hangul syllables are one token per character;
+# other scripts split into words. Whitespace and punctuation never differ.
+CJK_CHARS = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+WORD_CHAR = rf"(?![{CJK_CHARS}])[^\W_]"
+TOKEN_PATTERN = re.compile(rf"[{CJK_CHARS}]|(?:{WORD_CHAR})+(?:['\u2019](?:{WORD_CHAR})+)*")
+
+
+def tokenize(text: str) -> List[Tuple[str, int, int]]:
+    """(normalized token, start, end) with offsets in characters"""
+    return [(match.group().casefold(), match.start(), match.end()) for match in TOKEN_PATTERN.finditer(text)]
+
+
+def myers_matches(a: List[str], b: List[str]) -> List[Tuple[int, int]]:
+    """Index pairs (i, j) with a[i] == b[j] on a shortest edit script
+
+    Myers' O((N+M)D) algorithm, keeping one V array per edit distance for
+    the backtrack.
+    """
+    n, m = len(a), len(b)
+    v = {1: 0}
+    trace = []
+
+    for d in range(n + m + 1):
+        trace.append(dict(v))
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]
+            else:
+                x = v[k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= n and y >= m:
+                break
+        else:
+            continue
+        break
+
+    matches = []
+    x, y = n, m
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]
+        k = x - y
+        if k == -d or (k != d and v.get(k - 1, -1) < v.get(k + 1, -1)):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v.get(prev_k, 0)
+        prev_y = prev_x - prev_k
+
+        while x > prev_x and y > prev_y:
+            x -= 1
+            y -= 1
+            matches.append((x, y))
+
+        if d > 0:
+            x, y = prev_x, prev_y
+
+    matches.reverse()
+    return matches
+
+
+def unmatched_spans(tokens: List[Tuple[str, int, int]], matched: set) -> List[List[int]]:
+    """Merge runs of unmatched tokens into [start, end) character spans"""
+    spans = []
+    in_run = False
+    for i, (_, start, end) in enumerate(tokens):
+        if i in matched:
+            in_run = False
+        elif in_run:
+            spans[-1][1] = end
+        else:
+            spans.append([start, end])
+            in_run = True
+    return spans
+
+
+def diff_texts(left: str, right: str) -> Dict[str, Any]:
+    """Spans per side, with the length of the text they index so the runtime can reject stale text"""
+    left_tokens = tokenize(left)
+    right_tokens = tokenize(right)
+    matches = myers_matches([t[0] for t in left_tokens], [t[0] for t in right_tokens])
+
+    return {
+        "left": unmatched_spans(left_tokens, {i for i, _ in matches}),
+        "right": unmatched_spans(right_tokens, {j for _, j in matches}),
+        "left_length": len(left),
+        "right_length": len(right)
+    }
+
+
+class EvidenceCompiler:
+    def __init__(self):
+        self.errors = []
+        self.warnings = []
+
+    def compile_all(self):
+        print("[EvidenceCompiler] Starting compilation...")
+        print(f"Source: {SOURCE_PATH}")
+        print(f"Output: {OUTPUT_PATH}")
+
+        if not SOURCE_PATH.exists():
+            self.errors.append(f"Source not found: {SOURCE_PATH}")
+            self.print_report()
+            return
+
+        source = read_json(SOURCE_PATH)
+
+        documents = self.compile_documents(source.get("documents", []))
+        comparisons = self.compile_comparisons(source.get("comparisons", []), documents)
+
+        if not self.errors:
+            write_json(OUTPUT_PATH, {
+                "version": "1.0",
+                "documents": documents,
+                "comparisons": comparisons,
+                "metadata": {
+                    "compiled_at": datetime.now().isoformat(),
+                    "compiler_version": "1.0.0"
+                }
+            }, indent=2)
+
+        self.print_report()
+
+    def compile_documents(self, documents: List[Dict[str, Any]]) -> Dict[str, Any]:
+        print("\n[Documents] Validating...")
+        compiled = {}
+
+        for position, document in enumerate(documents):
+            missing = [field for field in REQUIRED_DOCUMENT_FIELDS if field not in document]
+            if missing:
+                self.errors.append(f"document {position}: missing {', '.join(missing)}")
+                continue
+            if document["id"] in compiled:
+                self.errors.append(f"duplicate document ID '{document['id']}'")
+                continue
+            compiled[document["id"]] = document
+
+        print(f"  [OK] {len(compiled)} documents")
+        return compiled
+
+    def compile_comparisons(self, comparisons: List[Dict[str, Any]], documents: Dict[str, Any]) -> Dict[str, Any]:
+        """Diff every pair; keyed "LEFT|RIGHT" so the runtime can look up any pair"""
+        print("\n[Comparisons] Diffing...")
+        compiled = {}
+
+        for comparison in comparisons:
+            left_id, right_id = comparison.get("left"), comparison.get("right")
+            name = comparison.get("id", f"{left_id}|{right_id}")
+
+            unknown = [doc_id for doc_id in (left_id, right_id) if doc_id not in documents]
+            if unknown:
+                self.errors.append(f"{name}: unknown document {', '.join(map(str, unknown))}")
+                continue
+
+            left_text = documents[left_id]["text"]
+            right_text = documents[right_id]["text"]
+            languages = [lang for lang in left_text if lang in right_text]
+            if len(languages) < len(set(left_text) | set(right_text)):
+                self.warnings.append(f"{name}: languages missing on one side are not diffed")
+
+            start = time.perf_counter()
+            spans = {lang: diff_texts(left_text[lang], right_text[lang]) for lang in languages}
+            elapsed = time.perf_counter() - start
+
+            compiled[f"{left_id}|{right_id}"] = {"id": name, "left": left_id, "right": right_id, "spans": spans}
+
+            counts = ", ".join(f"{lang} {len(s['left'])}/{len(s['right'])}" for lang, s in spans.items())
+            print(f"  [OK] {name}: {counts} spans ({elapsed * 1000:.1f} ms)")
+
+        return compiled
+
+    def print_report(self):
+        print("\n" + "="*60)
+        print("EVIDENCE COMPILATION REPORT")
+        print("="*60)
+
+        if self.errors:
+            print(f"\n[X] ERRORS ({len(self.errors)}):")
+            for error in self.errors:
+                print(f"  - {error}")
+
+        if self.warnings:
+            print(f"\n[!] WARNINGS ({len(self.warnings)}):")
+            for warning in self.warnings:
+                print(f"  - {warning}")
+
+        if not self.errors:
+            print("\n[OK] Compilation successful!")
+            print(f"   Output: {OUTPUT_PATH}")
+        else:
+            print("\n[X] Compilation failed!")
+            sys.exit(1)
+
+
+def main():
+    compiler = EvidenceCompiler()
+    compiler.compile_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Interrogation Compiler
+Validates interrogation question graphs and stance effects against the
+GameState stance axes, writes one compact indexed file per interrogation
+and an index with the stance range each interrogation can reach
+"""
+
+import re
+import sys
+from collections import deque
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+
+from json_io import read_json, write_json
+
+PROJECT_ROOT = Path(__file__).parent.parent
+INTERROGATION_DIR = PROJECT_ROOT / "content" / "interrogation"
+SOURCE_PATH = INTERROGATION_DIR / "interrogations.json"
+INDEX_PATH = INTERROGATION_DIR / "interrogation_index.json"
+GAME_STATE_PATH = PROJECT_ROOT / "src" / "core" / "GameState.gd"
+
+# GameState clamps every stance axis to this range
+STANCE_MIN = -100
+STANCE_MAX = 100
+SCALAR_AXES = ["axis_truth"]
+POV_AXES = ["axis_loyalty", "axis_blame"]
+
+REQUIRED_QUESTION_FIELDS = ["id", "text", "response"]
+
+# Reachable ranges enumerate every set of questions a player can have
+# asked; past this many questions per-question bounds are reported instead
+MAX_EXACT_QUESTIONS = 16
+
+
+def read_stance_povs() -> Dict[str, List[str]]:
+    """POV keys of each per-POV stance axis, read from GameState.gd's defaults"""
+    text = GAME_STATE_PATH.read_text(encoding='utf-8')
+    povs = {}
+    for axis in POV_AXES:
+        match = re.search(rf'"{axis}":\s*\{{([^}}]*)\}}', text)
+        if not match:
+            print(f"[X] {axis} not found in {GAME_STATE_PATH}")
+            sys.exit(1)
+        povs[axis] = re.findall(r'"(\w+)":', match.group(1))
+    return povs
+
+
+def stance_vector(stance_change: Dict[str, Any], axes: List[Tuple[str, Optional[str]]]) -> List[int]:
+    """Flatten a stance_change dict onto (axis, pov) columns"""
+    vector = []
+    for axis, pov in axes:
+        value = stance_change.get(axis, 0 if pov is None else {})
+        vector.append(int(value if pov is None else value.get(pov, 0)))
+    return vector
+
+
+def reachable_ranges(initial: List[int], unlocks: List[List[int]], deltas: List[List[int]]) -> Tuple[List[List[int]], bool]:
+    """Min/max summed delta per column over every askable set of questions
+
+    The player may stop at any point, so every set closed under "each asked
+    question was available when asked" counts. Exact by search over asked
+    bitmasks for small graphs; otherwise per-question sums (an outer bound).
+    """
+    count = len(deltas)
+    columns = len(deltas[0]) if deltas else 0
+    ranges = [[0, 0] for _ in range(columns)]
+
+    if count > MAX_EXACT_QUESTIONS:
+        for delta in deltas:
+            for column, value in enumerate(delta):
+                ranges[column][value > 0] += value
+        return ranges, False
+
+    unlock_masks = [sum(1 << target for target in targets) for targets in unlocks]
+    start = sum(1 << position for position in initial)
+    seen = {0}
+    stack = [(0, start, [0] * columns)]
+
+    while stack:
+        asked, available, totals = stack.pop()
+        for column, total in enumerate(totals):
+            ranges[column][0] = min(ranges[column][0], total)
+            ranges[column][1] = max(ranges[column][1], total)
+
+        options = available & ~asked
+        while options:
+            low = options & -options
+            options ^= low
+            position = low.bit_length() - 1
+            next_asked = asked | low
+            if next_asked in seen:
+                continue
+            seen.add(next_asked)
+            stack.append((
+                next_asked,
+                available | unlock_masks[position],
+                [total + value for total, value in zip(totals, deltas[position])]
+            ))
+
+    return ranges, True
+
+
+class InterrogationCompiler:
+    def __init__(self):
+        self.errors = []
+        self.warnings = []
+        self.povs = read_stance_povs()
+        # Columns of the stance range analysis
+        self.axes = [(axis, None) for axis in SCALAR_AXES] + \
+            [(axis, pov) for axis in POV_AXES for pov in self.povs[axis]]
+
+    def compile_all(self):
+        print("[InterrogationCompiler] Starting compilation...")
+        print(f"Source: {SOURCE_PATH}")
+        print(f"Output: {INTERROGATION_DIR}")
+
+        if not SOURCE_PATH.exists():
+            self.errors.append(f"Source not found: {SOURCE_PATH}")
+            self.print_report()
+            return
+
+        source = read_json(SOURCE_PATH)
+
+        index = {}
+        compiled = {}
+        for interrogation in source.get("interrogations", []):
+            name = interrogation.get("id", "?")
+            if name in index:
+                self.errors.append(f"duplicate interrogation ID '{name}'")
+                continue
+            result = self.compile_interrogation(interrogation)
+            if result is not None:
+                compiled[name], index[name] = result
+
+        if not self.errors:
+            for name, data in compiled.items():
+                # Compact: runtime-only file, no indentation
+                write_json(INTERROGATION_DIR / index[name]["file"], data)
+
+            write_json(INDEX_PATH, {
+                "version": "1.0",
+                "interrogations": index,
+                "metadata": {
+                    "compiled_at": datetime.now().isoformat(),
+                    "compiler_version": "1.0.0"
+                }
+            }, indent=2)
+
+        self.print_report()
+
+    def validate_stance_change(self, where: str, stance_change: Any) -> bool:
+        if not isinstance(stance_change, dict):
+            self.errors.append(f"{where}: stance_change must be an object")
+            return False
+
+        valid = True
+        for axis, value in stance_change.items():
+            if axis in SCALAR_AXES:
+                deltas = {axis: value}
+            elif axis in POV_AXES:
+                if not isinstance(value, dict):
+                    self.errors.append(f"{where}: {axis} must map POV -> delta")
+                    valid = False
+                    continue
+                unknown = [pov for pov in value if pov not in self.povs[axis]]
+                if unknown:
+                    self.errors.append(f"{where}: {axis} has unknown POV {', '.join(unknown)} "
+                                       f"(GameState: {', '.join(self.povs[axis])})")
+                    valid = False
+                deltas = {f"{axis}.{pov}": delta for pov, delta in value.items()}
+            else:
+                self.errors.append(f"{where}: unknown stance axis '{axis}'")
+                valid = False
+                continue
+
+            for label, delta in deltas.items():
+                if isinstance(delta, bool) or not isinstance(delta, int):
+                    self.errors.append(f"{where}: {label} delta must be an integer, got {delta!r}")
+                    valid = False
+                elif not STANCE_MIN <= delta <= STANCE_MAX:
+                    self.errors.append(f"{where}: {label} delta {delta} is outside {STANCE_MIN}..{STANCE_MAX}")
+                    valid = False
+                elif delta == 0:
+                    self.warnings.append(f"{where}: {label} delta is 0")
+
+        return valid
+
+    def compile_interrogation(self, interrogation: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        name = interrogation.get("id", "?")
+        questions = interrogation.get("questions", [])
+        error_count = len(self.errors)
+        print(f"\n[{name}] {len(questions)} questions")
+
+        for field in ["id", "subject", "context"]:
+            if field not in interrogation:
+                self.errors.append(f"{name}: missing {field}")
+
+        question_index = {}
+        for position, question in enumerate(questions):
+            missing = [field for field in REQUIRED_QUESTION_FIELDS if field not in question]
+            if missing:
+                self.errors.append(f"{name}: question {position} missing {', '.join(missing)}")
+                continue
+            if question["id"] in question_index:
+                self.errors.append(f"{name}: duplicate question ID '{question['id']}'")
+            question_index[question["id"]] = position
+            self.validate_stance_change(f"{name}/{question['id']}", question.get("stance_change", {}))
+
+        if len(self.errors) > error_count:
+            return None
+
+        unlocks = []
+        targeted = set()
+        for question in questions:
+            targets = []
+            for target in question.get("unlocks", []):
+                if target not in question_index:
+                    self.errors.append(f"{name}: '{question['id']}' unlocks unknown question '{target}'")
+                elif target == question["id"]:
+                    self.errors.append(f"{name}: '{question['id']}' unlocks itself")
+                else:
+                    targets.append(question_index[target])
+            unlocks.append(targets)
+            targeted.update(targets)
+
+        initial = [position for position in range(len(questions)) if position not in targeted]
+        if not initial:
+            self.errors.append(f"{name}: no initial questions (every question is unlocked by another)")
+
+        # Any asked question unlocks its targets, so reachability is a BFS
+        reachable = set(initial)
+        queue = deque(initial)
+        while queue:
+            for target in unlocks[queue.popleft()]:
+                if target not in reachable:
+                    reachable.add(target)
+                    queue.append(target)
+
+        unreachable = [questions[position]["id"] for position in range(len(questions)) if position not in reachable]
+        if unreachable:
+            self.errors.append(f"{name}: unreachable questions: {', '.join(unreachable)}")
+
+        if len(self.errors) > error_count:
+            return None
+
+        deltas = [stance_vector(question.get("stance_change", {}), self.axes) for question in questions]
+        ranges, exact = reachable_ranges(initial, unlocks, deltas)
+
+        stance_range = {}
+        for (axis, pov), bounds in zip(self.axes, ranges):
+            if pov is None:
+                stance_range[axis] = bounds
+            elif bounds != [0, 0]:
+                stance_range.setdefault(axis, {})[pov] = bounds
+            if bounds[1] - bounds[0] > STANCE_MAX - STANCE_MIN:
+                label = axis if pov is None else f"{axis}.{pov}"
+                self.warnings.append(f"{name}: {label} can swing {bounds[0]:+d}..{bounds[1]:+d}, "
+                                     f"GameState clamping will absorb part of it")
+
+        for (axis, pov), bounds in zip(self.axes, ranges):
+            if bounds != [0, 0]:
+                label = axis if pov is None else f"{axis}.{pov}"
+                print(f"  [OK] {label}: {bounds[0]:+d}..{bounds[1]:+d}")
+        if not exact:
+            self.warnings.append(f"{name}: more than {MAX_EXACT_QUESTIONS} questions, stance range is an outer bound")
+
+        compiled = {
+            "id": name,
+            "subject": interrogation["subject"],
+            "context": interrogation["context"],
+            "questions": [
+                {
+                    "id": question["id"],
+                    "text": question["text"],
+                    "response": question["response"],
+                    "unlocks": unlocks[position],
+                    "stance_change": question.get("stance_change", {})
+                }
+                for position, question in enumerate(questions)
+            ],
+            "question_index": question_index,
+            "initial": initial
+        }
+
+        entry = {
+            "file": f"{name.lower()}.json",
+            "subject": interrogation["subject"],
+            "questions": len(questions),
+            "stance_range": stance_range,
+            "stance_range_exact": exact
+        }
+
+        return compiled, entry
+
+    def print_report(self):
+        print("\n" + "="*60)
+        print("INTERROGATION COMPILATION REPORT")
+        print("="*60)
+
+        if self.errors:
+            print(f"\n[X] ERRORS ({len(self.errors)}):")
+            for error in self.errors:
+                print(f"  - {error}")
+
+        if self.warnings:
+            print(f"\n[!] WARNINGS ({len(self.warnings)}):")
+            for warning in self.warnings:
+                print(f"  - {warning}")
+
+        if not self.errors:
+            print("\n[OK] Compilation successful!")
+            print(f"   Output: {INDEX_PATH}")
+        else:
+            print("\n[X] Compilation failed!")
+            sys.exit(1)
+
+
+def main():
+    compiler = InterrogationCompiler()
+    compiler.compile_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Locale Compiler
+Flattens every language's ui.json (nested objects or dotted keys) into one
+shared key table and a compact per-language string array indexed by key
+ID, so LanguageManager resolves a key with one dictionary lookup and array
+reads down the fallback chain
+
+The key table is append-only: a key keeps its ID across builds and new keys
+are appended in sorted order. --renumber rebuilds it sorted, dropping keys
+no language defines anymore; --check verifies the committed output is
+current without writing. --benchmark times Python lookups in each layout
+"""
+
+import hashlib
+import sys
+import time
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+
+from json_io import JSONDecodeError, dump_bytes, read_json, write_json
+from profiling import profiler, add_profile_arguments, start_profiling
+
+PROJECT_ROOT = Path(__file__).parent.parent
+LOCALES_DIR = PROJECT_ROOT / "locales"
+REGISTRY_PATH = LOCALES_DIR / "_meta" / "language_registry.json"
+FALLBACK_RULES_PATH = LOCALES_DIR / "_meta" / "fallback_rules.json"
+OUTPUT_DIR = PROJECT_ROOT / "content" / "locales"
+KEY_TABLE_PATH = OUTPUT_DIR / "keys.json"
+
+REFERENCE_LANGUAGE = "english"
+# Lookups per layout in --benchmark
+BENCHMARK_LOOKUPS = 200_000
+
+
+def strings_path(lang: str) -> Path:
+    return OUTPUT_DIR / f"{lang}.json"
+
+
+def keys_hash(keys: List[str]) -> str:
+    """Identifies a key table; string arrays built against another are rejected"""
+    return hashlib.sha256("\n".join(keys).encode('utf-8')).hexdigest()[:16]
+
+
+def flatten(data: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """(dotted key, value) for every leaf of nested objects"""
+    for key, value in data.items():
+        if isinstance(value, dict):
+            yield from flatten(value, f"{prefix}{key}.")
+        else:
+            yield f"{prefix}{key}", value
+
+
+class LocaleCompiler:
+    def __init__(self, renumber: bool = False, check: bool = False):
+        self.renumber = renumber
+        self.check = check
+        self.errors = []
+        self.warnings = []
+        self.languages: Dict[str, Dict[str, str]] = {}
+        self.keys: List[str] = []
+
+    def compile_all(self):
+        print("[LocaleCompiler] Starting compilation...")
+        print(f"Source: {LOCALES_DIR}")
+        print(f"Output: {OUTPUT_DIR}")
+
+        if not REGISTRY_PATH.exists():
+            self.errors.append(f"Language registry not found: {REGISTRY_PATH}")
+            self.print_report()
+            return
+
+        for lang in read_json(REGISTRY_PATH).get("languages", {}):
+            source = LOCALES_DIR / lang / "ui.json"
+            if source.exists():
+                flat = self.flatten_language(lang, source)
+                if flat is not None:
+                    self.languages[lang] = flat
+
+        if REFERENCE_LANGUAGE not in self.languages:
+            self.errors.append(f"{REFERENCE_LANGUAGE}/ui.json is required as the reference language")
+        else:
+            reference = self.languages[REFERENCE_LANGUAGE]
+            for lang, strings in self.languages.items():
+                extra = sorted(key for key in strings if key not in reference)
+                if extra:
+                    self.warnings.append(f"{lang}: {len(extra)} keys not in {REFERENCE_LANGUAGE} "
+                                         f"({', '.join(extra[:3])}{' ...' if len(extra) > 3 else ''})")
+
+        if not self.errors:
+            self.keys = self.update_key_table()
+        if not self.errors:
+            self.write_tables()
+
+        self.print_report()
+
+    @profiler.timed()
+    def flatten_language(self, lang: str, path: Path) -> Optional[Dict[str, str]]:
+        try:
+            data = read_json(path)
+        except JSONDecodeError as e:
+            self.errors.append(f"{lang}: invalid JSON - {e}")
+            return None
+        if not isinstance(data, dict):
+            self.errors.append(f"{lang}: ui.json must be an object")
+            return None
+
+        flat = {}
+        for key, text in flatten(data):
+            if key in flat:
+                # "a.b" written both nested and dotted
+                self.errors.append(f"{lang}: key '{key}' defined twice")
+            elif not isinstance(text, str):
+                self.errors.append(f"{lang}: '{key}' must be a string, got {type(text).__name__}")
+            else:
+                flat[key] = text
+
+        profiler.count("keys flattened", len(flat))
+        return flat
+
+    @profiler.timed()
+    def update_key_table(self) -> List[str]:
+        """Existing keys keep their IDs; new ones are appended sorted
+
+        Retired keys (defined by no language) keep their slot, with null
+        strings, until --renumber.
+        """
+        defined = set()
+        for strings in self.languages.values():
+            defined.update(strings)
+
+        previous = []
+        if KEY_TABLE_PATH.exists():
+            previous = read_json(KEY_TABLE_PATH).get("keys", [])
+            if len(set(previous)) != len(previous):
+                self.errors.append(f"{KEY_TABLE_PATH.name} lists a key twice; rebuild it with --renumber")
+                return []
+
+        if self.renumber:
+            keys = sorted(defined)
+            old_ids = {key: i for i, key in enumerate(previous)}
+            moved = sum(1 for i, key in enumerate(keys) if key in old_ids and old_ids[key] != i)
+            dropped = len(set(previous) - defined)
+            print(f"  [!] Renumbered: {moved} key IDs changed, {dropped} retired keys dropped")
+        else:
+            known = set(previous)
+            keys = previous + sorted(defined - known)
+            retired = [key for key in previous if key not in defined]
+            if retired:
+                self.warnings.append(f"{len(retired)} keys no longer defined, IDs kept "
+                                     f"(--renumber drops them): {', '.join(retired[:3])}{' ...' if len(retired) > 3 else ''}")
+
+        # Stability: every key of the previous build keeps its ID
+        if not self.renumber and keys[:len(previous)] != previous:
+            self.errors.append("key IDs moved between builds")
+
+        if self.check:
+            if keys != previous:
+                self.errors.append(f"{KEY_TABLE_PATH.name} is out of date ({len(keys) - len(previous)} new keys); "
+                                   f"run compile_locales.py")
+            return keys
+
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        write_json(KEY_TABLE_PATH, {
+            "version": "1.0",
+            "keys_hash": keys_hash(keys),
+            "keys": keys,
+            "metadata": {
+                "compiled_at": datetime.now().isoformat(),
+                "key_count": len(keys),
+                "languages": sorted(self.languages)
+            }
+        }, indent=2)
+
+        print(f"  [OK] Key table: {len(keys)} keys" + ("" if self.renumber else f" ({len(keys) - len(previous)} new)"))
+        return keys
+
+    @profiler.timed()
+    def write_tables(self):
+        table_hash = keys_hash(self.keys)
+        expected = set()
+        for lang, strings in sorted(self.languages.items()):
+            path = strings_path(lang)
+            expected.add(path.name)
+            # Compact, no timestamp: unchanged languages rebuild byte-identical
+            encoded = dump_bytes({
+                "language": lang,
+                "keys_hash": table_hash,
+                "strings": [strings.get(key) for key in self.keys]
+            })
+            missing = sum(1 for key in self.keys if key not in strings)
+
+            if self.check:
+                if not path.exists() or path.read_bytes() != encoded:
+                    self.errors.append(f"{path.name} is out of date; run compile_locales.py")
+                continue
+
+            path.write_bytes(encoded)
+            profiler.count("bytes written", len(encoded))
+            print(f"  [OK] {lang}: {len(strings)}/{len(self.keys)} strings, {len(encoded):,} bytes"
+                  + (f" ({missing} untranslated)" if missing else ""))
+
+        stale = sorted(path.name for path in OUTPUT_DIR.glob("*.json")
+                       if path != KEY_TABLE_PATH and path.name not in expected)
+        if stale:
+            self.warnings.append(f"compiled tables without a source: {', '.join(stale)}")
+
+    def benchmark_lookups(self, lookups: int = BENCHMARK_LOOKUPS):
+        """Time one key lookup (with the fallback chain) per layout"""
+        import random
+
+        rules = read_json(FALLBACK_RULES_PATH).get("rules", {}) if FALLBACK_RULES_PATH.exists() else {}
+        lang = max(self.languages, key=lambda name: (len(rules.get(name, [])), name != REFERENCE_LANGUAGE))
+        chain = [lang] + [fallback for fallback in rules.get(lang, []) if fallback in self.languages]
+
+        # Layouts: nested objects walked per dotted segment, flat dicts per
+        # language, and the compiled key table + string arrays
+        nested = {}
+        for name in chain:
+            tree = {}
+            for key, text in self.languages[name].items():
+                node = tree
+                parts = key.split(".")
+                for part in parts[:-1]:
+                    node = node.setdefault(part, {})
+                    if not isinstance(node, dict):
+                        break
+                else:
+                    node.setdefault(parts[-1], text)
+            nested[name] = tree
+        flat = {name: self.languages[name] for name in chain}
+        key_ids = {key: i for i, key in enumerate(self.keys)}
+        arrays = [[self.languages[name].get(key) for key in self.keys] for name in chain]
+
+        rng = random.Random(14)
+        sample = [rng.choice(self.keys) for _ in range(lookups)]
+        sample_ids = [key_ids[key] for key in sample]
+
+        def walk_nested(key: str) -> Optional[str]:
+            for name in chain:
+                node = nested[name]
+                for part in key.split("."):
+                    node = node.get(part) if isinstance(node, dict) else None
+                    if node is None:
+                        break
+                if isinstance(node, str):
+                    return node
+            return None
+
+        def flat_chain(key: str) -> Optional[str]:
+            for name in chain:
+                text = flat[name].get(key)
+                if text is not None:
+                    return text
+            return None
+
+        def indexed(key: str) -> Optional[str]:
+            key_id = key_ids.get(key, -1)
+            if key_id >= 0:
+                for strings in arrays:
+                    text = strings[key_id]
+                    if text is not None:
+                        return text
+            return None
+
+        def by_id(key_id: int) -> Optional[str]:
+            for strings in arrays:
+                text = strings[key_id]
+                if text is not None:
+                    return text
+            return None
+
+        print("\n" + "="*60)
+        print(f"LOOKUP BENCHMARK ({lookups:,} lookups, {len(self.keys)} keys, chain {' -> '.join(chain)})")
+        print("="*60)
+
+        results = []
+        for label, function, inputs in [
+            ("nested walk (dotted path)", walk_nested, sample),
+            ("flat dict per language", flat_chain, sample),
+            ("key ID + string arrays", indexed, sample),
+            ("pre-resolved key ID", by_id, sample_ids),
+        ]:
+            start = time.perf_counter()
+            for item in inputs:
+                function(item)
+            seconds = time.perf_counter() - start
+            results.append((label, seconds))
+
+        baseline = results[0][1]
+        for label, seconds in results:
+            print(f"  {label:<28} {seconds / lookups * 1e9:>8.0f} ns/lookup  {baseline / seconds:>5.1f}x")
+
+        per_language = sum(len(dump_bytes(strings)) for strings in self.languages.values())
+        compiled = len(dump_bytes(self.keys)) + sum(len(dump_bytes([strings.get(key) for key in self.keys]))
+                                                    for strings in self.languages.values())
+        print(f"\n  Keys in every language file: {per_language:,} bytes; shared key table: {compiled:,} bytes")
+
+    def print_report(self):
+        print("\n" + "="*60)
+        print("LOCALE COMPILATION REPORT")
+        print("="*60)
+
+        if self.errors:
+            print(f"\n[X] ERRORS ({len(self.errors)}):")
+            for error in self.errors:
+                print(f"  - {error}")
+
+        if self.warnings:
+            print(f"\n[!] WARNINGS ({len(self.warnings)}):")
+            for warning in self.warnings:
+                print(f"  - {warning}")
+
+        if not self.errors:
+            print("\n[OK] Locale tables are up to date" if self.check else "\n[OK] Compilation successful!")
+            print(f"   Output: {OUTPUT_DIR}")
+        else:
+            print("\n[X] Compilation failed!")
+            sys.exit(1)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compile locales into a shared key table and per-language string arrays")
+    parser.add_argument("--check", action="store_true", help="Verify the compiled tables are current; write nothing")
+    parser.add_argument("--renumber", action="store_true", help="Rebuild the key table sorted, dropping retired keys (changes key IDs)")
+    parser.add_argument("--benchmark", action="store_true", help="Time Python lookups: nested, flat and indexed layouts")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    start_profiling("compile_locales", args)
+
+    compiler = LocaleCompiler(renumber=args.renumber, check=args.check)
+    compiler.compile_all()
+    if args.benchmark:
+        compiler.benchmark_lookups()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Vocabulary Compiler
+Validates vocabulary sources and emits a language -> level -> word ID index
+so VocabularyManager can fetch the words for a level without scanning,
+plus ranked quiz distractors per word
+"""
+
+import heapq
+import sys
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Any, Tuple
+
+from json_io import JSONDecodeError, read_json, write_json
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CONTENT_DIR = PROJECT_ROOT / "content"
+VOCAB_DB_PATH = CONTENT_DIR / "vocabulary" / "vocab_database.json"
+SIDE_DIR = CONTENT_DIR / "side"
+SRS_CONFIG_PATH = SIDE_DIR / "srs_config.json"
+OUTPUT_PATH = CONTENT_DIR / "vocabulary" / "vocab_index.json"
+
+# Internal level scale shared with VocabularyManager.INTERNAL_TO_EXTERNAL
+MIN_LEVEL = 1
+MAX_LEVEL = 12
+
+REQUIRED_WORD_FIELDS = ["word", "translation", "level"]
+REQUIRED_SIDE_FIELDS = ["id", "term", "definition", "difficulty"]
+REQUIRED_TIER_FIELDS = ["newPerDay", "reviewPerDay"]
+
+# Quiz distractors: ranked candidates per word, nearest level first
+DISTRACTOR_CANDIDATES = 6
+DISTRACTOR_LEVEL_WINDOW = 2
+# Translations this similar to the answer read as synonyms, not distractors
+MAX_DISTRACTOR_SIMILARITY = 0.5
+
+
+class DuplicateKeyError(ValueError):
+    pass
+
+
+def _reject_duplicate_keys(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """json object hook - plain json.load silently keeps the last duplicate"""
+    result = {}
+    for key, value in pairs:
+        if key in result:
+            raise DuplicateKeyError(f"duplicate key '{key}'")
+        result[key] = value
+    return result
+
+
+def load_strict_json(path: Path) -> Any:
+    # The hook needs the standard library parser; accelerated ones cannot report duplicates
+    return read_json(path, object_pairs_hook=_reject_duplicate_keys)
+
+
+def is_level(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and MIN_LEVEL <= value <= MAX_LEVEL
+
+
+def build_level_index(entries: Dict[str, int]) -> Dict[str, Any]:
+    """Sort IDs by level and compute prefix counts
+
+    level_end[L] is the number of words with level <= L, so the words
+    available at level L are word_ids[0:level_end[L]].
+    """
+    word_ids = sorted(entries, key=lambda word_id: (entries[word_id], word_id))
+
+    counts = [0] * (MAX_LEVEL + 1)
+    for level in entries.values():
+        counts[level] += 1
+
+    level_end = []
+    running = 0
+    for count in counts:
+        running += count
+        level_end.append(running)
+
+    return {
+        "word_ids": word_ids,
+        "level_end": level_end
+    }
+
+
+def _bigrams(text: str) -> set:
+    text = f" {text.lower().strip()} "
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def translation_similarity(a: set, b: set) -> float:
+    """Jaccard similarity of character bigram sets"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def build_distractor_table(word_ids: List[str], lang_vocab: Dict[str, Any]) -> List[List[int]]:
+    """Rank distractor candidates for every word
+
+    Returns one list per entry of word_ids, holding positions into word_ids.
+    Candidates share the answer's part of speech where possible, sit within
+    DISTRACTOR_LEVEL_WINDOW levels, and are ordered by (part of speech
+    mismatch, level distance, translation similarity).
+
+    Words are bucketed by (level, part of speech), and the (mismatch,
+    distance) groups are visited in rank order until DISTRACTOR_CANDIDATES
+    are found, so a word usually only scores its own bucket.
+    """
+    position = {word_id: i for i, word_id in enumerate(word_ids)}
+    bigrams = {word_id: _bigrams(lang_vocab[word_id]["translation"]) for word_id in word_ids}
+    translations = {word_id: lang_vocab[word_id]["translation"].strip().lower() for word_id in word_ids}
+
+    # level -> part of speech -> word IDs
+    buckets: Dict[int, Dict[str, List[str]]] = {}
+    for word_id in word_ids:
+        word = lang_vocab[word_id]
+        buckets.setdefault(word["level"], {}).setdefault(word.get("part_of_speech", ""), []).append(word_id)
+
+    table = []
+    for word_id in word_ids:
+        word = lang_vocab[word_id]
+        pos = word.get("part_of_speech", "")
+
+        chosen = []
+        for pos_mismatch in (False, True):
+            for distance in range(DISTRACTOR_LEVEL_WINDOW + 1):
+                needed = DISTRACTOR_CANDIDATES - len(chosen)
+                if not needed:
+                    break
+                scored = []
+                for level in {word["level"] - distance, word["level"] + distance}:
+                    for other_pos, others in buckets.get(level, {}).items():
+                        if (other_pos != pos) != pos_mismatch:
+                            continue
+                        for other_id in others:
+                            if other_id == word_id or translations[other_id] == translations[word_id]:
+                                continue
+                            similarity = translation_similarity(bigrams[word_id], bigrams[other_id])
+                            if similarity <= MAX_DISTRACTOR_SIMILARITY:
+                                scored.append((similarity, other_id))
+                chosen.extend(other_id for _, other_id in heapq.nsmallest(needed, scored))
+
+        table.append([position[other_id] for other_id in chosen])
+
+    return table
+
+
+class VocabCompiler:
+    def __init__(self):
+        self.errors = []
+        self.warnings = []
+        # word ID -> source, across every vocabulary file
+        self.seen_ids = {}
+
+    def compile_all(self):
+        """Validate all vocabulary sources and write the index"""
+        print("[VocabCompiler] Starting compilation...")
+        print(f"Output: {OUTPUT_PATH}")
+
+        database = self.load_source(VOCAB_DB_PATH)
+        side_vocab = {path.name: self.load_source(path) for path in sorted(SIDE_DIR.glob("vocab*.json"))}
+        srs_config = self.load_source(SRS_CONFIG_PATH)
+
+        index = {
+            "version": "1.0",
+            "min_level": MIN_LEVEL,
+            "max_level": MAX_LEVEL,
+            "languages": {},
+            "side": {},
+            "metadata": {
+                "compiled_at": datetime.now().isoformat(),
+                "compiler_version": "1.0.0"
+            }
+        }
+
+        print("\n[Database] Validating...")
+        if database is not None:
+            index["languages"] = self.compile_database(database)
+
+        print("\n[Side Vocabulary] Validating...")
+        for name, data in side_vocab.items():
+            if data is not None:
+                compiled = self.compile_side_vocab(name, data)
+                if compiled is not None:
+                    index["side"][name] = compiled
+
+        print("\n[SRS Config] Validating...")
+        if srs_config is not None:
+            self.validate_srs_config(srs_config)
+
+        if not self.errors:
+            write_json(OUTPUT_PATH, index, indent=2)
+
+        self.print_report()
+
+    def load_source(self, path: Path) -> Any:
+        if not path.exists():
+            self.errors.append(f"Source not found: {path}")
+            return None
+
+        try:
+            return load_strict_json(path)
+        except (JSONDecodeError, DuplicateKeyError) as e:
+            self.errors.append(f"{path.name}: invalid JSON - {e}")
+            return None
+
+    def register_id(self, word_id: str, source: str):
+        """IDs must be globally unique: mastered_words stores bare IDs"""
+        if word_id in self.seen_ids:
+            self.errors.append(f"{source}: duplicate word ID '{word_id}' (also in {self.seen_ids[word_id]})")
+        else:
+            self.seen_ids[word_id] = source
+
+    def compile_database(self, database: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate vocab_database.json and index it per language"""
+        languages = {}
+
+        for lang, lang_vocab in database.items():
+            if not isinstance(lang_vocab, dict):
+                self.errors.append(f"vocab_database.json: '{lang}' must map word IDs to entries")
+                continue
+
+            levels = {}
+            for word_id, word_data in lang_vocab.items():
+                source = f"vocab_database.json [{lang}]"
+                self.register_id(word_id, source)
+
+                missing = [field for field in REQUIRED_WORD_FIELDS if field not in word_data]
+                if missing:
+                    self.errors.append(f"{source} {word_id}: missing {', '.join(missing)}")
+                    continue
+
+                if not is_level(word_data["level"]):
+                    self.errors.append(f"{source} {word_id}: level {word_data['level']!r} outside {MIN_LEVEL}-{MAX_LEVEL}")
+                    continue
+
+                wrong_type = [field for field in ["word", "translation", "part_of_speech"]
+                              if field in word_data and not isinstance(word_data[field], str)]
+                if wrong_type:
+                    self.errors.append(f"{source} {word_id}: {', '.join(wrong_type)} must be a string")
+                    continue
+
+                if not word_data.get("part_of_speech"):
+                    self.warnings.append(f"{source} {word_id}: no part_of_speech")
+
+                levels[word_id] = word_data["level"]
+
+            compiled = build_level_index(levels)
+            compiled["distractors"] = build_distractor_table(compiled["word_ids"], lang_vocab)
+            languages[lang] = compiled
+
+            short = sum(1 for candidates in compiled["distractors"] if len(candidates) < 3)
+            if short:
+                self.warnings.append(f"vocab_database.json [{lang}]: {short} words have fewer than 3 distractors")
+            print(f"  [OK] {lang}: {len(levels)} words")
+
+        return languages
+
+    def compile_side_vocab(self, name: str, data: Dict[str, Any]) -> Any:
+        """Validate a side-story word list and index it by difficulty"""
+        items = data.get("items")
+        if not isinstance(items, list):
+            self.errors.append(f"{name}: missing 'items' list")
+            return None
+
+        difficulties = {}
+        for position, item in enumerate(items):
+            missing = [field for field in REQUIRED_SIDE_FIELDS if field not in item]
+            if missing:
+                self.errors.append(f"{name} item {position}: missing {', '.join(missing)}")
+                continue
+
+            self.register_id(item["id"], name)
+
+            if not is_level(item["difficulty"]):
+                self.errors.append(f"{name} {item['id']}: difficulty {item['difficulty']!r} outside {MIN_LEVEL}-{MAX_LEVEL}")
+                continue
+
+            difficulties[item["id"]] = item["difficulty"]
+
+        print(f"  [OK] {name}: {len(difficulties)} items")
+
+        compiled = build_level_index(difficulties)
+        compiled["language"] = data.get("language", "")
+        return compiled
+
+    def validate_srs_config(self, config: Dict[str, Any]):
+        tiers = config.get("tiers")
+        if not isinstance(tiers, dict) or not tiers:
+            self.errors.append("srs_config.json: missing 'tiers'")
+            return
+
+        for tier_name, tier in tiers.items():
+            for field in REQUIRED_TIER_FIELDS:
+                value = tier.get(field)
+                if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
+                    self.errors.append(f"srs_config.json {tier_name}: '{field}' must be a positive integer")
+
+            if tier.get("reviewPerDay", 0) < tier.get("newPerDay", 0):
+                self.warnings.append(f"srs_config.json {tier_name}: reviewPerDay below newPerDay, review queue will grow")
+
+        print(f"  [OK] {len(tiers)} tiers")
+
+    def print_report(self):
+        """Print compilation report"""
+        print("\n" + "="*60)
+        print("VOCABULARY COMPILATION REPORT")
+        print("="*60)
+
+        if self.errors:
+            print(f"\n[X] ERRORS ({len(self.errors)}):")
+            for error in self.errors:
+                print(f"  - {error}")
+
+        if self.warnings:
+            print(f"\n[!] WARNINGS ({len(self.warnings)}):")
+            for warning in self.warnings:
+                print(f"  - {warning}")
+
+        if not self.errors:
+            print("\n[OK] Compilation successful!")
+            print(f"   Output: {OUTPUT_PATH}")
+        else:
+            print("\n[X] Compilation failed!")
+            sys.exit(1)
+
+
+def main():
+    compiler = VocabCompiler()
+    compiler.compile_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Content Pack - Single-file container for shipped JSON content
+Writer used by export_demo_full.py and an mmap reader that loads any entry
+without touching the others; src/core/ContentPack.gd reads the same format
+
+Layout (little-endian):
+
+    header      MAGIC, u16 FORMAT_VERSION, u16 alignment, u32 entry count,
+                u32 names size, u64 reserved
+    index       one INDEX_RECORD per entry, sorted by path (byte order)
+    names       UTF-8 paths, concatenated
+    payloads    each starts on an `alignment` boundary
+
+    INDEX_RECORD: u32 name offset, u16 name length, u8 compression, u8 pad,
+                  u64 payload offset, u32 stored size, u32 size,
+                  32-byte SHA-256 of the uncompressed data
+
+Compressed entries are zlib streams (Godot's COMPRESSION_DEFLATE).
+"""
+
+import hashlib
+import mmap
+import struct
+import sys
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+
+from json_io import loads
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+MAGIC = b"WLCP"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHIIQ")
+INDEX_RECORD = struct.Struct("<IHBxQII32s")
+
+COMPRESSION_NONE = 0
+COMPRESSION_DEFLATE = 1
+DEFAULT_ALIGNMENT = 16
+# Only keep compression that saves at least this fraction
+MIN_COMPRESSION_SAVING = 0.1
+
+# Loose files that make up a flavor's pack, relative to PROJECT_ROOT
+SHARED_ENTRIES = [
+    "content/manifest.json",
+    "content/story_index.player.json",
+    "content/main/node_table.json",
+    "content/achievements/achievement_table.json",
+    "content/main/endings.json",
+    "content/vocabulary/vocab_database.json",
+    "content/vocabulary/vocab_index.json",
+    "content/vocabulary/injection_index.json",
+    "content/evidence/evidence_index.json",
+    "content/interrogation/*.json",
+    "content/side/srs_config.json",
+    "content/side/vocab*.json",
+    "locales/_meta/*.json",
+    "content/locales/*.json",
+]
+
+
+class ContentPackError(ValueError):
+    pass
+
+
+def _align(offset: int, alignment: int) -> int:
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def collect_entries(chapters: List[int], cases: List[int], flavor: str = "full") -> Dict[str, bytes]:
+    """Pack entries for a flavor: shared content plus its chapters, cases and achievements"""
+    paths = []
+    for pattern in SHARED_ENTRIES:
+        paths.extend(sorted(PROJECT_ROOT.glob(pattern)))
+    paths.append(PROJECT_ROOT / "content" / "achievements" / f"achievements_{flavor}.json")
+    paths.extend(PROJECT_ROOT / "content" / "main" / f"chapter_{chapter}.json" for chapter in chapters)
+    paths.extend(PROJECT_ROOT / "content" / "side" / f"case_{case}.json" for case in cases)
+
+    # Author-only sources never ship
+    excluded = {"content/interrogation/interrogations.json"}
+    entries = {}
+    for path in paths:
+        name = path.relative_to(PROJECT_ROOT).as_posix()
+        if path.exists() and name not in excluded:
+            entries[name] = path.read_bytes()
+    return entries
+
+
+def build_pack(entries: Dict[str, bytes], compress: bool = False, alignment: int = DEFAULT_ALIGNMENT) -> bytes:
+    """Serialize entries (path -> bytes) into a pack"""
+    if alignment < 1 or alignment & (alignment - 1):
+        raise ContentPackError(f"alignment must be a power of two, got {alignment}")
+
+    names = sorted(entries, key=lambda name: name.encode('utf-8'))
+    encoded_names = [name.encode('utf-8') for name in names]
+    names_blob = b"".join(encoded_names)
+
+    offset = _align(HEADER.size + INDEX_RECORD.size * len(names) + len(names_blob), alignment)
+    records = []
+    payloads = []
+    name_offset = 0
+
+    for name, encoded in zip(names, encoded_names):
+        data = entries[name]
+        stored, compression = data, COMPRESSION_NONE
+        if compress:
+            packed = zlib.compress(data, 9)
+            if len(packed) <= len(data) * (1 - MIN_COMPRESSION_SAVING):
+                stored, compression = packed, COMPRESSION_DEFLATE
+
+        records.append(INDEX_RECORD.pack(
+            name_offset, len(encoded), compression, offset, len(stored), len(data), hashlib.sha256(data).digest()
+        ))
+        payloads.append((offset, stored))
+        name_offset += len(encoded)
+        offset = _align(offset + len(stored), alignment)
+
+    out = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, alignment, len(names), len(names_blob), 0))
+    out += b"".join(records)
+    out += names_blob
+    for payload_offset, stored in payloads:
+        out += b"\0" * (payload_offset - len(out))
+        out += stored
+    return bytes(out)
+
+
+def write_pack(path: Path, entries: Dict[str, bytes], compress: bool = False, alignment: int = DEFAULT_ALIGNMENT) -> int:
+    data = build_pack(entries, compress, alignment)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return len(data)
+
+
+class ContentPack:
+    """mmap-backed reader; lookups binary-search the index in place"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.file = open(path, 'rb')
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise ContentPackError(f"{path}: empty file")
+
+        if len(self.map) < HEADER.size:
+            self.close()
+            raise ContentPackError(f"{path}: truncated header")
+        magic, version, self.alignment, self.count, names_size, _ = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ContentPackError(f"{path}: not a content pack")
+        if version != FORMAT_VERSION:
+            self.close()
+            raise ContentPackError(f"{path}: unsupported pack version {version}")
+
+        self.names_start = HEADER.size + INDEX_RECORD.size * self.count
+        if self.names_start + names_size > len(self.map):
+            self.close()
+            raise ContentPackError(f"{path}: truncated index")
+
+    def __enter__(self) -> "ContentPack":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        if not self.map.closed:
+            self.map.close()
+        self.file.close()
+
+    def _record(self, i: int) -> Tuple[bytes, int, int, int, int, bytes]:
+        name_offset, name_length, compression, offset, stored, size, digest = \
+            INDEX_RECORD.unpack_from(self.map, HEADER.size + INDEX_RECORD.size * i)
+        start = self.names_start + name_offset
+        return self.map[start:start + name_length], compression, offset, stored, size, digest
+
+    def _find(self, name: str) -> Optional[int]:
+        key = name.encode('utf-8')
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._record(middle)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count and self._record(low)[0] == key:
+            return low
+        return None
+
+    def __contains__(self, name: str) -> bool:
+        return self._find(name) is not None
+
+    def names(self) -> Iterator[str]:
+        for i in range(self.count):
+            yield self._record(i)[0].decode('utf-8')
+
+    def info(self, name: str) -> Dict[str, Any]:
+        i = self._find(name)
+        if i is None:
+            raise KeyError(name)
+        _, compression, offset, stored, size, digest = self._record(i)
+        return {"compression": compression, "offset": offset, "stored": stored, "size": size, "sha256": digest.hex()}
+
+    def read(self, name: str, verify: bool = False) -> bytes:
+        i = self._find(name)
+        if i is None:
+            raise KeyError(name)
+        _, compression, offset, stored, size, digest = self._record(i)
+        if offset + stored > len(self.map):
+            raise ContentPackError(f"{name}: payload past end of pack")
+
+        data = self.map[offset:offset + stored]
+        if compression == COMPRESSION_DEFLATE:
+            data = zlib.decompress(data)
+        elif compression != COMPRESSION_NONE:
+            raise ContentPackError(f"{name}: unknown compression {compression}")
+
+        if len(data) != size or (verify and hashlib.sha256(data).digest() != digest):
+            raise ContentPackError(f"{name}: corrupt entry")
+        return data
+
+    def read_json(self, name: str) -> Any:
+        return loads(self.read(name))
+
+    def verify(self) -> List[str]:
+        """Entries whose data does not match the index"""
+        errors = []
+        previous = None
+        for name in self.names():
+            if previous is not None and name.encode('utf-8') <= previous.encode('utf-8'):
+                errors.append(f"{name}: index not sorted")
+            previous = name
+            try:
+                self.read(name, verify=True)
+            except (ContentPackError, zlib.error) as e:
+                errors.append(str(e))
+        return errors
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build and inspect content packs")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="Pack shipped content (all chapters and cases)")
+    build_parser.add_argument("output", type=Path)
+    build_parser.add_argument("--compress", action="store_true", help="Deflate entries where it saves space")
+    build_parser.add_argument("--alignment", type=int, default=DEFAULT_ALIGNMENT, help="Payload alignment in bytes")
+
+    for name, help_text in [("list", "List entries"), ("verify", "Check every entry against its hash")]:
+        subparsers.add_parser(name, help=help_text).add_argument("pack", type=Path)
+
+    cat_parser = subparsers.add_parser("cat", help="Print one entry")
+    cat_parser.add_argument("pack", type=Path)
+    cat_parser.add_argument("name")
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        entries = collect_entries(list(range(1, 8)), [1, 2, 3])
+        size = write_pack(args.output, entries, args.compress, args.alignment)
+        loose = sum(len(data) for data in entries.values())
+        print(f"[OK] {args.output}: {len(entries)} entries, {size:,} bytes (loose files: {loose:,})")
+        return
+
+    try:
+        pack = ContentPack(args.pack)
+    except (OSError, ContentPackError) as e:
+        print(f"[X] {e}")
+        sys.exit(1)
+
+    with pack:
+        if args.command == "list":
+            for name in pack.names():
+                info = pack.info(name)
+                marker = "z" if info["compression"] else " "
+                print(f"  {marker} {info['size']:>10,} {info['stored']:>10,}  {name}")
+            print(f"{pack.count} entries")
+
+        elif args.command == "verify":
+            start = time.perf_counter()
+            errors = pack.verify()
+            elapsed = time.perf_counter() - start
+            for error in errors:
+                print(f"  [X] {error}")
+            if errors:
+                sys.exit(1)
+            print(f"[OK] {pack.count} entries verified in {elapsed * 1000:.1f} ms")
+
+        else:
+            try:
+                sys.stdout.buffer.write(pack.read(args.name))
+            except KeyError:
+                print(f"[X] No entry '{args.name}'")
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
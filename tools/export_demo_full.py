@@ -6,16 +6,21 @@ Handles content filtering and build configuration
 
 import os
 import sys
-import json
 import shutil
 import subprocess
 from pathlib import Path
 from datetime import datetime
 
+from content_pack import collect_entries, write_pack
+from export_web import export_web
+from json_io import dump_bytes, loads, minify, write_json
+from profiling import profiler, add_profile_arguments, start_profiling
+
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
 EXPORT_DIR = PROJECT_ROOT / "export"
 CONTENT_DIR = PROJECT_ROOT / "content"
+PACK_NAME = "content.pack"
 
 # Build configurations
 DEMO_CONFIG = {
@@ -60,64 +65,57 @@ def create_export_dirs():
     return demo_dir, full_dir
 
 
-def filter_content(config, output_dir):
-    """Filter content based on build configuration"""
-    print(f"[Export] Filtering content for {config['build_flavor']}...")
+@profiler.timed()
+def filter_content(config, output_dir, compress=True, pretty=False):
+    """Write the flavor's content as a single pack (see content_pack.py)
 
-    content_output = output_dir / "content"
-    content_output.mkdir(parents=True, exist_ok=True)
+    JSON entries are minified unless pretty is set (review builds).
+    """
+    print(f"[Export] Packing content for {config['build_flavor']}...")
 
-    # Copy main story chapters
-    main_dir = content_output / "main"
-    main_dir.mkdir(exist_ok=True)
+    entries = collect_entries(config["chapters"], config["side_stories"], config["build_flavor"])
 
-    for chapter in config["chapters"]:
-        src = CONTENT_DIR / "main" / f"chapter_{chapter}.json"
-        if src.exists():
-            dst = main_dir / f"chapter_{chapter}.json"
-            shutil.copy2(src, dst)
-            print(f"[OK] Copied chapter {chapter}")
-
-    # Copy manifest (filtered)
-    manifest_src = CONTENT_DIR / "main" / "manifest.json"
-    if manifest_src.exists():
-        with open(manifest_src, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
-
-        # Filter chapters
+    # Filter manifest down to the packed chapters and cases
+    manifest_name = "content/manifest.json"
+    if manifest_name in entries:
+        manifest = loads(entries[manifest_name])
+        case_ids = {f"CASE_{case_num:03d}" for case_num in config["side_stories"]}
         manifest["chapters"] = [
             ch for ch in manifest["chapters"]
             if ch["chapter"] in config["chapters"]
         ]
-
-        manifest_dst = main_dir / "manifest.json"
-        with open(manifest_dst, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        manifest["cases"] = [
+            case for case in manifest.get("cases", [])
+            if case["case_id"] in case_ids
+        ]
+        entries[manifest_name] = dump_bytes(manifest, indent=2)
         print("[OK] Filtered manifest")
 
-    # Copy side stories
-    side_dir = content_output / "side"
-    side_dir.mkdir(exist_ok=True)
+    loose = sum(len(data) for data in entries.values())
+    if not pretty:
+        with profiler.phase("minify"):
+            for name, data in entries.items():
+                if name.endswith(".json"):
+                    entries[name] = minify(data)
 
+    for chapter in config["chapters"]:
+        if f"content/main/chapter_{chapter}.json" not in entries:
+            print(f"[!] Chapter {chapter} not found")
     for case_num in config["side_stories"]:
-        src = CONTENT_DIR / "side" / f"case_{case_num}.json"
-        if src.exists():
-            dst = side_dir / f"case_{case_num}.json"
-            shutil.copy2(src, dst)
-            print(f"[OK] Copied side story {case_num}")
-
-    # Copy vocabulary (full for both versions)
-    vocab_dir = content_output / "vocabulary"
-    vocab_dir.mkdir(exist_ok=True)
-
-    vocab_src = CONTENT_DIR / "vocabulary" / "vocab_database.json"
-    if vocab_src.exists():
-        shutil.copy2(vocab_src, vocab_dir / "vocab_database.json")
-        print("[OK] Copied vocabulary database")
-
+        if f"content/side/case_{case_num}.json" not in entries:
+            print(f"[!] Side story {case_num} not found")
+
+    pack_path = output_dir / PACK_NAME
+    with profiler.phase("write_pack"):
+        size = write_pack(pack_path, entries, compress=compress)
+    profiler.count("entries packed", len(entries))
+    profiler.count("bytes read", loose)
+    profiler.count("bytes written", size)
+    print(f"[OK] {pack_path.name}: {len(entries)} entries, {size:,} bytes (loose: {loose:,})")
     print(f"[OK] Content filtered for {config['build_flavor']}")
 
 
+@profiler.timed()
 def update_build_config(config, output_dir):
     """Update GameState.gd with build configuration"""
     print(f"[Export] Updating build configuration...")
@@ -135,12 +133,12 @@ def update_build_config(config, output_dir):
     }
 
     config_path = output_dir / "build_config.json"
-    with open(config_path, 'w', encoding='utf-8') as f:
-        json.dump(build_config, f, indent=2)
+    write_json(config_path, build_config, indent=2)
 
     print(f"[OK] Build config written to {config_path}")
 
 
+@profiler.timed()
 def export_godot(config, output_dir, preset_name):
     """Export using Godot"""
     print(f"[Export] Exporting with Godot preset: {preset_name}...")
@@ -198,6 +196,7 @@ def export_godot(config, output_dir, preset_name):
         return False
 
 
+@profiler.timed()
 def create_readme(config, output_dir):
     """Create README for the build"""
     print("[Export] Creating README...")
@@ -252,11 +251,16 @@ def main():
     parser.add_argument("--demo", action="store_true", help="Export demo version")
     parser.add_argument("--full", action="store_true", help="Export full version")
     parser.add_argument("--both", action="store_true", help="Export both versions")
+    parser.add_argument("--web", action="store_true", help="Export the browser demo to export/web (see export_web.py)")
+    parser.add_argument("--no-compress", action="store_true", help="Store pack entries uncompressed")
+    parser.add_argument("--pretty", action="store_true", help="Keep packed JSON indented (review builds)")
+    add_profile_arguments(parser)
 
     args = parser.parse_args()
+    start_profiling("export_demo_full", args)
 
-    if not (args.demo or args.full or args.both):
-        print("Usage: python export_demo_full.py [--demo] [--full] [--both]")
+    if not (args.demo or args.full or args.both or args.web):
+        print("Usage: python export_demo_full.py [--demo] [--full] [--both] [--web]")
         sys.exit(1)
 
     print_header("GAME EXPORT TOOL")
@@ -264,26 +268,39 @@ def main():
 
     # Create export directories
     demo_dir, full_dir = create_export_dirs()
+    web_passed = True
 
     # Export demo
     if args.demo or args.both:
         print_header("EXPORTING DEMO VERSION")
-        filter_content(DEMO_CONFIG, demo_dir)
-        update_build_config(DEMO_CONFIG, demo_dir)
-        create_readme(DEMO_CONFIG, demo_dir)
-        export_godot(DEMO_CONFIG, demo_dir, "Windows Desktop (Demo)")
+        with profiler.phase("demo"):
+            filter_content(DEMO_CONFIG, demo_dir, not args.no_compress, args.pretty)
+            update_build_config(DEMO_CONFIG, demo_dir)
+            create_readme(DEMO_CONFIG, demo_dir)
+            export_godot(DEMO_CONFIG, demo_dir, "Windows Desktop (Demo)")
 
     # Export full
     if args.full or args.both:
         print_header("EXPORTING FULL VERSION")
-        filter_content(FULL_CONFIG, full_dir)
-        update_build_config(FULL_CONFIG, full_dir)
-        create_readme(FULL_CONFIG, full_dir)
-        export_godot(FULL_CONFIG, full_dir, "Windows Desktop (Full)")
+        with profiler.phase("full"):
+            filter_content(FULL_CONFIG, full_dir, not args.no_compress, args.pretty)
+            update_build_config(FULL_CONFIG, full_dir)
+            create_readme(FULL_CONFIG, full_dir)
+            export_godot(FULL_CONFIG, full_dir, "Windows Desktop (Full)")
+
+    # Export web
+    if args.web:
+        print_header("EXPORTING WEB VERSION")
+        with profiler.phase("web"):
+            web_passed = export_web(EXPORT_DIR / "web")
 
     print_header("EXPORT COMPLETE")
     print(f"Demo: {demo_dir}")
     print(f"Full: {full_dir}")
+    if args.web:
+        print(f"Web:  {EXPORT_DIR / 'web'}")
+    if not web_passed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""
+Web Export - Builds the browser demo from raw/index.html and its bundles
+Ships only the hashed bundles index.html reaches (stale ones are reported,
+or deleted with --prune), self-hosts subsetted fonts in place of Google
+Fonts, writes .gz/.br variants and a cache manifest that marks
+content-hashed files immutable
+"""
+
+import gzip
+import hashlib
+import html
+import importlib.util
+import mimetypes
+import re
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlencode
+
+from json_io import read_json, write_json
+from profiling import profiler, add_profile_arguments, start_profiling
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+PROJECT_ROOT = Path(__file__).parent.parent
+WEB_INDEX_PATH = PROJECT_ROOT / "raw" / "index.html"
+WEB_ASSETS_DIR = PROJECT_ROOT / "assets"
+FONT_DIR = PROJECT_ROOT / "assets" / "fonts"
+OUTPUT_DIR = PROJECT_ROOT / "export" / "web"
+CACHE_MANIFEST_NAME = "cache_manifest.json"
+
+# Vite output: <name>-<8 character content hash>.<ext>
+HASHED_FILE = re.compile(r"^[\w.-]+-[A-Za-z0-9_-]{8}\.(?:js|mjs|css|woff2|woff|ttf|otf)$")
+ASSET_REFERENCE = re.compile(r'(?:src|href)="/assets/([^"]+)"')
+
+# Files the front end fetches at runtime: (source glob, destination directory)
+WEB_DATA = [
+    ("content/story_index.json", "content"),
+    ("content/side/vocab.json", "content/side"),
+    ("manifest.json", "assets"),
+    ("placeholders/*.svg", "assets/placeholders"),
+]
+
+GOOGLE_FONTS_LINK = re.compile(r'([ \t]*)<link href="https://fonts\.googleapis\.com/css2\?([^"]+)" rel="stylesheet">\n?')
+GOOGLE_PRECONNECT = re.compile(r'[ \t]*<link rel="preconnect" href="https://fonts\.(?:googleapis|gstatic)\.com"[^>]*>\n?')
+# Which registry scripts each family in the Google Fonts link renders
+WEB_FONT_SCRIPTS = {
+    "Noto Serif SC": {"Hans", "Hant"},
+    "Noto Serif JP": {"Jpan"},
+    "Noto Serif KR": {"Kore"},
+    "Noto Serif": {"Latn", "Cyrl", "Grek"},
+    "Noto Naskh Arabic": {"Arab"},
+}
+FONT_EXTENSIONS = {".ttf", ".otf", ".ttc", ".otc"}
+
+COMPRESSIBLE = {".html", ".js", ".mjs", ".css", ".json", ".svg", ".txt", ".md", ".xml", ".ttf", ".otf"}
+# Below this a precompressed variant is not worth the extra file
+MIN_PRECOMPRESS_SIZE = 256
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+CONTENT_TYPES = {
+    ".js": "text/javascript", ".mjs": "text/javascript", ".json": "application/json",
+    ".woff2": "font/woff2", ".woff": "font/woff", ".md": "text/markdown",
+}
+
+
+def content_type(path: Path) -> str:
+    kind = CONTENT_TYPES.get(path.suffix) or mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    if kind.startswith("text/") or kind in ("application/json", "image/svg+xml"):
+        kind += "; charset=utf-8"
+    return kind
+
+
+def unicode_range(codepoints: Set[int]) -> str:
+    """CSS unicode-range for a set of codepoints, consecutive runs collapsed"""
+    ranges = []
+    for codepoint in sorted(codepoints):
+        if ranges and codepoint == ranges[-1][1] + 1:
+            ranges[-1][1] = codepoint
+        else:
+            ranges.append([codepoint, codepoint])
+    return ",".join(f"U+{start:X}" if start == end else f"U+{start:X}-{end:X}" for start, end in ranges)
+
+
+def short_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:8]
+
+
+class WebExporter:
+    def __init__(self, output_dir: Path = OUTPUT_DIR, fonts: bool = True, prune: bool = False, jobs: Optional[int] = None):
+        self.output_dir = output_dir
+        self.fonts = fonts
+        self.prune = prune
+        self.jobs = jobs
+        self.bundles = []
+        self.stale = []
+        self.font_files = []
+        self.remote_families = []
+        self.compression = {"files": 0, "original": 0, "gzip": 0, "br": 0}
+        self.errors = []
+        self.warnings = []
+
+    def run(self):
+        if not WEB_INDEX_PATH.exists():
+            self.errors.append(f"Web front end not found: {WEB_INDEX_PATH}")
+            return
+
+        if self.output_dir.exists():
+            shutil.rmtree(self.output_dir)
+        self.output_dir.mkdir(parents=True)
+
+        page = WEB_INDEX_PATH.read_text(encoding='utf-8')
+        texts = self.copy_bundles(page)
+        self.copy_data()
+        if self.fonts:
+            page = self.self_host_fonts(page, texts)
+        (self.output_dir / "index.html").write_text(page, encoding='utf-8')
+
+        self.precompress()
+        self.write_cache_manifest()
+
+    @profiler.timed()
+    def copy_bundles(self, page: str) -> List[str]:
+        """Copy the hashed bundles reachable from index.html; returns their text"""
+        print("[Bundles] Resolving references from index.html...")
+        for name in ASSET_REFERENCE.findall(page):
+            if not (WEB_ASSETS_DIR / name).exists():
+                self.errors.append(f"index.html references missing /assets/{name}")
+
+        hashed = {path.name: path for path in sorted(WEB_ASSETS_DIR.glob("*"))
+                  if path.is_file() and HASHED_FILE.match(path.name)}
+        # Bundles can import each other (code-split chunks), so follow references
+        reached = {}
+        pending = [page]
+        while pending:
+            text = pending.pop()
+            for name, path in hashed.items():
+                if name not in reached and name in text:
+                    reached[name] = path.read_text(encoding='utf-8', errors='replace')
+                    pending.append(reached[name])
+
+        target = self.output_dir / "assets"
+        target.mkdir(parents=True, exist_ok=True)
+        for name in sorted(reached):
+            shutil.copy2(hashed[name], target / name)
+            self.bundles.append(name)
+            print(f"  [OK] {name}")
+
+        self.stale = sorted(name for name in hashed if name not in reached)
+        for name in self.stale:
+            if self.prune:
+                hashed[name].unlink()
+                print(f"  [--] {name}: stale, deleted")
+            else:
+                print(f"  [--] {name}: stale, not shipped (--prune deletes it)")
+        return list(reached.values())
+
+    @profiler.timed()
+    def copy_data(self):
+        print("\n[Data] Copying runtime files...")
+        for pattern, destination in WEB_DATA:
+            matches = sorted(PROJECT_ROOT.glob(pattern))
+            if not matches:
+                self.warnings.append(f"No files for {pattern}; the front end will fail to fetch them")
+            for path in matches:
+                target = self.output_dir / destination / path.name
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(path, target)
+                print(f"  [OK] {target.relative_to(self.output_dir).as_posix()}")
+
+        # Scene files named by the story index
+        story_index = PROJECT_ROOT / "content" / "story_index.json"
+        if story_index.exists():
+            for scene in read_json(story_index).get("scenes", []):
+                source = PROJECT_ROOT / scene.get("file", "")
+                if source.is_file():
+                    target = self.output_dir / scene["file"]
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copy2(source, target)
+                else:
+                    self.warnings.append(f"Scene file not found: {scene.get('file')} ({scene.get('sceneId')})")
+
+    def web_codepoints(self, texts: List[str]) -> Dict[str, Set[int]]:
+        """Codepoints per web font family: its scripts' content plus the front end's own text"""
+        from subset_fonts import BASE_CODEPOINTS, FontSubsetter
+
+        subsetter = FontSubsetter({})
+        subsetter.collect_codepoints()
+        registry = subsetter.registry
+        front_end = {ord(char) for text in texts + [WEB_INDEX_PATH.read_text(encoding='utf-8')]
+                     for char in text if char > "~"}
+
+        per_family = {}
+        for family, scripts in WEB_FONT_SCRIPTS.items():
+            codepoints = set(BASE_CODEPOINTS) | front_end
+            for language, used in subsetter.codepoints.items():
+                if registry[language].get("script") in scripts:
+                    codepoints |= used
+            per_family[family] = codepoints
+        return per_family
+
+    def find_font_faces(self, families: Dict[str, Set[int]]) -> Dict[str, List[Tuple[Path, int, Any, bool]]]:
+        """family -> [(path, font number, weight or (min, max) for variable fonts, italic)]"""
+        from fontTools.ttLib import TTFont
+        from subset_fonts import font_families
+
+        found = {}
+        if not FONT_DIR.exists():
+            return found
+        for path in sorted(FONT_DIR.rglob("*")):
+            if path.suffix.lower() not in FONT_EXTENSIONS or "subset" in path.relative_to(FONT_DIR).parts:
+                continue
+            try:
+                names = font_families(path)
+            except Exception as e:
+                self.warnings.append(f"{path.name}: unreadable font - {e}")
+                continue
+            for number, family in enumerate(names):
+                if family not in families:
+                    continue
+                font = TTFont(str(path), fontNumber=number, lazy=True)
+                if "fvar" in font:
+                    axis = next((axis for axis in font["fvar"].axes if axis.axisTag == "wght"), None)
+                    weight = (int(axis.minValue), int(axis.maxValue)) if axis else font["OS/2"].usWeightClass
+                else:
+                    weight = font["OS/2"].usWeightClass
+                italic = bool(font["OS/2"].fsSelection & 1)
+                found.setdefault(family, []).append((path, number, weight, italic))
+        return found
+
+    @profiler.timed()
+    def self_host_fonts(self, page: str, texts: List[str]) -> str:
+        """Replace the Google Fonts link with subsetted, hashed local font files"""
+        print("\n[Fonts] Self-hosting web fonts...")
+        match = GOOGLE_FONTS_LINK.search(page)
+        if not match:
+            print("  [--] No Google Fonts link in index.html")
+            return page
+        if importlib.util.find_spec("fontTools") is None:
+            self.warnings.append("fontTools not installed (pip install fonttools); fonts still load from Google Fonts")
+            return page
+        from fontTools.ttLib import TTFont
+        from subset_fonts import subset_font
+
+        indent, query = match.group(1), html.unescape(match.group(2))
+        requested = {}
+        for spec in parse_qs(query).get("family", []):
+            family, _, axes = spec.partition(":")
+            weights = axes.partition("@")[2] if axes.startswith("wght@") else ""
+            requested[family] = {int(weight) for weight in weights.split(";") if weight.isdigit()} or {400}
+
+        faces = self.find_font_faces(requested)
+        flavor = "woff2" if brotli else "woff"
+        if not brotli:
+            self.warnings.append("brotli not installed (pip install brotli); fonts written as WOFF, no .br files")
+
+        jobs = []
+        for family, weights in requested.items():
+            # Variable fonts cover every weight; static files only the requested ones
+            usable = [face for face in faces.get(family, []) if isinstance(face[2], tuple) or face[2] in weights]
+            if not usable:
+                self.remote_families.append(family)
+                self.warnings.append(f"No font file for '{family}' under {FONT_DIR}; it still loads from Google Fonts")
+                continue
+            for path, number, weight, italic in usable:
+                stem = path.stem if path.suffix.lower() in {".ttf", ".otf"} else f"{path.stem}-{number}"
+                jobs.append((family, weight, italic, path, number, stem))
+
+        if not jobs:
+            return page
+
+        codepoints = self.web_codepoints(texts)
+        # Families outside WEB_FONT_SCRIPTS keep everything any language uses
+        everything = set().union(*codepoints.values())
+
+        fonts_dir = self.output_dir / "assets" / "fonts"
+        rules = []
+        with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+            futures = {}
+            for job in jobs:
+                family, _, _, path, number, stem = job
+                family_codepoints = sorted(codepoints.get(family, everything))
+                futures[pool.submit(subset_font, str(path), number, family_codepoints,
+                                    str(fonts_dir / f"{stem}.{flavor}"), flavor)] = job
+            for future in as_completed(futures):
+                family, weight, italic, path, number, stem = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.errors.append(f"{path.name}: {e}")
+                    continue
+
+                # Content hash in the name: the file can be cached forever
+                output = fonts_dir / f"{stem}.{flavor}"
+                data = output.read_bytes()
+                hashed = output.with_name(f"{stem}-{short_hash(data)}.{flavor}")
+                output.rename(hashed)
+                covered = set(TTFont(str(hashed), lazy=True).getBestCmap() or {})
+
+                weight_css = f"{weight[0]} {weight[1]}" if isinstance(weight, tuple) else str(weight)
+                rules.append((family, weight_css, italic, (
+                    f"@font-face {{ font-family: \"{family}\"; font-style: {'italic' if italic else 'normal'}; "
+                    f"font-weight: {weight_css}; font-display: swap; "
+                    f"src: url(\"/assets/fonts/{hashed.name}\") format(\"{flavor}\"); "
+                    f"unicode-range: {unicode_range(covered)}; }}"
+                )))
+                self.font_files.append({"file": hashed.name, "family": family, "weight": weight_css,
+                                        "original_size": result["original_size"], "size": len(data)})
+                print(f"  [OK] {family} {weight_css}: {hashed.name} ({result['original_size']:,} -> {len(data):,} bytes)")
+
+        if not rules:
+            return page
+
+        css = "\n".join(f"{indent}  {rule}" for _, _, _, rule in sorted(rules))
+        replacement = f"{indent}<style>\n{css}\n{indent}</style>\n"
+        if self.remote_families:
+            remaining = [(key, value) for key, value in parse_qs(query).items() if key != "family"]
+            specs = [spec for spec in parse_qs(query)["family"] if spec.partition(":")[0] in self.remote_families]
+            href = html.escape("https://fonts.googleapis.com/css2?" + urlencode(
+                [("family", spec) for spec in specs] + [(key, value) for key, values in remaining for value in values],
+                safe=":@;"))
+            replacement += f'{indent}<link href="{href}" rel="stylesheet">\n'
+        else:
+            page = GOOGLE_PRECONNECT.sub("", page)
+            match = GOOGLE_FONTS_LINK.search(page)
+        return page[:match.start()] + replacement + page[match.end():]
+
+    @profiler.timed()
+    def precompress(self):
+        """Write .gz (and .br, with the brotli module) next to every compressible file"""
+        print("\n[Precompress] Writing compressed variants...")
+        for path in sorted(self.output_dir.rglob("*")):
+            if not path.is_file() or path.suffix not in COMPRESSIBLE:
+                continue
+            data = path.read_bytes()
+            if len(data) < MIN_PRECOMPRESS_SIZE:
+                continue
+            self.compression["files"] += 1
+            self.compression["original"] += len(data)
+
+            # mtime=0 keeps the output identical between runs
+            variants = [("gzip", ".gz", gzip.compress(data, 9, mtime=0))]
+            if brotli:
+                variants.append(("br", ".br", brotli.compress(data, quality=11)))
+            for encoding, suffix, compressed in variants:
+                if len(compressed) < len(data):
+                    path.with_name(path.name + suffix).write_bytes(compressed)
+                    self.compression[encoding] += len(compressed)
+                else:
+                    self.compression[encoding] += len(data)
+        print(f"  [OK] {self.compression['files']} files")
+
+    @profiler.timed()
+    def write_cache_manifest(self):
+        """Per-file headers: content-hashed names are immutable, the rest revalidate"""
+        files = {}
+        for path in sorted(self.output_dir.rglob("*")):
+            if not path.is_file() or path.suffix in (".gz", ".br") or path.name == CACHE_MANIFEST_NAME:
+                continue
+            data = path.read_bytes()
+            encodings = {encoding: variant.stat().st_size
+                         for encoding, variant in [("br", path.with_name(path.name + ".br")),
+                                                   ("gzip", path.with_name(path.name + ".gz"))]
+                         if variant.exists()}
+            headers = {
+                "Cache-Control": IMMUTABLE if HASHED_FILE.match(path.name) else REVALIDATE,
+                "Content-Type": content_type(path),
+            }
+            if encodings:
+                headers["Vary"] = "Accept-Encoding"
+            files["/" + path.relative_to(self.output_dir).as_posix()] = {
+                "size": len(data),
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "encodings": encodings,
+                "headers": headers
+            }
+
+        write_json(self.output_dir / CACHE_MANIFEST_NAME, {
+            "version": 1,
+            "generated_at": datetime.now().isoformat(),
+            "files": files
+        }, indent=2)
+        immutable = sum(1 for entry in files.values() if entry["headers"]["Cache-Control"] == IMMUTABLE)
+        print(f"\n[OK] {CACHE_MANIFEST_NAME}: {len(files)} files ({immutable} immutable)")
+
+    def print_report(self):
+        print("\n" + "="*60)
+        print("WEB EXPORT REPORT")
+        print("="*60)
+        print(f"Bundles: {len(self.bundles)} shipped, {len(self.stale)} stale{' (deleted)' if self.prune else ''}")
+        if self.font_files:
+            before = sum(font["original_size"] for font in self.font_files)
+            after = sum(font["size"] for font in self.font_files)
+            print(f"Fonts: {len(self.font_files)} self-hosted, {before:,} -> {after:,} bytes")
+        original = self.compression["original"]
+        if original:
+            line = f"Transfer: {original:,} bytes raw, {self.compression['gzip']:,} gzip"
+            if brotli:
+                line += f", {self.compression['br']:,} brotli"
+            print(line)
+
+        if self.errors:
+            print(f"\n[X] ERRORS ({len(self.errors)}):")
+            for error in self.errors:
+                print(f"  - {error}")
+
+        if self.warnings:
+            print(f"\n[!] WARNINGS ({len(self.warnings)}):")
+            for warning in self.warnings:
+                print(f"  - {warning}")
+
+        print(f"\nOutput: {self.output_dir}")
+
+
+def export_web(output_dir: Path = OUTPUT_DIR, fonts: bool = True, prune: bool = False) -> bool:
+    exporter = WebExporter(output_dir, fonts=fonts, prune=prune)
+    exporter.run()
+    exporter.print_report()
+    return not exporter.errors
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the browser demo with precompressed, cache-busted output")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DIR, help="Output directory (replaced)")
+    parser.add_argument("--prune", action="store_true", help="Delete stale hashed bundles from assets/")
+    parser.add_argument("--no-fonts", action="store_true", help="Keep loading fonts from Google Fonts")
+    parser.add_argument("--jobs", type=int, default=None, help="Font subsetting workers (default: CPU count)")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    start_profiling("export_web", args)
+
+    print("="*60)
+    print("WEB EXPORT")
+    print("="*60)
+
+    exporter = WebExporter(args.output, fonts=not args.no_fonts, prune=args.prune, jobs=args.jobs)
+    exporter.run()
+    exporter.print_report()
+
+    sys.exit(1 if exporter.errors else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -172,7 +172,7 @@ class PlaceholderGenerator:
         for filename, label in backgrounds:
             img = self.create_background(3840, 2160, filename, label)
             path = IMAGES_DIR / "backgrounds" / filename
-            img.save(path)
+            img.save(path, optimize=True)
             assets_created.append(str(path))
             print(f"  [OK] {filename}")
 
@@ -190,7 +190,7 @@ class PlaceholderGenerator:
         for filename, name, width, height in characters:
             img = self.create_character_sprite(width, height, filename, name)
             path = IMAGES_DIR / "characters" / filename
-            img.save(path)
+            img.save(path, optimize=True)
             assets_created.append(str(path))
             print(f"  [OK] {filename}")
 
@@ -208,7 +208,7 @@ class PlaceholderGenerator:
         for filename, label, width, height in ui_elements:
             img = self.create_ui_element(width, height, filename, label)
             path = IMAGES_DIR / "ui" / filename
-            img.save(path)
+            img.save(path, optimize=True)
             assets_created.append(str(path))
             print(f"  [OK] {filename}")
 
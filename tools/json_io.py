@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+JSON I/O - Shared JSON reading and writing for the tools
+Uses orjson (parse and write) or simdjson (parse only) when installed and
+the standard library otherwise; set JSON_BACKEND=json|orjson|simdjson to
+force one. read_json(..., cached=True) memoizes parses for the run, keyed
+by path, mtime and size
+
+Output is UTF-8 (never \\u-escaped). indent=None writes compact JSON, as
+shipped in content packs; indent=2 writes the pretty form kept in the repo
+for review
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from profiling import profiler
+
+_requested = os.environ.get("JSON_BACKEND", "").strip().lower()
+if _requested not in ("", "json", "orjson", "simdjson"):
+    print(f"[!] Unknown JSON_BACKEND '{_requested}', choosing automatically")
+    _requested = ""
+
+orjson = None
+simdjson = None
+if _requested in ("", "orjson"):
+    try:
+        import orjson
+    except ImportError:
+        if _requested:
+            print("[!] orjson not installed (pip install orjson), using the standard library")
+if orjson is None and _requested in ("", "simdjson"):
+    try:
+        import simdjson
+    except ImportError:
+        if _requested:
+            print("[!] pysimdjson not installed (pip install pysimdjson), using the standard library")
+
+BACKEND = "orjson" if orjson else "simdjson" if simdjson else "json"
+
+# Callers catch this for malformed input. orjson's error subclasses the
+# standard library's; simdjson raises plain ValueError
+JSONDecodeError = ValueError if simdjson else json.JSONDecodeError
+
+COMPACT_SEPARATORS = (",", ":")
+
+# (resolved path) -> ((mtime_ns, size), parsed data)
+_cache: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+
+
+def loads(data: Union[bytes, str], object_pairs_hook: Optional[Callable] = None) -> Any:
+    """Parse JSON text; object_pairs_hook forces the standard library"""
+    if object_pairs_hook is not None:
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+        return json.loads(data, object_pairs_hook=object_pairs_hook)
+    if orjson:
+        return orjson.loads(data)
+    if simdjson:
+        return simdjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: Path, cached: bool = False, object_pairs_hook: Optional[Callable] = None) -> Any:
+    """
+    Parse a JSON file (UTF-8). With cached=True a file unchanged since its
+    last cached read is not parsed again and the same object is returned,
+    so callers must treat it as read-only
+    """
+    if not cached:
+        with open(path, 'rb') as f:
+            return loads(f.read(), object_pairs_hook)
+
+    key = Path(path).resolve()
+    stat = key.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    hit = _cache.get(key)
+    if hit is not None and hit[0] == stamp:
+        profiler.count("json cache hits")
+        return hit[1]
+
+    with open(key, 'rb') as f:
+        data = loads(f.read(), object_pairs_hook)
+    _cache[key] = (stamp, data)
+    return data
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def dump_bytes(data: Any, indent: Union[int, str, None] = None) -> bytes:
+    """
+    Serialize to UTF-8; indent=None is compact. orjson only indents by two
+    spaces, so other indents (the tab-indented saves) use the standard library
+    """
+    if orjson and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+
+    if indent is None:
+        return json.dumps(data, ensure_ascii=False, separators=COMPACT_SEPARATORS).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, indent=indent).encode('utf-8')
+
+
+def dumps(data: Any, indent: Union[int, str, None] = None) -> str:
+    return dump_bytes(data, indent).decode('utf-8')
+
+
+def write_json(path: Path, data: Any, indent: Union[int, str, None] = None) -> int:
+    """Write data as JSON; returns the number of bytes written"""
+    encoded = dump_bytes(data, indent)
+    with open(path, 'wb') as f:
+        f.write(encoded)
+    # A later cached read must see the new content, even within one mtime tick
+    _cache.pop(Path(path).resolve(), None)
+    return len(encoded)
+
+
+def minify(data: bytes) -> bytes:
+    """Compact form of a JSON document, for shipping"""
+    return dump_bytes(loads(data))
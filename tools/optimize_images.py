@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Image Optimizer
+Recompresses shipped images (PNG/JPEG/WebP) to reduce download and load size
+Optionally converts PNG to lossless WebP and JPEG to lossy WebP for Godot import
+
+JPEGs are only rewritten losslessly (jpegtran, when installed) unless --lossy
+allows a Pillow re-encode, which requantizes even with quality="keep"
+"""
+
+import hashlib
+import io
+import os
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from json_io import JSONDecodeError, read_json, write_json
+
+try:
+    from PIL import Image
+except ImportError:
+    print("[X] PIL/Pillow not installed")
+    print("    Install with: pip install Pillow")
+    sys.exit(1)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+ASSETS_DIR = PROJECT_ROOT / "assets"
+CACHE_PATH = PROJECT_ROOT / ".build_cache" / "optimize_images.json"
+REPORT_PATH = PROJECT_ROOT / "tools" / "logs" / "image_optimization_report.json"
+
+# Bump when encoder settings change so cached results are recomputed
+CACHE_VERSION = 2
+
+SUPPORTED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp"}
+LOSSY_WEBP_QUALITY = 90
+
+JPEGTRAN = shutil.which("jpegtran")
+
+
+def file_digest(data: bytes) -> str:
+    """SHA-256 of file contents, used as the cache key"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def display_path(path_str: str) -> str:
+    """Project-relative path for reports"""
+    try:
+        return str(Path(path_str).resolve().relative_to(PROJECT_ROOT.resolve()))
+    except ValueError:
+        return path_str
+
+
+def _encode(img: "Image.Image", fmt: str, **params) -> bytes:
+    buffer = io.BytesIO()
+    img.save(buffer, fmt, **params)
+    return buffer.getvalue()
+
+
+def _jpegtran(data: bytes) -> Optional[bytes]:
+    """Lossless JPEG rewrite (optimized Huffman tables, progressive); None without jpegtran"""
+    if JPEGTRAN is None:
+        return None
+    result = subprocess.run([JPEGTRAN, "-copy", "all", "-optimize", "-progressive"],
+                            input=data, capture_output=True)
+    return result.stdout if result.returncode == 0 and result.stdout else None
+
+
+def _png_variants(img: "Image.Image") -> List["Image.Image"]:
+    """Pixel-identical representations of a PNG worth trying"""
+    variants = [img]
+
+    # Drop a fully opaque alpha channel
+    if img.mode == "RGBA" and img.getchannel("A").getextrema() == (255, 255):
+        variants.append(img.convert("RGB"))
+
+    # Use a palette when the image has few enough colors to do so losslessly
+    if img.mode in ("RGB", "RGBA") and img.getcolors(256) is not None:
+        try:
+            variants.append(img.quantize(colors=256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE))
+        except ValueError:
+            pass
+
+    return variants
+
+
+def optimize_image(path_str: str, to_webp: bool, lossy: bool) -> Dict[str, Any]:
+    """Find the smallest encoding of a single image
+
+    Runs in a worker process, so it only takes and returns plain data.
+    """
+    path = Path(path_str)
+    data = path.read_bytes()
+
+    img = Image.open(io.BytesIO(data))
+    img.load()
+    fmt = img.format
+
+    # Candidates: (encoded bytes, extension); the original is the baseline
+    candidates = [(data, path.suffix.lower())]
+
+    if fmt == "PNG":
+        for variant in _png_variants(img):
+            encoded = _encode(variant, "PNG", optimize=True)
+            # Mode changes are only kept if every pixel survives the round-trip
+            if variant.mode != img.mode:
+                decoded = Image.open(io.BytesIO(encoded)).convert(img.mode)
+                if decoded.tobytes() != img.tobytes():
+                    continue
+            candidates.append((encoded, ".png"))
+        if to_webp:
+            candidates.append((_encode(img, "WEBP", lossless=True, method=6), ".webp"))
+
+    elif fmt == "JPEG":
+        # Same DCT coefficients, re-entropy-coded: pixel-identical
+        transcoded = _jpegtran(data)
+        if transcoded is not None:
+            candidates.append((transcoded, path.suffix.lower()))
+        if lossy:
+            params = {"optimize": True, "progressive": True, "quality": "keep", "subsampling": "keep"}
+            if "icc_profile" in img.info:
+                params["icc_profile"] = img.info["icc_profile"]
+            if "exif" in img.info:
+                params["exif"] = img.info["exif"]
+            candidates.append((_encode(img, "JPEG", **params), path.suffix.lower()))
+            if to_webp:
+                candidates.append((_encode(img, "WEBP", quality=LOSSY_WEBP_QUALITY, method=6), ".webp"))
+
+    elif fmt == "WEBP":
+        # Lossless re-encode only; re-encoding lossy WebP would degrade it again
+        candidates.append((_encode(img, "WEBP", lossless=True, method=6), ".webp"))
+
+    best_data, best_ext = min(candidates, key=lambda c: len(c[0]))
+
+    return {
+        "path": path_str,
+        "format": fmt,
+        "original_size": len(data),
+        "optimized_size": len(best_data),
+        "output_ext": best_ext,
+        "data": best_data if len(best_data) < len(data) else None
+    }
+
+
+class ImageOptimizer:
+    def __init__(self, write: bool = False, to_webp: bool = False, lossy: bool = False, jobs: Optional[int] = None):
+        self.write = write
+        self.to_webp = to_webp
+        self.lossy = lossy
+        self.jobs = jobs or os.cpu_count() or 1
+        self.settings = f"v{CACHE_VERSION}:webp={int(to_webp)}:lossy={int(lossy)}:jpegtran={int(JPEGTRAN is not None)}"
+        self.cache = self.load_cache()
+        self.results = []
+        self.errors = []
+
+    def load_cache(self) -> Dict[str, Any]:
+        """Load the input-hash cache from previous runs"""
+        if not CACHE_PATH.exists():
+            return {}
+
+        try:
+            return read_json(CACHE_PATH)
+        except (JSONDecodeError, OSError):
+            print("[!] Image cache unreadable, starting fresh")
+            return {}
+
+    def save_cache(self):
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        write_json(CACHE_PATH, self.cache, indent=2)
+
+    def collect_images(self, roots: List[Path]) -> List[Path]:
+        """Find all supported images under the given files/directories"""
+        images = []
+        for root in roots:
+            if root.is_file():
+                candidates = [root]
+            else:
+                candidates = sorted(p for p in root.rglob("*") if p.is_file())
+            for path in candidates:
+                if path.suffix.lower() in SUPPORTED_EXTENSIONS:
+                    images.append(path)
+        return images
+
+    def run(self, roots: List[Path]):
+        """Optimize all images under roots, in parallel"""
+        images = self.collect_images(roots)
+        print(f"[ImageOptimizer] {len(images)} images, {self.jobs} workers")
+
+        pending = []
+        for path in images:
+            digest = file_digest(path.read_bytes())
+            entry = self.cache.get(digest)
+
+            # Reuse cached results unless we need fresh bytes to write
+            if entry and entry["settings"] == self.settings and (entry["optimal"] or not self.write):
+                self.results.append(dict(entry, path=str(path), cached=True))
+            else:
+                pending.append((path, digest))
+
+        if pending:
+            with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+                futures = {
+                    pool.submit(optimize_image, str(path), self.to_webp, self.lossy): (path, digest)
+                    for path, digest in pending
+                }
+                for future in as_completed(futures):
+                    path, digest = futures[future]
+                    try:
+                        self.handle_result(path, digest, future.result())
+                    except Exception as e:
+                        self.errors.append(f"{path}: {e}")
+
+        self.save_cache()
+        self.results.sort(key=lambda r: r["path"])
+
+    def handle_result(self, path: Path, digest: str, result: Dict[str, Any]):
+        """Record a worker result and write the optimized file if requested"""
+        data = result.pop("data")
+        entry = {
+            "settings": self.settings,
+            "format": result["format"],
+            "original_size": result["original_size"],
+            "optimized_size": result["optimized_size"],
+            "output_ext": result["output_ext"],
+            "optimal": data is None
+        }
+
+        if data is not None and self.write:
+            output_path = path.with_suffix(result["output_ext"]) if result["output_ext"] != path.suffix.lower() else path
+            output_path.write_bytes(data)
+            # The written file is already optimal; remember it so reruns skip it
+            self.cache[file_digest(data)] = dict(entry, original_size=len(data), optimized_size=len(data), optimal=True)
+            result["written"] = str(output_path)
+
+        self.cache[digest] = entry
+        self.results.append(dict(entry, path=str(path), cached=False, written=result.get("written")))
+
+    def print_report(self):
+        """Print bytes saved per file and in total"""
+        print("\n" + "="*60)
+        print("IMAGE OPTIMIZATION REPORT")
+        print("="*60)
+
+        total_before = 0
+        total_after = 0
+
+        for result in self.results:
+            before = result["original_size"]
+            after = result["optimized_size"]
+            total_before += before
+            total_after += after
+
+            name = display_path(result["path"])
+            if after < before:
+                saved = before - after
+                target = "" if result["output_ext"] == Path(result["path"]).suffix.lower() else f" as {result['output_ext']}"
+                print(f"  [OK] {name}: {before:,} -> {after:,} bytes (-{saved:,}, {saved / before:.1%}){target}")
+            else:
+                print(f"  [--] {name}: {before:,} bytes (already optimal)")
+
+        if self.errors:
+            print(f"\n[X] ERRORS ({len(self.errors)}):")
+            for error in self.errors:
+                print(f"  - {error}")
+
+        saved = total_before - total_after
+        percent = saved / total_before if total_before else 0.0
+        print(f"\nTotal: {total_before:,} -> {total_after:,} bytes (saved {saved:,}, {percent:.1%})")
+
+        converted = [r for r in self.results if r.get("written") and not r["written"].endswith(Path(r["path"]).suffix)]
+        if converted:
+            print("\n[!] Converted files were written next to the originals.")
+            print("    Update scene/resource references before removing the originals.")
+
+        if not self.write and saved > 0:
+            print("\nDry run - re-run with --write to apply")
+
+        REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        write_json(REPORT_PATH, {
+            "total_original": total_before,
+            "total_optimized": total_after,
+            "files": self.results,
+            "errors": self.errors
+        }, indent=2)
+        print(f"Report: {REPORT_PATH}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Recompress shipped images")
+    parser.add_argument("paths", nargs="*", type=Path, help="Files or directories (default: assets/)")
+    parser.add_argument("--write", action="store_true", help="Write optimized files (default: dry run)")
+    parser.add_argument("--webp", action="store_true", help="Also consider lossless WebP for PNG sources")
+    parser.add_argument("--lossy", action="store_true", help="Allow lossy JPEG re-encoding (and, with --webp, lossy WebP) for JPEG sources")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+
+    args = parser.parse_args()
+
+    print("="*60)
+    print("IMAGE OPTIMIZER")
+    print("="*60)
+
+    optimizer = ImageOptimizer(write=args.write, to_webp=args.webp, lossy=args.lossy, jobs=args.jobs)
+    optimizer.run(args.paths or [ASSETS_DIR])
+    optimizer.print_report()
+
+    sys.exit(1 if optimizer.errors else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Profiling - Phase timers, counters and trace export shared by the tools
+Disabled unless a tool is run with --profile; then nested phases and
+counters are summarized on exit and written as Chrome trace JSON (open in
+ui.perfetto.dev or chrome://tracing), with optional cProfile capture
+
+Usage in a tool:
+
+    from profiling import profiler, add_profile_arguments, start_profiling
+
+    @profiler.timed()
+    def compile_main_story(self):
+        with profiler.phase(f"chapter {chapter}"):
+            ...
+        profiler.count("nodes processed", len(nodes))
+
+    def main():
+        parser = argparse.ArgumentParser(...)
+        add_profile_arguments(parser)
+        start_profiling("compile_content", parser.parse_args())
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Iterator, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+PROFILE_DIR = PROJECT_ROOT / "tools" / "logs" / "profile"
+
+# Rows of the cProfile summary printed on exit
+CPROFILE_TOP = 15
+
+
+class Profiler:
+    def __init__(self):
+        self.enabled = False
+        self.tool = ""
+        self.origin = 0.0
+        self.stack: List[str] = []
+        # (parent path..., name) -> [seconds, calls]
+        self.phases: Dict[Tuple[str, ...], List[float]] = {}
+        self.counters: Dict[str, int] = {}
+        self.events: List[Dict[str, Any]] = []
+        self.cprofile = None
+
+    def _timestamp(self) -> float:
+        """Microseconds since start, the unit trace viewers expect"""
+        return (time.perf_counter() - self.origin) * 1e6
+
+    @contextmanager
+    def phase(self, name: str, **args) -> Iterator[None]:
+        """Time a block; phases opened inside it nest under it"""
+        if not self.enabled:
+            yield
+            return
+
+        self.stack.append(name)
+        path = tuple(self.stack)
+        start = self._timestamp()
+        try:
+            yield
+        finally:
+            duration = self._timestamp() - start
+            self.stack.pop()
+            totals = self.phases.setdefault(path, [0.0, 0])
+            totals[0] += duration / 1e6
+            totals[1] += 1
+            event = {"name": name, "cat": self.tool, "ph": "X", "ts": start, "dur": duration,
+                     "pid": os.getpid(), "tid": threading.get_native_id()}
+            if args:
+                event["args"] = args
+            self.events.append(event)
+
+    def timed(self, name: Optional[str] = None) -> Callable:
+        """Decorator form of phase(); defaults to the function's name"""
+        def decorator(function: Callable) -> Callable:
+            label = name or function.__name__
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with self.phase(label):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def count(self, name: str, amount: int = 1):
+        """Add to a named counter (files read, bytes written, ...)"""
+        if not self.enabled:
+            return
+        self.counters[name] = self.counters.get(name, 0) + amount
+        self.events.append({"name": name, "ph": "C", "ts": self._timestamp(), "pid": os.getpid(),
+                            "args": {"value": self.counters[name]}})
+
+    def start(self, tool: str, cprofile: bool = False):
+        self.enabled = True
+        self.tool = tool
+        self.origin = time.perf_counter()
+        if cprofile:
+            import cProfile
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+        # Tools finish through sys.exit() in print_report(); atexit still runs
+        atexit.register(self.finish)
+
+    def finish(self):
+        if not self.enabled:
+            return
+        total = time.perf_counter() - self.origin
+        self.enabled = False
+        if self.cprofile is not None:
+            self.cprofile.disable()
+
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        trace_path = PROFILE_DIR / f"{self.tool}.trace.json"
+        with open(trace_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "traceEvents": [
+                    {"name": "process_name", "ph": "M", "pid": os.getpid(), "args": {"name": self.tool}}
+                ] + self.events,
+                "displayTimeUnit": "ms",
+                "otherData": {"tool": self.tool, "total_seconds": total, "counters": self.counters}
+            }, f, ensure_ascii=False)
+
+        self.print_summary(total)
+        print(f"   Trace: {trace_path}")
+
+        if self.cprofile is not None:
+            import pstats
+            stats_path = PROFILE_DIR / f"{self.tool}.prof"
+            self.cprofile.dump_stats(stats_path)
+            print(f"   cProfile: {stats_path} (top {CPROFILE_TOP} by cumulative time below)")
+            pstats.Stats(self.cprofile).sort_stats("cumulative").print_stats(CPROFILE_TOP)
+
+    def print_summary(self, total: float):
+        print("\n" + "="*60)
+        print(f"PROFILE: {self.tool} ({total:.3f}s)")
+        print("="*60)
+
+        # Depth-first in first-seen order, so the tree reads like the run
+        for path, (seconds, calls) in self.phases_in_order():
+            label = "  " * len(path) + path[-1]
+            share = seconds / total if total else 0.0
+            print(f"{label:<44} {seconds:>8.3f}s {share:>5.0%} {calls:>6}x")
+
+        if self.counters:
+            print("\nCounters:")
+            for name, value in self.counters.items():
+                print(f"  {name}: {value:,}")
+
+    def phases_in_order(self) -> List[Tuple[Tuple[str, ...], List[float]]]:
+        first_seen = {}
+        for event in self.events:
+            if event["ph"] == "X":
+                first_seen.setdefault(event["name"], event["ts"])
+
+        def children(parent: Tuple[str, ...]) -> List[Tuple[str, ...]]:
+            found = [path for path in self.phases if len(path) == len(parent) + 1 and path[:-1] == parent]
+            return sorted(found, key=lambda path: first_seen.get(path[-1], 0.0))
+
+        ordered = []
+        pending = list(reversed(children(())))
+        while pending:
+            path = pending.pop()
+            ordered.append((path, self.phases[path]))
+            pending.extend(reversed(children(path)))
+        return ordered
+
+
+profiler = Profiler()
+
+
+def add_profile_arguments(parser):
+    parser.add_argument("--profile", action="store_true",
+                        help=f"Time phases and count work; writes a Chrome trace to {PROFILE_DIR.relative_to(PROJECT_ROOT)}")
+    parser.add_argument("--cprofile", action="store_true", help="Also capture a cProfile (implies --profile)")
+
+
+def start_profiling(tool: str, args):
+    """Enable the shared profiler if the tool was run with --profile"""
+    if args.profile or args.cprofile:
+        profiler.start(tool, cprofile=args.cprofile)
@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+Save Codec - Compact encoding for SaveManager saves
+Reference encoder/decoder for the format SaveManager writes:
+main.seen_nodes and flags.achievements_unlocked as bitsets over their
+compiled tables and side replay events as packed records, serialized as
+compact JSON
+
+Encoded fields (everything else is unchanged):
+
+    main.seen_nodes_bits            base64 bitset, bit i = node_table[i] seen
+    main.seen_nodes_extra           seen IDs missing from the table, in order
+    flags.achievements_bits         base64 bitset, bit i = achievement_table[i] unlocked
+    flags.achievements_extra        unlocked IDs missing from the table, in order
+    side.replay.events_packed       base64 records (see pack_events)
+    side.replay.event_strings       string table for the records
+    version.save_encoding           SAVE_ENCODING
+    version.node_table_size         table entries the node bitset was built against
+    version.achievement_table_size  the same for the achievement bitset (0 if absent)
+
+python tools/save_codec.py --self-test round-trips built-in fixtures
+"""
+
+import base64
+import copy
+import sys
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+
+from json_io import dumps, loads, read_json
+
+PROJECT_ROOT = Path(__file__).parent.parent
+NODE_TABLE_PATH = PROJECT_ROOT / "content" / "main" / "node_table.json"
+ACHIEVEMENT_TABLE_PATH = PROJECT_ROOT / "content" / "achievements" / "achievement_table.json"
+
+SAVE_ENCODING = 1
+
+# Replay record kinds
+EVENT_QUESTION = 0
+EVENT_HINT = 1
+QUESTION_FIELDS = {"type", "turn", "question_id", "answer"}
+HINT_FIELDS = {"type", "turn", "hint_index"}
+
+
+class SaveCodecError(ValueError):
+    pass
+
+
+def load_node_table(path: Path = NODE_TABLE_PATH) -> List[str]:
+    """The append-only node ID table written by compile_content.py"""
+    return read_json(path)["nodes"]
+
+
+def load_achievement_table(path: Path = ACHIEVEMENT_TABLE_PATH) -> List[str]:
+    """The append-only achievement ID table written by compile_achievements.py"""
+    return read_json(path)["achievements"]
+
+
+def is_compact(data: Dict[str, Any]) -> bool:
+    return isinstance(data.get("version"), dict) and "save_encoding" in data["version"]
+
+
+def serialize_compact(data: Dict[str, Any]) -> str:
+    """Match SaveManager: JSON.stringify(data) without indentation"""
+    return dumps(data)
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode('ascii')
+
+
+def _b64decode(text: str) -> bytes:
+    try:
+        return base64.b64decode(text, validate=True)
+    except ValueError as e:
+        raise SaveCodecError(f"invalid base64 - {e}")
+
+
+def write_varint(out: bytearray, value: int):
+    """Unsigned LEB128"""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise SaveCodecError("truncated varint")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _as_count(value: Any) -> Optional[int]:
+    """Non-negative integer, accepting the floats Godot's JSON parser produces"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    if value < 0 or value != int(value):
+        return None
+    return int(value)
+
+
+def encode_bitset(ids: List[str], table: Sequence[str]) -> Tuple[str, List[str]]:
+    """IDs as a bitset over an append-only table, plus the IDs it lacks"""
+    position = {name: i for i, name in enumerate(table)}
+    bits = bytearray((len(table) + 7) // 8)
+    extra = []
+
+    for name in ids:
+        i = position.get(name)
+        if i is not None:
+            bits[i >> 3] |= 1 << (i & 7)
+        elif name not in extra:
+            extra.append(name)
+
+    return _b64encode(bytes(bits)), extra
+
+
+def decode_bitset(field: str, encoded: str, extra: List[str], table: Sequence[str], table_size: int) -> List[str]:
+    if table_size > len(table):
+        raise SaveCodecError(f"save needs {table_size} {field} table entries, table has {len(table)}")
+
+    bits = _b64decode(encoded)
+    if len(bits) != (table_size + 7) // 8:
+        raise SaveCodecError(f"{field} bitset does not match its table size")
+
+    ids = [table[i] for i in range(table_size) if bits[i >> 3] & (1 << (i & 7))]
+    return ids + list(extra)
+
+
+def encode_seen_nodes(seen_nodes: List[str], table: List[str]) -> Tuple[str, List[str]]:
+    return encode_bitset(seen_nodes, table)
+
+
+def decode_seen_nodes(encoded: str, extra: List[str], table: List[str], table_size: int) -> List[str]:
+    return decode_bitset("seen_nodes", encoded, extra, table, table_size)
+
+
+def pack_events(events: List[Any]) -> Optional[Tuple[str, List[str]]]:
+    """Pack replay events, or None if any event has a shape we don't know
+
+    Record: kind byte, varint turn, then for questions the string-table
+    indexes of question_id and answer, for hints a varint hint_index.
+    """
+    out = bytearray()
+    strings = []
+    string_ids = {}
+
+    def intern(text: str) -> int:
+        if text not in string_ids:
+            string_ids[text] = len(strings)
+            strings.append(text)
+        return string_ids[text]
+
+    for event in events:
+        if not isinstance(event, dict):
+            return None
+        turn = _as_count(event.get("turn"))
+        if turn is None:
+            return None
+
+        if event.get("type") == "question" and set(event) == QUESTION_FIELDS:
+            if not isinstance(event["question_id"], str) or not isinstance(event["answer"], str):
+                return None
+            out.append(EVENT_QUESTION)
+            write_varint(out, turn)
+            write_varint(out, intern(event["question_id"]))
+            write_varint(out, intern(event["answer"]))
+
+        elif event.get("type") == "hint" and set(event) == HINT_FIELDS:
+            hint_index = _as_count(event["hint_index"])
+            if hint_index is None:
+                return None
+            out.append(EVENT_HINT)
+            write_varint(out, turn)
+            write_varint(out, hint_index)
+
+        else:
+            return None
+
+    return _b64encode(bytes(out)), strings
+
+
+def unpack_events(encoded: str, strings: List[str]) -> List[Dict[str, Any]]:
+    data = _b64decode(encoded)
+    events = []
+    offset = 0
+
+    def lookup(index: int) -> str:
+        if index >= len(strings):
+            raise SaveCodecError(f"event string {index} out of range")
+        return strings[index]
+
+    while offset < len(data):
+        kind = data[offset]
+        turn, offset = read_varint(data, offset + 1)
+
+        if kind == EVENT_QUESTION:
+            question, offset = read_varint(data, offset)
+            answer, offset = read_varint(data, offset)
+            events.append({"type": "question", "turn": turn, "question_id": lookup(question), "answer": lookup(answer)})
+        elif kind == EVENT_HINT:
+            hint_index, offset = read_varint(data, offset)
+            events.append({"type": "hint", "turn": turn, "hint_index": hint_index})
+        else:
+            raise SaveCodecError(f"unknown event kind {kind}")
+
+    return events
+
+
+def encode_save(data: Dict[str, Any], table: List[str], achievement_table: Sequence[str] = ()) -> Dict[str, Any]:
+    """Plain save -> compact save (input is not modified)
+
+    Without an achievement table every unlocked ID goes to achievements_extra,
+    as SaveManager does when the table is missing.
+    """
+    if is_compact(data):
+        return copy.deepcopy(data)
+
+    encoded = copy.deepcopy(data)
+
+    main = encoded.get("main", {})
+    if "seen_nodes" in main:
+        main["seen_nodes_bits"], main["seen_nodes_extra"] = encode_seen_nodes(main.pop("seen_nodes"), table)
+
+    flags = encoded.get("flags", {})
+    if "achievements_unlocked" in flags:
+        flags["achievements_bits"], flags["achievements_extra"] = encode_bitset(flags.pop("achievements_unlocked"), achievement_table)
+
+    replay = encoded.get("side", {}).get("replay", {})
+    if "events" in replay:
+        packed = pack_events(replay["events"])
+        if packed is not None:
+            del replay["events"]
+            replay["events_packed"], replay["event_strings"] = packed
+
+    encoded["version"]["save_encoding"] = SAVE_ENCODING
+    encoded["version"]["node_table_size"] = len(table)
+    encoded["version"]["achievement_table_size"] = len(achievement_table)
+    return encoded
+
+
+def decode_save(data: Dict[str, Any], table: List[str], achievement_table: Sequence[str] = ()) -> Dict[str, Any]:
+    """Compact save -> plain save (plain saves are returned as a copy)"""
+    decoded = copy.deepcopy(data)
+    if not is_compact(decoded):
+        return decoded
+
+    version = decoded["version"]
+    if version.pop("save_encoding") != SAVE_ENCODING:
+        raise SaveCodecError(f"unsupported save encoding {data['version']['save_encoding']!r}")
+    table_size = _as_count(version.pop("node_table_size", 0))
+    if table_size is None:
+        raise SaveCodecError("invalid node_table_size")
+    achievement_table_size = _as_count(version.pop("achievement_table_size", 0))
+    if achievement_table_size is None:
+        raise SaveCodecError("invalid achievement_table_size")
+
+    main = decoded.get("main", {})
+    if "seen_nodes_bits" in main:
+        main["seen_nodes"] = decode_seen_nodes(main.pop("seen_nodes_bits"), main.pop("seen_nodes_extra", []), table, table_size)
+
+    flags = decoded.get("flags", {})
+    if "achievements_bits" in flags:
+        flags["achievements_unlocked"] = decode_bitset("achievements", flags.pop("achievements_bits"),
+                                                       flags.pop("achievements_extra", []),
+                                                       achievement_table, achievement_table_size)
+
+    replay = decoded.get("side", {}).get("replay", {})
+    if "events_packed" in replay:
+        replay["events"] = unpack_events(replay.pop("events_packed"), replay.pop("event_strings", []))
+
+    return decoded
+
+
+def normalize_save(data: Dict[str, Any]) -> Dict[str, Any]:
+    """What a round trip is expected to preserve: seen_nodes and
+    achievements_unlocked are sets"""
+    normalized = copy.deepcopy(data)
+    main = normalized.get("main", {})
+    if isinstance(main.get("seen_nodes"), list):
+        main["seen_nodes"] = sorted(set(main["seen_nodes"]))
+    flags = normalized.get("flags", {})
+    if isinstance(flags.get("achievements_unlocked"), list):
+        flags["achievements_unlocked"] = sorted(set(flags["achievements_unlocked"]))
+    return normalized
+
+
+# -- Self-test -----------------------------------------------------------------
+
+SELF_TEST_NODES = [f"CH1_{i:03d}" for i in range(1, 11)]
+SELF_TEST_ACHIEVEMENTS = ["CHAPTER_1_COMPLETE", "FIRST_SEAL", "READER_25"]
+
+
+def _self_test_save() -> Dict[str, Any]:
+    """A plain save touching every encoded field"""
+    return {
+        "version": {"save_version": "1.0"},
+        "main": {"seen_nodes": ["CH1_003", "CH1_001", "CH9_NEW", "CH1_010", "CH1_001", "CH9_NEW"]},
+        "flags": {"achievements_unlocked": ["READER_25", "SIDE_CASE_9", "CHAPTER_1_COMPLETE"]},
+        "side": {"replay": {"events": (
+            # 200 distinct question IDs: string-table indexes above 127
+            [{"type": "question", "turn": turn, "question_id": f"Q{turn}", "answer": "yes" if turn % 2 else "no"}
+             for turn in range(1, 201)]
+            + [{"type": "hint", "turn": 300, "hint_index": 130}]
+        )}}
+    }
+
+
+def self_test() -> List[str]:
+    """Deterministic round trips over built-in fixtures; returns the failures"""
+    failures = []
+
+    def check(label: str, condition: bool):
+        if not condition:
+            failures.append(label)
+
+    def raises(function, *args) -> bool:
+        try:
+            function(*args)
+        except SaveCodecError:
+            return True
+        return False
+
+    # Varints: one byte up to 127, then 7 bits per byte
+    for value, length in [(0, 1), (127, 1), (128, 2), (300, 2), (16383, 2), (16384, 3), (2 ** 35, 6)]:
+        out = bytearray()
+        write_varint(out, value)
+        check(f"varint {value} is {length} bytes", len(out) == length)
+        check(f"varint {value} round-trips", read_varint(bytes(out), 0) == (value, length))
+    out = bytearray()
+    write_varint(out, 300)
+    check("varint 300 is LEB128 ac 02", bytes(out) == b"\xac\x02")
+    check("truncated varint is rejected", raises(read_varint, b"\x80", 0))
+
+    # Full save, through the same compact JSON SaveManager writes
+    save = _self_test_save()
+    encoded = encode_save(save, SELF_TEST_NODES, SELF_TEST_ACHIEVEMENTS)
+    check("encode_save leaves its input alone", save == _self_test_save())
+    check("encoding is deterministic",
+          serialize_compact(encoded) == serialize_compact(encode_save(save, SELF_TEST_NODES, SELF_TEST_ACHIEVEMENTS)))
+    check("events are packed", "events_packed" in encoded["side"]["replay"] and "events" not in encoded["side"]["replay"])
+    check("event strings are interned", len(encoded["side"]["replay"].get("event_strings", [])) == 202)
+    decoded = decode_save(loads(serialize_compact(encoded)), SELF_TEST_NODES, SELF_TEST_ACHIEVEMENTS)
+    check("save round-trips", normalize_save(decoded) == normalize_save(save))
+    check("replay events keep their order", decoded["side"]["replay"]["events"] == save["side"]["replay"]["events"])
+
+    # IDs missing from the tables go to *_extra, once each, in order
+    check("seen_nodes_extra holds IDs missing from the node table", encoded["main"].get("seen_nodes_extra") == ["CH9_NEW"])
+    check("achievements_extra holds IDs missing from the achievement table",
+          encoded["flags"].get("achievements_extra") == ["SIDE_CASE_9"])
+
+    # Achievement bitset: bits 0 and 2 set, table size recorded
+    check("achievements_bits marks table positions",
+          _b64decode(encoded["flags"].get("achievements_bits", "")) == bytes([0b101]))
+    check("achievement_table_size is recorded", encoded["version"]["achievement_table_size"] == len(SELF_TEST_ACHIEVEMENTS))
+    without_table = encode_save(save, SELF_TEST_NODES)
+    check("without an achievement table every unlock is extra",
+          without_table["flags"].get("achievements_extra") == ["READER_25", "SIDE_CASE_9", "CHAPTER_1_COMPLETE"])
+    check("achievements round-trip without a table",
+          normalize_save(decode_save(without_table, SELF_TEST_NODES)) == normalize_save(save))
+
+    # Tables grow by appending: older saves decode against newer tables
+    grown_nodes = SELF_TEST_NODES + ["CH2_001", "CH9_NEW"]
+    grown_achievements = SELF_TEST_ACHIEVEMENTS + ["SIDE_CASE_9"]
+    check("a save decodes against grown tables",
+          normalize_save(decode_save(encoded, grown_nodes, grown_achievements)) == normalize_save(save))
+    reencoded = encode_save(decode_save(encoded, grown_nodes, grown_achievements), grown_nodes, grown_achievements)
+    check("re-encoding against grown tables moves extras into the bitsets",
+          reencoded["main"].get("seen_nodes_extra") == [] and reencoded["flags"].get("achievements_extra") == [])
+    check("a save needing more table entries than exist is rejected",
+          raises(decode_save, encoded, SELF_TEST_NODES[:-1], SELF_TEST_ACHIEVEMENTS))
+
+    # Godot's JSON parser reads integers as floats
+    floats = copy.deepcopy(encoded)
+    floats["version"]["node_table_size"] = float(len(SELF_TEST_NODES))
+    floats["version"]["achievement_table_size"] = float(len(SELF_TEST_ACHIEVEMENTS))
+    check("float table sizes are accepted",
+          normalize_save(decode_save(floats, SELF_TEST_NODES, SELF_TEST_ACHIEVEMENTS)) == normalize_save(save))
+
+    # Saves written before achievement bitsets have no achievement_table_size
+    old = copy.deepcopy(encoded)
+    del old["version"]["achievement_table_size"]
+    old["flags"] = {"achievements_unlocked": ["FIRST_SEAL"]}
+    check("saves without achievement bitsets decode",
+          decode_save(old, SELF_TEST_NODES, SELF_TEST_ACHIEVEMENTS)["flags"] == {"achievements_unlocked": ["FIRST_SEAL"]})
+
+    # Unknown event shapes keep the whole list unpacked
+    for label, event in [
+        ("an extra field", {"type": "question", "turn": 1, "question_id": "Q1", "answer": "yes", "note": "x"}),
+        ("an unknown type", {"type": "guess", "turn": 2, "text": "the lamp"}),
+        ("a negative turn", {"type": "hint", "turn": -1, "hint_index": 0}),
+        ("a non-object event", "Q1"),
+    ]:
+        unknown = _self_test_save()
+        unknown["side"]["replay"]["events"].append(event)
+        encoded_unknown = encode_save(unknown, SELF_TEST_NODES, SELF_TEST_ACHIEVEMENTS)
+        replay = encoded_unknown["side"]["replay"]
+        check(f"events with {label} stay unpacked", "events_packed" not in replay and replay["events"] == unknown["side"]["replay"]["events"])
+        check(f"events with {label} round-trip",
+              normalize_save(decode_save(encoded_unknown, SELF_TEST_NODES, SELF_TEST_ACHIEVEMENTS)) == normalize_save(unknown))
+
+    check("unknown packed event kinds are rejected", raises(unpack_events, _b64encode(bytes([7, 1])), []))
+    check("out-of-range event strings are rejected", raises(unpack_events, _b64encode(bytes([EVENT_QUESTION, 1, 0, 0])), []))
+
+    return failures
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Reference codec for compact SaveManager saves")
+    parser.add_argument("--self-test", action="store_true", help="Round-trip built-in fixtures and exit")
+    args = parser.parse_args()
+
+    if not args.self_test:
+        parser.print_help()
+        print("\nsave_tool.py compact|expand converts save directories")
+        return
+
+    failures = self_test()
+
+    print("="*60)
+    print("SAVE CODEC SELF-TEST")
+    print("="*60)
+    if failures:
+        print(f"\n[X] FAILURES ({len(failures)}):")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\n[OK] All round trips passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,561 @@
+#!/usr/bin/env python3
+"""
+Save Tool
+Validates, migrates and analyzes SaveManager save files (user://saves)
+Works on whole directories of QA and player-report saves in parallel
+Also the reference implementation of the slot index sidecar (index.json)
+"""
+
+import hashlib
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+from json_io import JSONDecodeError, dumps, loads, read_json, write_json
+from save_codec import (
+    SaveCodecError, decode_save, encode_save, is_compact, load_achievement_table,
+    load_node_table, normalize_save, serialize_compact
+)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+GAME_STATE_PATH = PROJECT_ROOT / "src" / "core" / "GameState.gd"
+PROJECT_FILE = PROJECT_ROOT / "project.godot"
+REPORT_PATH = PROJECT_ROOT / "tools" / "logs" / "save_analysis.json"
+
+# Same naming as SaveManager._get_save_path()
+SAVE_FILE_PATTERN = re.compile(r"^(save|auto)_(\d{3})\.json$")
+AUTO_SLOT_OFFSET = 1000
+MAX_MANUAL_SLOTS = 100
+MAX_AUTO_SLOTS = 10
+MAX_CHAPTER = 7
+
+# Slot index sidecar read by SaveManager._scan_save_slots(). The name must
+# not look like a save: SaveManager takes the slot from the part after "_".
+INDEX_FILE = "index.json"
+INDEX_FORMAT = 1
+INDEX_FIELDS = [
+    "slot", "created_at", "updated_at", "chapter", "playtime_seconds",
+    "file_size", "modified_time", "hash", "schema_version", "build_flavor"
+]
+
+READ_ERRORS = (UnicodeDecodeError, JSONDecodeError, SaveCodecError, OSError)
+
+# The 13 GameState domains, in declaration order
+DOMAINS = [
+    "meta", "nav", "main", "stance", "archive", "evidence", "ending",
+    "ui", "settings", "learning", "side", "flags", "version"
+]
+
+
+def read_schema_version() -> int:
+    """Current SCHEMA_VERSION, read from GameState.gd so the two cannot drift"""
+    match = re.search(r"const SCHEMA_VERSION\s*:?=\s*(\d+)", GAME_STATE_PATH.read_text(encoding='utf-8'))
+    if not match:
+        print(f"[X] SCHEMA_VERSION not found in {GAME_STATE_PATH}")
+        sys.exit(1)
+    return int(match.group(1))
+
+
+def default_saves_dir() -> Path:
+    """Godot's user://saves for this project on the current platform"""
+    match = re.search(r'config/name="([^"]*)"', PROJECT_FILE.read_text(encoding='utf-8'))
+    name = match.group(1) if match else ""
+
+    if sys.platform == "win32":
+        base = Path(os.environ.get("APPDATA", "")) / "Godot"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Application Support" / "Godot"
+    else:
+        base = Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share")) / "godot"
+
+    return base / "app_userdata" / name / "saves"
+
+
+def slot_for_file(name: str) -> Optional[int]:
+    """Slot number as SaveManager keys it (auto-saves at 1000+)"""
+    match = SAVE_FILE_PATTERN.match(name)
+    if not match:
+        return None
+    slot = int(match.group(2))
+    return slot + AUTO_SLOT_OFFSET if match.group(1) == "auto" else slot
+
+
+_node_table: Optional[List[str]] = None
+
+
+def get_node_table() -> List[str]:
+    """Node table for compact saves, loaded once per worker process"""
+    global _node_table
+    if _node_table is None:
+        _node_table = load_node_table()
+    return _node_table
+
+
+_achievement_table: Optional[List[str]] = None
+
+
+def get_achievement_table() -> List[str]:
+    """Achievement table for compact saves, loaded once per worker process"""
+    global _achievement_table
+    if _achievement_table is None:
+        _achievement_table = load_achievement_table()
+    return _achievement_table
+
+
+def serialize_save(data: Dict[str, Any]) -> str:
+    """Match SaveManager: JSON.stringify(state_data, "\\t")"""
+    return dumps(data, indent="\t")
+
+
+def index_row(path: Path, raw: bytes, data: Dict[str, Any]) -> List[Any]:
+    """One index row, in INDEX_FIELDS order (see SaveManager._metadata_from_state)"""
+    meta = data.get("meta", {})
+    version = data.get("version", {})
+    return [
+        slot_for_file(path.name),
+        meta.get("created_at", ""),
+        meta.get("updated_at", ""),
+        data.get("main", {}).get("chapter", 1),
+        meta.get("playtime_seconds", 0),
+        len(raw),
+        int(path.stat().st_mtime),
+        hashlib.sha256(raw).hexdigest(),
+        version.get("schema_version", 0),
+        version.get("build_flavor", "")
+    ]
+
+
+# Migration steps keyed by the schema version they upgrade from.
+# Each step takes a save at version N and returns it at version N + 1.
+MIGRATIONS: Dict[int, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+
+
+def migration(from_version: int):
+    def register(step: Callable[[Dict[str, Any]], Dict[str, Any]]):
+        MIGRATIONS[from_version] = step
+        return step
+    return register
+
+
+def migrate_save(data: Dict[str, Any], target: int) -> Dict[str, Any]:
+    """Run registered steps up to target, mirroring GameState._migrate_save_data()"""
+    from_version = data["version"]["schema_version"]
+
+    for version in range(from_version, target):
+        step = MIGRATIONS.get(version)
+        if step is not None:
+            data = step(data)
+
+    data["version"]["schema_version"] = target
+    data["version"]["last_migration"] = from_version
+    if isinstance(data.get("meta"), dict):
+        data["meta"]["save_version"] = target
+    return data
+
+
+def validate_save(data: Any, schema_version: int) -> List[str]:
+    """Structural checks SaveManager/GameState rely on when loading"""
+    if not isinstance(data, dict):
+        return ["top level is not an object"]
+
+    errors = []
+
+    version = data.get("version")
+    if not isinstance(version, dict) or "schema_version" not in version:
+        errors.append("missing version.schema_version")
+    elif not isinstance(version["schema_version"], int):
+        errors.append(f"schema_version {version['schema_version']!r} is not an integer")
+    elif version["schema_version"] > schema_version:
+        errors.append(f"schema {version['schema_version']} is newer than {schema_version}")
+
+    for domain in DOMAINS:
+        if not isinstance(data.get(domain), dict):
+            errors.append(f"missing domain '{domain}'")
+
+    main = data.get("main", {})
+    if isinstance(main, dict):
+        chapter = main.get("chapter")
+        if not isinstance(chapter, int) or not 1 <= chapter <= MAX_CHAPTER:
+            errors.append(f"main.chapter {chapter!r} outside 1-{MAX_CHAPTER}")
+        if not isinstance(main.get("seen_nodes", []), list):
+            errors.append("main.seen_nodes is not a list")
+
+    meta = data.get("meta", {})
+    if isinstance(meta, dict) and not isinstance(meta.get("playtime_seconds", 0), int):
+        errors.append("meta.playtime_seconds is not an integer")
+
+    return errors
+
+
+def read_save(raw: bytes) -> Tuple[Any, Any]:
+    """Parse save bytes into (stored, plain): compact saves are decoded"""
+    stored = loads(raw)
+    if isinstance(stored, dict) and is_compact(stored):
+        return stored, decode_save(stored, get_node_table(), get_achievement_table())
+    return stored, stored
+
+
+def write_save(path: Path, data: Dict[str, Any], compact: bool):
+    """Write a plain save in the requested encoding"""
+    if compact:
+        path.write_text(serialize_compact(encode_save(data, get_node_table(), get_achievement_table())), encoding='utf-8')
+    else:
+        path.write_text(serialize_save(data), encoding='utf-8')
+
+
+def analyze_save(path_str: str, schema_version: int) -> Dict[str, Any]:
+    """Validate one save and measure it per domain
+
+    Runs in a worker process, so it only takes and returns plain data.
+    """
+    path = Path(path_str)
+    raw = path.read_bytes()
+    result = {
+        "file": path.name,
+        "slot": slot_for_file(path.name),
+        "size": len(raw),
+        "schema_version": None,
+        "compact": False,
+        "errors": [],
+        "warnings": [],
+        "domains": {}
+    }
+
+    try:
+        stored, data = read_save(raw)
+    except READ_ERRORS as e:
+        result["errors"].append(f"unreadable - {e}")
+        return result
+
+    result["errors"] = validate_save(data, schema_version)
+    if not isinstance(data, dict):
+        return result
+
+    version = data.get("version")
+    if isinstance(version, dict):
+        result["schema_version"] = version.get("schema_version")
+        if isinstance(result["schema_version"], int) and result["schema_version"] < schema_version:
+            result["warnings"].append(f"schema {result['schema_version']} needs migration to {schema_version}")
+
+    unknown = [key for key in data if key not in DOMAINS]
+    if unknown:
+        result["warnings"].append(f"unknown domains: {', '.join(unknown)}")
+
+    # Size of each domain as it is stored in this file
+    result["compact"] = stored is not data
+    serialize = serialize_compact if result["compact"] else serialize_save
+    for domain, value in stored.items():
+        result["domains"][domain] = len(serialize(value).encode('utf-8'))
+
+    return result
+
+
+def migrate_file(path_str: str, schema_version: int, write: bool) -> Dict[str, Any]:
+    """Migrate one save in place (worker process)"""
+    path = Path(path_str)
+    result = {"file": path.name, "from": None, "migrated": False, "errors": []}
+
+    try:
+        stored, data = read_save(path.read_bytes())
+    except READ_ERRORS as e:
+        result["errors"].append(f"unreadable - {e}")
+        return result
+
+    errors = validate_save(data, schema_version)
+    if errors:
+        result["errors"] = errors
+        return result
+
+    result["from"] = data["version"]["schema_version"]
+    if result["from"] == schema_version:
+        return result
+
+    migrated = migrate_save(data, schema_version)
+    result["migrated"] = True
+
+    # Re-validate so a broken migration step never gets written
+    result["errors"] = validate_save(migrated, schema_version)
+    if write and not result["errors"]:
+        write_save(path, migrated, compact=stored is not data)
+
+    return result
+
+
+def index_file(path_str: str, schema_version: int) -> Dict[str, Any]:
+    """Build the index row for one save (worker process)"""
+    path = Path(path_str)
+    raw = path.read_bytes()
+    result = {"file": path.name, "row": None, "errors": []}
+
+    try:
+        _, data = read_save(raw)
+    except READ_ERRORS as e:
+        result["errors"].append(f"unreadable - {e}")
+        return result
+
+    result["errors"] = validate_save(data, schema_version)
+    if not result["errors"]:
+        result["row"] = index_row(path, raw, data)
+    return result
+
+
+def convert_file(path_str: str, schema_version: int, compact: bool, write: bool) -> Dict[str, Any]:
+    """Re-encode one save, checking the compact round trip first (worker process)"""
+    path = Path(path_str)
+    raw = path.read_bytes()
+    result = {"file": path.name, "before": len(raw), "after": len(raw), "converted": False, "errors": []}
+
+    try:
+        stored, data = read_save(raw)
+    except READ_ERRORS as e:
+        result["errors"].append(f"unreadable - {e}")
+        return result
+
+    result["errors"] = validate_save(data, schema_version)
+    if result["errors"]:
+        return result
+
+    tables = (get_node_table(), get_achievement_table())
+    encoded = encode_save(data, *tables)
+    if normalize_save(decode_save(encoded, *tables)) != normalize_save(data):
+        result["errors"].append("compact round trip does not reproduce the save")
+        return result
+
+    output = serialize_compact(encoded) if compact else serialize_save(data)
+    result["after"] = len(output.encode('utf-8'))
+    result["converted"] = (stored is not data) != compact
+
+    if write and result["converted"]:
+        path.write_text(output, encoding='utf-8')
+
+    return result
+
+
+class SaveTool:
+    def __init__(self, saves_dir: Path, jobs: Optional[int] = None):
+        self.saves_dir = saves_dir
+        self.jobs = jobs or os.cpu_count() or 1
+        self.schema_version = read_schema_version()
+        self.results = []
+        self.errors = []
+        self.warnings = []
+
+    def collect_saves(self) -> List[Path]:
+        """Save files under saves_dir; subdirectories allowed for batches of reports"""
+        if not self.saves_dir.exists():
+            print(f"[X] Saves directory not found: {self.saves_dir}")
+            sys.exit(1)
+        return sorted(path for path in self.saves_dir.rglob("*.json") if SAVE_FILE_PATTERN.match(path.name))
+
+    def run(self, worker: Callable, *args, saves: Optional[List[Path]] = None):
+        """Run worker over every save in parallel, keeping results in file order"""
+        if saves is None:
+            saves = self.collect_saves()
+        print(f"[SaveTool] {len(saves)} saves in {self.saves_dir}, schema {self.schema_version}, {self.jobs} workers")
+
+        with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+            futures = [pool.submit(worker, str(path), self.schema_version, *args) for path in saves]
+            for path, future in zip(saves, futures):
+                try:
+                    result = future.result()
+                except OSError as e:
+                    self.errors.append(f"{path}: {e}")
+                    continue
+                result["file"] = str(path.relative_to(self.saves_dir))
+                self.results.append(result)
+                self.errors.extend(f"{result['file']}: {error}" for error in result["errors"])
+                self.warnings.extend(f"{result['file']}: {warning}" for warning in result.get("warnings", []))
+
+    def analyze(self):
+        self.run(analyze_save)
+
+        slots = [result["slot"] for result in self.results]
+        manual = sum(1 for slot in slots if slot < AUTO_SLOT_OFFSET)
+        if manual > MAX_MANUAL_SLOTS + 1 or len(slots) - manual > MAX_AUTO_SLOTS:
+            self.warnings.append(f"{manual} manual / {len(slots) - manual} auto saves exceeds SaveManager slot limits")
+
+        totals = {}
+        peaks = {}
+        for result in self.results:
+            for domain, size in result["domains"].items():
+                totals[domain] = totals.get(domain, 0) + size
+                peaks[domain] = max(peaks.get(domain, 0), size)
+
+        total_size = sum(result["size"] for result in self.results)
+        count = len(self.results) or 1
+
+        print("\n[Domains] Serialized size across all saves")
+        print(f"  {'domain':<10} {'total':>12} {'mean':>10} {'max':>10} {'share':>7}")
+        for domain in sorted(totals, key=totals.get, reverse=True):
+            share = totals[domain] / total_size if total_size else 0.0
+            print(f"  {domain:<10} {totals[domain]:>12,} {totals[domain] // count:>10,} {peaks[domain]:>10,} {share:>7.1%}")
+        compact = sum(1 for result in self.results if result["compact"])
+        print(f"\n  {len(self.results)} saves ({compact} compact), {total_size:,} bytes (mean {total_size // count:,})")
+
+        REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        write_json(REPORT_PATH, {
+            "generated_at": datetime.now().isoformat(),
+            "saves_dir": str(self.saves_dir),
+            "schema_version": self.schema_version,
+            "total_size": total_size,
+            "domains": {domain: {"total": totals[domain], "max": peaks[domain]} for domain in totals},
+            "saves": self.results
+        }, indent=2)
+        print(f"  Report: {REPORT_PATH}")
+
+    def migrate(self, write: bool):
+        self.run(migrate_file, write)
+
+        migrated = [result for result in self.results if result["migrated"] and not result["errors"]]
+        for result in migrated:
+            print(f"  [OK] {result['file']}: schema {result['from']} -> {self.schema_version}")
+        print(f"\n  {len(migrated)} of {len(self.results)} saves {'migrated' if write else 'need migration'}")
+
+        if migrated and not write:
+            print("\nDry run - re-run with --write to apply")
+
+    def convert(self, compact: bool, write: bool):
+        """Convert saves to (compact) or from (expand) the compact encoding"""
+        self.run(convert_file, compact, write)
+
+        before = sum(result["before"] for result in self.results)
+        after = sum(result["after"] for result in self.results)
+        converted = [result for result in self.results if result["converted"] and not result["errors"]]
+        verified = sum(1 for result in self.results if not result["errors"])
+
+        for result in converted:
+            print(f"  [OK] {result['file']}: {result['before']:,} -> {result['after']:,} bytes")
+
+        saved = before - after
+        percent = saved / before if before else 0.0
+        print(f"\n  Round trip verified for {verified} of {len(self.results)} saves")
+        print(f"  Total: {before:,} -> {after:,} bytes (saved {saved:,}, {percent:.1%})")
+
+        if converted and not write:
+            print("\nDry run - re-run with --write to apply")
+
+    def load_index(self) -> Optional[Dict[int, List[Any]]]:
+        """Rows of the existing index by slot, or None if missing/unusable"""
+        index_path = self.saves_dir / INDEX_FILE
+        if not index_path.exists():
+            return None
+
+        try:
+            index = read_json(index_path)
+        except (UnicodeDecodeError, JSONDecodeError) as e:
+            self.warnings.append(f"{INDEX_FILE}: invalid JSON - {e}")
+            return None
+
+        if index.get("format") != INDEX_FORMAT or index.get("fields") != INDEX_FIELDS:
+            self.warnings.append(f"{INDEX_FILE}: unsupported format {index.get('format')!r}")
+            return None
+
+        return {row[0]: row for row in index.get("slots", [])}
+
+    def compare_index(self, actual: Dict[int, List[Any]]) -> List[str]:
+        """Differences between the index on disk and the saves themselves"""
+        existing = self.load_index()
+        if existing is None:
+            return [f"{INDEX_FILE}: missing or unreadable"]
+
+        problems = []
+        for slot in sorted(set(existing) | set(actual)):
+            if slot not in actual:
+                problems.append(f"{INDEX_FILE}: slot {slot} has no valid save file")
+            elif slot not in existing:
+                problems.append(f"{INDEX_FILE}: slot {slot} missing from index")
+            elif existing[slot] != actual[slot]:
+                changed = [field for field, old, new in zip(INDEX_FIELDS, existing[slot], actual[slot]) if old != new]
+                problems.append(f"{INDEX_FILE}: slot {slot} stale ({', '.join(changed)})")
+        return problems
+
+    def index(self, mode: str):
+        """Build, verify or repair the slot index from the saves themselves
+
+        build rewrites it from scratch, verify reports stale/missing/extra rows,
+        repair is verify followed by writing the corrected index.
+        """
+        # The runtime only looks at the top level of user://saves
+        self.run(index_file, saves=[path for path in self.collect_saves() if path.parent == self.saves_dir])
+        actual = {result["row"][0]: result["row"] for result in self.results if result["row"] is not None}
+
+        if mode != "build":
+            problems = self.compare_index(actual)
+            if mode == "verify":
+                self.errors.extend(problems)
+                print(f"\n  {len(actual)} valid saves, {len(problems)} index problems")
+                return
+            if not problems:
+                print(f"\n  [OK] {INDEX_FILE} already matches {len(actual)} saves")
+                return
+            for problem in problems:
+                print(f"  [!] Repairing {problem}")
+
+        index = {
+            "format": INDEX_FORMAT,
+            "fields": INDEX_FIELDS,
+            "slots": [actual[slot] for slot in sorted(actual)]
+        }
+        index_path = self.saves_dir / INDEX_FILE
+        write_json(index_path, index)
+
+        print(f"\n  [OK] {INDEX_FILE}: {len(actual)} slots, {index_path.stat().st_size:,} bytes")
+
+    def print_report(self):
+        print("\n" + "="*60)
+        print("SAVE TOOL REPORT")
+        print("="*60)
+
+        if self.errors:
+            print(f"\n[X] ERRORS ({len(self.errors)}):")
+            for error in self.errors:
+                print(f"  - {error}")
+
+        if self.warnings:
+            print(f"\n[!] WARNINGS ({len(self.warnings)}):")
+            for warning in self.warnings:
+                print(f"  - {warning}")
+
+        if not self.errors:
+            print(f"\n[OK] All {len(self.results)} saves valid")
+        else:
+            print(f"\n[X] {len(self.errors)} problems found")
+            sys.exit(1)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Validate, migrate and analyze save files")
+    parser.add_argument("command", choices=["analyze", "migrate", "index", "verify-index", "repair-index", "compact", "expand"],
+                        help="analyze: validate + size breakdown; migrate: upgrade to current schema; "
+                             "index/verify-index/repair-index: maintain the slot index sidecar; "
+                             "compact/expand: convert to/from the compact encoding")
+    parser.add_argument("saves_dir", nargs="?", type=Path, help="Saves directory (default: this project's user://saves)")
+    parser.add_argument("--write", action="store_true", help="With migrate/compact/expand, rewrite saves in place (default: dry run)")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+
+    args = parser.parse_args()
+
+    print("="*60)
+    print("SAVE TOOL")
+    print("="*60)
+
+    tool = SaveTool(args.saves_dir or default_saves_dir(), jobs=args.jobs)
+    if args.command == "analyze":
+        tool.analyze()
+    elif args.command == "migrate":
+        tool.migrate(args.write)
+    elif args.command in ("compact", "expand"):
+        tool.convert(args.command == "compact", args.write)
+    else:
+        tool.index({"index": "build", "verify-index": "verify", "repair-index": "repair"}[args.command])
+    tool.print_report()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Scene Parser - Streaming parser for markdown scene sources
+Reads the files listed in content/story_index.json one line at a time and
+yields story nodes as soon as they are complete
+
+Scene format:
+
+    # Scene title                     (optional, ignored by the compiler)
+    @chapter 1                        (required before the first node)
+    @pov emperor                      (scene default; inside a node: that node only)
+    @speaker narrator                 (scene default; inside a node: that node only)
+    @bg PLACEHOLDER_BG                (scene default; inside a node: that node only)
+
+    ## CH1_START                      (starts a node; optional type after the ID)
+    @tag intro
+    english: Chapter 1 begins.
+    schinese: 第1章开始。
+      Indented lines continue the previous text on a new line.
+    -> CH1_002                        (explicit next; default is the following node)
+
+    ## CH1_002 choice
+    english: What should I do?
+    * -> CH1_003                      (choice; indented lines below belong to it)
+      english: Summon the ministers
+      @if visited_all_pov
+      @effect stance.axis_truth +5
+      @effect flags.met_minister true
+
+Blank lines and <!-- single-line comments --> are ignored.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional, Iterable
+
+POVS = {"all", "emperor", "consort", "minister"}
+NODE_TYPES = {"dialogue", "choice", "investigation", "chapter_end", "interrogation", "archive"}
+NODE_ID_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]*$")
+TEXT_LINE_PATTERN = re.compile(r"^([a-z_]+):\s?(.*)$")
+SCENE_DIRECTIVES = {"chapter", "pov", "speaker", "bg"}
+NODE_DIRECTIVES = {"pov", "speaker", "bg", "tag"}
+CHOICE_DIRECTIVES = {"if", "effect"}
+
+
+class SceneParseError:
+    """A problem at a specific source position"""
+
+    def __init__(self, path: Path, line: int, message: str):
+        self.path = path
+        self.line = line
+        self.message = message
+
+    def __str__(self):
+        return f"{self.path}:{self.line}: {self.message}"
+
+
+def parse_effect_value(raw: str) -> Any:
+    if raw in ("true", "false"):
+        return raw == "true"
+    try:
+        return int(raw)
+    except ValueError:
+        return raw
+
+
+class SceneParser:
+    """Line-oriented parser for one scene file
+
+    Nodes are yielded as soon as the next node header (or end of file) is
+    reached, so memory stays bounded by the size of a single node plus the
+    set of IDs seen in the scene.
+    """
+
+    def __init__(self, path: Path, scene_id: str, languages: Iterable[str], default_bg: str = ""):
+        self.path = path
+        self.scene_id = scene_id
+        self.languages = set(languages)
+        self.errors: List[SceneParseError] = []
+
+        self.chapter: Optional[int] = None
+        self.defaults = {"pov": "all", "speaker": "narrator", "bg": default_bg}
+        self.seen_ids = set()
+        # First node of the scene, used to chain scenes together
+        self.first_node_id: Optional[str] = None
+
+        self._node: Optional[Dict[str, Any]] = None
+        self._choice: Optional[Dict[str, Any]] = None
+        self._last_text: Optional[tuple] = None
+        self._explicit_next = False
+
+    def error(self, line: int, message: str):
+        self.errors.append(SceneParseError(self.path, line, message))
+
+    def parse(self) -> Iterator[Dict[str, Any]]:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            yield from self.parse_lines(f)
+
+    def parse_lines(self, lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        line_number = 0
+        for line_number, raw in enumerate(lines, 1):
+            line = raw.rstrip("\r\n")
+            stripped = line.strip()
+
+            if not stripped or (stripped.startswith("<!--") and stripped.endswith("-->")):
+                continue
+
+            indented = line[:1] in (" ", "\t")
+
+            if stripped.startswith("## "):
+                yield from self._start_node(stripped[3:].split(), line_number)
+            elif stripped.startswith("# "):
+                continue
+            elif stripped.startswith("@"):
+                self._directive(stripped[1:], indented, line_number)
+            elif stripped.startswith("* "):
+                self._start_choice(stripped[2:], line_number)
+            elif stripped.startswith("->"):
+                self._set_next(stripped[2:].strip(), line_number)
+            else:
+                self._text(line, stripped, indented, line_number)
+
+        yield from self._finish_node(None, line_number)
+
+    def _start_node(self, parts: List[str], line_number: int) -> Iterator[Dict[str, Any]]:
+        if self.chapter is None:
+            self.error(line_number, "@chapter must be set before the first node")
+
+        node_id = parts[0] if parts else ""
+        node_type = parts[1] if len(parts) > 1 else ""
+
+        if not NODE_ID_PATTERN.match(node_id):
+            self.error(line_number, f"invalid node ID '{node_id}'")
+        elif node_id in self.seen_ids:
+            self.error(line_number, f"duplicate node ID '{node_id}'")
+        if node_type and node_type not in NODE_TYPES:
+            self.error(line_number, f"unknown node type '{node_type}'")
+
+        yield from self._finish_node(node_id, line_number)
+
+        self.seen_ids.add(node_id)
+        if self.first_node_id is None:
+            self.first_node_id = node_id
+
+        self._node = {
+            "id": node_id,
+            "type": node_type,
+            "speaker": self.defaults["speaker"],
+            "text": {},
+            "next": "",
+            "pov": self.defaults["pov"],
+            "tags": [],
+            "choices": [],
+            "metadata": {"scene": self.scene_id, "background": self.defaults["bg"]},
+            "_line": line_number,
+            "_chapter": self.chapter
+        }
+        self._choice = None
+        self._last_text = None
+        self._explicit_next = False
+
+    def _finish_node(self, following_id: Optional[str], line_number: int) -> Iterator[Dict[str, Any]]:
+        """Close the current node; its default next is the node that follows"""
+        node = self._node
+        if node is None:
+            return
+
+        if not node["type"]:
+            node["type"] = "choice" if node["choices"] else "dialogue"
+        if not node["text"] and node["type"] != "choice":
+            self.error(node["_line"], f"node '{node['id']}' has no text")
+
+        # Choice nodes continue through their choices, not a default next
+        if not self._explicit_next and following_id and not node["choices"]:
+            node["next"] = following_id
+
+        if not node["choices"]:
+            del node["choices"]
+
+        self._node = None
+        yield node
+
+    def _directive(self, body: str, indented: bool, line_number: int):
+        name, _, value = body.partition(" ")
+        value = value.strip()
+
+        if indented and self._choice is not None:
+            if name not in CHOICE_DIRECTIVES:
+                self.error(line_number, f"unknown choice directive '@{name}'")
+            elif name == "if":
+                self._choice["conditions"].append(value)
+            else:
+                self._effect(value, line_number)
+            return
+
+        if self._node is None:
+            if name not in SCENE_DIRECTIVES:
+                self.error(line_number, f"unknown scene directive '@{name}'")
+                return
+            if name == "chapter":
+                if not value.isdigit():
+                    self.error(line_number, f"invalid chapter '{value}'")
+                    return
+                self.chapter = int(value)
+                return
+            if name == "pov" and value not in POVS:
+                self.error(line_number, f"unknown POV '{value}'")
+                return
+            self.defaults[name] = value
+            return
+
+        if name not in NODE_DIRECTIVES:
+            self.error(line_number, f"unknown node directive '@{name}'")
+        elif name == "pov":
+            if value not in POVS:
+                self.error(line_number, f"unknown POV '{value}'")
+            self._node["pov"] = value
+        elif name == "speaker":
+            self._node["speaker"] = value
+        elif name == "bg":
+            self._node["metadata"]["background"] = value
+        else:
+            self._node["tags"].append(value)
+
+    def _effect(self, value: str, line_number: int):
+        # "stance.axis_loyalty.consort +10" -> {"stance": {"axis_loyalty": {"consort": 10}}}
+        path, _, raw = value.partition(" ")
+        keys = path.split(".")
+        if len(keys) < 2 or not raw:
+            self.error(line_number, f"invalid effect '{value}'")
+            return
+
+        target = self._choice["effects"]
+        for key in keys[:-1]:
+            target = target.setdefault(key, {})
+        target[keys[-1]] = parse_effect_value(raw.strip())
+
+    def _start_choice(self, body: str, line_number: int):
+        if self._node is None:
+            self.error(line_number, "choice outside of a node")
+            return
+
+        target = body[2:].strip() if body.startswith("->") else ""
+        if not target:
+            self.error(line_number, "choice needs a target: '* -> NODE_ID'")
+
+        self._choice = {"text": {}, "next": target, "conditions": [], "effects": {}, "_line": line_number}
+        self._node["choices"].append(self._choice)
+        self._last_text = None
+
+    def _set_next(self, target: str, line_number: int):
+        if self._node is None:
+            self.error(line_number, "'->' outside of a node")
+            return
+        if not target:
+            self.error(line_number, "'->' needs a target node ID")
+        self._node["next"] = target
+        self._explicit_next = True
+        self._choice = None
+
+    def _text(self, line: str, stripped: str, indented: bool, line_number: int):
+        match = TEXT_LINE_PATTERN.match(stripped)
+
+        if match and match.group(1) in self.languages:
+            if self._node is None:
+                self.error(line_number, "text outside of a node")
+                return
+            lang, text = match.groups()
+            # Indented text belongs to the open choice, unindented text to the node
+            if not indented:
+                self._choice = None
+            owner = self._choice if self._choice is not None else self._node
+            if lang in owner["text"]:
+                self.error(line_number, f"duplicate '{lang}' text")
+            owner["text"][lang] = text
+            self._last_text = (owner, lang)
+            return
+
+        if match and not indented:
+            self.error(line_number, f"unknown language '{match.group(1)}'")
+            return
+
+        if indented and self._last_text is not None:
+            owner, lang = self._last_text
+            owner["text"][lang] += "\n" + stripped
+            return
+
+        self.error(line_number, f"unexpected line: {stripped[:40]}")
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Share Code - Turtle soup replay share codes
+Reference encoder/decoder for the codes TurtleSoup._generate_share_code()
+produces, and a batch analyzer for community-submitted codes
+
+Format (base64url, no padding):
+
+    header byte     FORMAT_VERSION << 1 | compressed flag
+    body            zlib-compressed when that is smaller, otherwise raw:
+        varint case number (CASE_007 -> 7)
+        varint turns, varint hints, varint event count
+        per event: varint (question number << 1) or (hint index << 1 | 1),
+                   then varint turn delta from the previous event
+
+Answers are not stored; they come from the case file when decoding.
+Legacy codes (standard base64 of the replay JSON) are still accepted.
+"""
+
+import base64
+import binascii
+import re
+import statistics
+import sys
+import time
+import zlib
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+
+from json_io import JSONDecodeError, dumps, loads, read_json, write_json
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SIDE_DIR = PROJECT_ROOT / "content" / "side"
+REPORT_PATH = PROJECT_ROOT / "tools" / "logs" / "share_code_stats.json"
+
+FORMAT_VERSION = 1
+CASE_ID_PATTERN = re.compile(r"^CASE_(\d+)$")
+QUESTION_ID_PATTERN = re.compile(r"^Q(\d+)$")
+
+
+class ShareCodeError(ValueError):
+    pass
+
+
+def write_varint(out: bytearray, value: int):
+    """Unsigned LEB128"""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ShareCodeError("truncated varint")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _number(pattern: re.Pattern, text: str, what: str) -> int:
+    match = pattern.match(text)
+    if not match:
+        raise ShareCodeError(f"cannot pack {what} '{text}'")
+    return int(match.group(1))
+
+
+def encode(replay: Dict[str, Any]) -> str:
+    """Replay dict (case_id, turns, hints, events) -> share code"""
+    body = bytearray()
+    write_varint(body, _number(CASE_ID_PATTERN, replay["case_id"], "case ID"))
+    write_varint(body, int(replay["turns"]))
+    write_varint(body, int(replay["hints"]))
+
+    events = replay.get("events", [])
+    write_varint(body, len(events))
+
+    previous_turn = 0
+    for event in events:
+        if event["type"] == "question":
+            write_varint(body, _number(QUESTION_ID_PATTERN, event["question_id"], "question ID") << 1)
+        elif event["type"] == "hint":
+            write_varint(body, int(event["hint_index"]) << 1 | 1)
+        else:
+            raise ShareCodeError(f"unknown event type '{event['type']}'")
+
+        turn = int(event["turn"])
+        if turn < previous_turn:
+            raise ShareCodeError("event turns go backwards")
+        write_varint(body, turn - previous_turn)
+        previous_turn = turn
+
+    compressed = zlib.compress(bytes(body), 9)
+    if len(compressed) < len(body):
+        payload = bytes([FORMAT_VERSION << 1 | 1]) + compressed
+    else:
+        payload = bytes([FORMAT_VERSION << 1]) + bytes(body)
+
+    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip("=")
+
+
+def _decode_legacy(code: str) -> Dict[str, Any]:
+    """Pre-v1 codes: Marshalls.raw_to_base64(JSON.stringify(replay))"""
+    try:
+        replay = loads(base64.b64decode(code, validate=True))
+    except (binascii.Error, UnicodeDecodeError, JSONDecodeError) as e:
+        raise ShareCodeError(f"not a share code - {e}")
+
+    if not isinstance(replay, dict) or "case_id" not in replay:
+        raise ShareCodeError("legacy code missing case_id")
+    replay["format"] = 0
+    return replay
+
+
+def decode(code: str, cases: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """Share code -> replay dict; answers are filled in when the case is known"""
+    code = code.strip()
+    if code.startswith("ey"):
+        # base64 of '{"' - a legacy JSON code
+        return _decode_legacy(code)
+
+    try:
+        payload = base64.urlsafe_b64decode(code + "=" * (-len(code) % 4))
+    except (binascii.Error, ValueError) as e:
+        raise ShareCodeError(f"invalid base64 - {e}")
+    if not payload:
+        raise ShareCodeError("empty code")
+
+    version, compressed = payload[0] >> 1, payload[0] & 1
+    if version != FORMAT_VERSION:
+        raise ShareCodeError(f"unsupported share code version {version}")
+
+    body = payload[1:]
+    if compressed:
+        try:
+            body = zlib.decompress(body)
+        except zlib.error as e:
+            raise ShareCodeError(f"corrupt payload - {e}")
+
+    case_num, offset = read_varint(body, 0)
+    turns, offset = read_varint(body, offset)
+    hints, offset = read_varint(body, offset)
+    count, offset = read_varint(body, offset)
+
+    case_id = f"CASE_{case_num:03d}"
+    answers = {}
+    if cases and case_id in cases:
+        answers = {question["id"]: question["answer"] for question in cases[case_id]["questions"]}
+
+    events = []
+    turn = 0
+    for _ in range(count):
+        packed, offset = read_varint(body, offset)
+        delta, offset = read_varint(body, offset)
+        turn += delta
+        if packed & 1:
+            events.append({"type": "hint", "turn": turn, "hint_index": packed >> 1})
+        else:
+            question_id = f"Q{packed >> 1:03d}"
+            events.append({"type": "question", "turn": turn, "question_id": question_id, "answer": answers.get(question_id, "")})
+
+    if offset != len(body):
+        raise ShareCodeError("trailing bytes after events")
+
+    return {"format": version, "case_id": case_id, "turns": turns, "hints": hints, "events": events}
+
+
+def load_cases() -> Dict[str, Dict[str, Any]]:
+    cases = {}
+    for path in sorted(SIDE_DIR.glob("case_*.json")):
+        case = read_json(path)
+        cases[case["case_id"]] = case
+    return cases
+
+
+def percentile(values: List[int], fraction: float) -> float:
+    ordered = sorted(values)
+    return float(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))])
+
+
+class ShareCodeAnalyzer:
+    def __init__(self):
+        self.cases = load_cases()
+        self.replays = {}
+        self.errors = []
+
+    def ingest(self, lines: List[str]):
+        """Decode every non-empty line; bad codes are counted, not fatal"""
+        for line_number, line in enumerate(lines, 1):
+            code = line.strip()
+            if not code or code.startswith("#"):
+                continue
+            try:
+                replay = decode(code, self.cases)
+            except ShareCodeError as e:
+                self.errors.append(f"line {line_number}: {e}")
+                continue
+            self.replays.setdefault(replay["case_id"], []).append(replay)
+
+    def case_stats(self, case_id: str, replays: List[Dict[str, Any]]) -> Dict[str, Any]:
+        turns = [replay["turns"] for replay in replays]
+        hints = [replay["hints"] for replay in replays]
+
+        openings = {}
+        for replay in replays:
+            first = next((event["question_id"] for event in replay["events"] if event["type"] == "question"), None)
+            if first:
+                openings[first] = openings.get(first, 0) + 1
+
+        return {
+            "solves": len(replays),
+            "known_case": case_id in self.cases,
+            "turns_min": min(turns),
+            "turns_mean": round(statistics.fmean(turns), 2),
+            "turns_median": statistics.median(turns),
+            "turns_p90": percentile(turns, 0.9),
+            "hints_mean": round(statistics.fmean(hints), 2),
+            "hint_rate": round(sum(1 for count in hints if count) / len(hints), 3),
+            "legacy_codes": sum(1 for replay in replays if replay["format"] == 0),
+            "top_openings": sorted(openings.items(), key=lambda item: -item[1])[:5]
+        }
+
+    def report(self, elapsed: float):
+        total = sum(len(replays) for replays in self.replays.values())
+        stats = {case_id: self.case_stats(case_id, replays) for case_id, replays in sorted(self.replays.items())}
+
+        print("\n" + "="*60)
+        print("SHARE CODE REPORT")
+        print("="*60)
+
+        for case_id, case in stats.items():
+            marker = "[OK]" if case["known_case"] else "[!]"
+            print(f"  {marker} {case_id}: {case['solves']} solves, turns mean {case['turns_mean']} "
+                  f"(min {case['turns_min']}, p90 {case['turns_p90']:.0f}), hints {case['hints_mean']} "
+                  f"({case['hint_rate']:.0%} used any)")
+
+        if self.errors:
+            print(f"\n[!] INVALID CODES ({len(self.errors)}):")
+            for error in self.errors[:20]:
+                print(f"  - {error}")
+            if len(self.errors) > 20:
+                print(f"  ... and {len(self.errors) - 20} more")
+
+        rate = total / elapsed if elapsed else 0
+        print(f"\n{total:,} codes decoded in {elapsed:.2f}s ({rate:,.0f}/s)")
+
+        REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        write_json(REPORT_PATH, {
+            "generated_at": datetime.now().isoformat(),
+            "codes": total,
+            "invalid": len(self.errors),
+            "cases": stats
+        }, indent=2)
+        print(f"Report: {REPORT_PATH}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Encode, decode and analyze turtle soup share codes")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    encode_parser = subparsers.add_parser("encode", help="Encode a replay JSON file")
+    encode_parser.add_argument("replay", type=Path)
+
+    decode_parser = subparsers.add_parser("decode", help="Decode one share code")
+    decode_parser.add_argument("code")
+
+    analyze_parser = subparsers.add_parser("analyze", help="Per-case solve statistics for a file of codes (one per line)")
+    analyze_parser.add_argument("codes", type=Path)
+
+    args = parser.parse_args()
+
+    if args.command == "encode":
+        replay = read_json(args.replay)
+        legacy = len(base64.b64encode(dumps(replay).encode('utf-8')))
+        code = encode(replay)
+        print(code)
+        print(f"[OK] {len(code)} chars (legacy format: {legacy})", file=sys.stderr)
+
+    elif args.command == "decode":
+        try:
+            print(dumps(decode(args.code, load_cases()), indent=2))
+        except ShareCodeError as e:
+            print(f"[X] {e}")
+            sys.exit(1)
+
+    else:
+        analyzer = ShareCodeAnalyzer()
+        start = time.perf_counter()
+        with open(args.codes, 'r', encoding='utf-8') as f:
+            analyzer.ingest(f.readlines())
+        analyzer.report(time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
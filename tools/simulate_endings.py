@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+Ending Simulator
+Plays the compiled 7-chapter run through every story choice, interrogation
+and archive seal to report which endings in content/main/endings.json are
+reachable and how likely each one is
+
+Exact: forward search over (node, stance) states, merging identical states
+so each is expanded once, with probability mass under uniformly random play
+Sampled: vectorized Monte Carlo over millions of playthroughs (NumPy)
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    print("[X] NumPy not installed")
+    print("    Install with: pip install numpy")
+    sys.exit(1)
+
+from compile_interrogations import (
+    MAX_EXACT_QUESTIONS, POV_AXES, SCALAR_AXES, STANCE_MAX, STANCE_MIN, read_stance_povs, stance_vector
+)
+from json_io import loads, read_json, write_json
+
+PROJECT_ROOT = Path(__file__).parent.parent
+MAIN_DIR = PROJECT_ROOT / "content" / "main"
+ENDINGS_PATH = MAIN_DIR / "endings.json"
+INTERROGATION_DIR = PROJECT_ROOT / "content" / "interrogation"
+INTERROGATION_INDEX_PATH = INTERROGATION_DIR / "interrogation_index.json"
+ARCHIVE_SEALING_PATH = PROJECT_ROOT / "src" / "investigation" / "ArchiveSealing.gd"
+REPORT_PATH = PROJECT_ROOT / "tools" / "logs" / "ending_simulation.json"
+
+CHAPTER_COUNT = 7
+DEFAULT_INTERROGATION = "INT_001"
+NO_ENDING = "(none)"
+
+# Node visits per chapter before a playthrough counts as stuck in a loop
+MAX_STEPS_PER_NODE = 8
+
+
+def read_seal_effects() -> Dict[str, Dict[str, int]]:
+    """SEAL_STANCE_EFFECTS from ArchiveSealing.gd, so the two cannot drift"""
+    text = ARCHIVE_SEALING_PATH.read_text(encoding='utf-8')
+    match = re.search(r"const SEAL_STANCE_EFFECTS\s*:?=\s*(\{.*?\n\})", text, re.DOTALL)
+    if not match:
+        print(f"[X] SEAL_STANCE_EFFECTS not found in {ARCHIVE_SEALING_PATH}")
+        sys.exit(1)
+    return loads(re.sub(r"#[^\n]*", "", match.group(1)))
+
+
+class EndingSimulator:
+    def __init__(self, seed: int):
+        self.seed = seed
+        self.errors = []
+        self.warnings = []
+
+        povs = read_stance_povs()
+        self.axes = [(axis, None) for axis in SCALAR_AXES] + [(axis, pov) for axis in POV_AXES for pov in povs[axis]]
+        self.labels = [axis if pov is None else f"{axis}.{pov}" for axis, pov in self.axes]
+
+        self.seals = read_seal_effects()
+        self.interrogations = {}
+        self.endings = self.load_endings()
+        self.chapters = [self.load_chapter(chapter) for chapter in range(1, CHAPTER_COUNT + 1)]
+
+    # -- Loading -------------------------------------------------------------
+
+    def delta(self, stance_change: Dict[str, Any]) -> Tuple[int, ...]:
+        return tuple(stance_vector(stance_change, self.axes))
+
+    def load_endings(self) -> List[Dict[str, Any]]:
+        """Endings with conditions flattened to (column, min, max)"""
+        if not ENDINGS_PATH.exists():
+            self.errors.append(f"Endings not found: {ENDINGS_PATH}")
+            return []
+
+        endings = []
+        for ending in read_json(ENDINGS_PATH).get("endings", []):
+            bounds = []
+            for label, condition in ending.get("conditions", {}).items():
+                if label not in self.labels:
+                    self.errors.append(f"{ending['id']}: unknown stance axis '{label}'")
+                    continue
+                bounds.append((self.labels.index(label), condition.get("min", STANCE_MIN), condition.get("max", STANCE_MAX)))
+            endings.append({"id": ending["id"], "bounds": bounds})
+
+        if endings and endings[-1]["bounds"]:
+            self.warnings.append(f"last ending '{endings[-1]['id']}' has conditions; some runs may get no ending")
+        return endings
+
+    def interrogation_outcomes(self, interrogation_id: str) -> List[List[Tuple[int, ...]]]:
+        """Stance deltas, in asking order, for every set of questions a player can leave with"""
+        if interrogation_id in self.interrogations:
+            return self.interrogations[interrogation_id]
+
+        index = read_json(INTERROGATION_INDEX_PATH).get("interrogations", {}) if INTERROGATION_INDEX_PATH.exists() else {}
+        if interrogation_id not in index:
+            self.errors.append(f"interrogation '{interrogation_id}' is not compiled")
+            self.interrogations[interrogation_id] = [[]]
+            return [[]]
+
+        data = read_json(INTERROGATION_DIR / index[interrogation_id]["file"])
+        questions = data["questions"]
+        deltas = [self.delta(question.get("stance_change", {})) for question in questions]
+        unlock_masks = [sum(1 << target for target in question["unlocks"]) for question in questions]
+
+        outcomes = []
+        if len(questions) > MAX_EXACT_QUESTIONS:
+            # Too many sets: use the prefixes of one asking order
+            self.warnings.append(f"{interrogation_id}: more than {MAX_EXACT_QUESTIONS} questions, "
+                                 f"only prefixes of one asking order are simulated")
+            order, available, asked = [], sum(1 << position for position in data["initial"]), 0
+            while available & ~asked:
+                position = ((available & ~asked) & -(available & ~asked)).bit_length() - 1
+                asked |= 1 << position
+                available |= unlock_masks[position]
+                order.append(position)
+            outcomes = [[deltas[position] for position in order[:length]] for length in range(len(order) + 1)]
+        else:
+            seen = {0}
+            stack = [(0, sum(1 << position for position in data["initial"]), [])]
+            while stack:
+                asked, available, order = stack.pop()
+                outcomes.append([deltas[position] for position in order])
+                options = available & ~asked
+                while options:
+                    low = options & -options
+                    options ^= low
+                    if asked | low not in seen:
+                        seen.add(asked | low)
+                        position = low.bit_length() - 1
+                        stack.append((asked | low, available | unlock_masks[position], order + [position]))
+
+        self.interrogations[interrogation_id] = outcomes
+        return outcomes
+
+    def load_chapter(self, chapter: int) -> Dict[str, Any]:
+        """Transition table: node ID -> [(stance deltas applied in order, next node or None)]"""
+        path = MAIN_DIR / f"chapter_{chapter}.json"
+        if not path.exists():
+            self.errors.append(f"Chapter not compiled: {path}")
+            return {"start": None, "transitions": {}}
+
+        nodes = read_json(path)["nodes"]
+        if isinstance(nodes, list):
+            nodes = {node["id"]: node for node in nodes}
+
+        seal_deltas = [self.delta(effects) for effects in self.seals.values()]
+        transitions = {}
+        for node_id, node in nodes.items():
+            before = [self.delta(node["effects"]["stance"])] if "stance" in node.get("effects", {}) else []
+
+            def target(next_id: Optional[str]) -> Optional[str]:
+                # Leaving the chapter (CHn_END -> CHn+1_START) ends this chapter's walk
+                return next_id if next_id in nodes and node.get("type") != "chapter_end" else None
+
+            if node.get("type") == "choice" and node.get("choices"):
+                transitions[node_id] = [
+                    (before + ([self.delta(choice["effects"]["stance"])] if "stance" in choice.get("effects", {}) else []),
+                     target(choice.get("next")))
+                    for choice in node["choices"]
+                ]
+            elif node.get("type") == "investigation":
+                outcomes = self.interrogation_outcomes(node.get("interrogation", DEFAULT_INTERROGATION))
+                transitions[node_id] = [
+                    (before + outcome + [seal], target(node.get("next")))
+                    for outcome in outcomes for seal in seal_deltas
+                ]
+            else:
+                transitions[node_id] = [(before, target(node.get("next")))]
+
+        start = f"CH{chapter}_START"
+        if start not in nodes:
+            self.errors.append(f"chapter {chapter}: missing {start}")
+            return {"start": None, "transitions": {}}
+
+        # Skip over nodes with one option and no stance effect (dialogue runs)
+        def skip(node_id: Optional[str]) -> Optional[str]:
+            visited = set()
+            while node_id is not None and node_id not in visited:
+                options = transitions[node_id]
+                if len(options) != 1 or options[0][0]:
+                    break
+                visited.add(node_id)
+                node_id = options[0][1]
+            return node_id
+
+        start = skip(start)
+        kept = {}
+        pending = [start] if start is not None else []
+        while pending:
+            node_id = pending.pop()
+            if node_id in kept:
+                continue
+            kept[node_id] = [(deltas, skip(next_id)) for deltas, next_id in transitions[node_id]]
+            pending.extend(next_id for _, next_id in kept[node_id] if next_id is not None)
+
+        return {"start": start, "transitions": kept}
+
+    # -- Exact search --------------------------------------------------------
+
+    @staticmethod
+    def apply(stance: Tuple[int, ...], deltas: List[Tuple[int, ...]]) -> Tuple[int, ...]:
+        """Apply deltas one at a time, clamping like GameState after each"""
+        for delta in deltas:
+            stance = tuple(min(STANCE_MAX, max(STANCE_MIN, value + change)) for value, change in zip(stance, delta))
+        return stance
+
+    def ending_for(self, stance: Tuple[int, ...]) -> str:
+        for ending in self.endings:
+            if all(low <= stance[column] <= high for column, low, high in ending["bounds"]):
+                return ending["id"]
+        return NO_ENDING
+
+    def explore(self) -> Dict[str, Any]:
+        """Distribution over final stances, one chapter at a time
+
+        Identical (node, stance) states are merged, so each is expanded once
+        per step no matter how many paths reach it.
+        """
+        states = {tuple([0] * len(self.axes)): 1.0}
+        expanded = 0
+        stuck = 0.0
+
+        for chapter, data in enumerate(self.chapters, 1):
+            if data["start"] is None:
+                continue
+            frontier = {data["start"]: states}
+            finished = {}
+
+            for _ in range(MAX_STEPS_PER_NODE * len(data["transitions"])):
+                if not frontier:
+                    break
+                next_frontier = {}
+                for node_id, distribution in frontier.items():
+                    options = data["transitions"][node_id]
+                    share = 1.0 / len(options)
+                    for stance, probability in distribution.items():
+                        expanded += 1
+                        for deltas, next_id in options:
+                            result = self.apply(stance, deltas)
+                            bucket = finished if next_id is None else next_frontier.setdefault(next_id, {})
+                            bucket[result] = bucket.get(result, 0.0) + probability * share
+                frontier = next_frontier
+
+            if frontier:
+                leftover = sum(sum(distribution.values()) for distribution in frontier.values())
+                self.warnings.append(f"chapter {chapter}: {leftover:.2%} of play still looping after "
+                                     f"{MAX_STEPS_PER_NODE} visits per node, dropped")
+                stuck += leftover
+
+            states = finished
+            print(f"  Chapter {chapter}: {len(states):,} distinct stances")
+
+        probabilities = {}
+        for stance, probability in states.items():
+            ending = self.ending_for(stance)
+            probabilities[ending] = probabilities.get(ending, 0.0) + probability
+
+        final = np.array(list(states), dtype=np.int32).reshape(-1, len(self.axes))
+        return {
+            "states_expanded": expanded,
+            "final_stances": len(states),
+            "dropped_probability": stuck,
+            "probabilities": probabilities,
+            "ranges": {label: [int(final[:, column].min()), int(final[:, column].max())]
+                       for column, label in enumerate(self.labels)} if len(final) else {}
+        }
+
+    # -- Monte Carlo ---------------------------------------------------------
+
+    def sample(self, runs: int, batch: int) -> Dict[str, int]:
+        """Vectorized playthroughs: every run at the same node advances together"""
+        rng = np.random.default_rng(self.seed)
+        counts = {}
+
+        for offset in range(0, runs, batch):
+            size = min(batch, runs - offset)
+            stance = np.zeros((size, len(self.axes)), dtype=np.int32)
+            # Runs still looping at the step limit are dropped, as in explore()
+            finished = np.ones(size, dtype=bool)
+
+            for data in self.chapters:
+                if data["start"] is None:
+                    continue
+                names = list(data["transitions"])
+                position = {node_id: i for i, node_id in enumerate(names)}
+                at = np.full(size, position[data["start"]], dtype=np.int32)
+                done = len(names)
+
+                # Per node: stacked deltas per option (padded) and next positions
+                tables = []
+                for node_id in names:
+                    options = data["transitions"][node_id]
+                    steps = max(1, max(len(deltas) for deltas, _ in options))
+                    table = np.zeros((len(options), steps, len(self.axes)), dtype=np.int32)
+                    for i, (deltas, _) in enumerate(options):
+                        if deltas:
+                            table[i, :len(deltas)] = deltas
+                    targets = np.array([done if next_id is None else position[next_id] for _, next_id in options], dtype=np.int32)
+                    tables.append((table, targets))
+
+                for _ in range(MAX_STEPS_PER_NODE * len(names)):
+                    active = at != done
+                    if not active.any():
+                        break
+                    for node in np.unique(at[active]):
+                        rows = np.nonzero(at == node)[0]
+                        table, targets = tables[node]
+                        pick = rng.integers(len(targets), size=len(rows))
+                        values = stance[rows]
+                        # Padding rows are zero deltas, so clamping them is a no-op
+                        for step in range(table.shape[1]):
+                            values = np.clip(values + table[pick, step], STANCE_MIN, STANCE_MAX)
+                        stance[rows] = values
+                        at[rows] = targets[pick]
+                finished &= at == done
+
+            # First matching ending wins
+            remaining = finished.copy()
+            for ending in self.endings:
+                match = remaining.copy()
+                for column, low, high in ending["bounds"]:
+                    match &= (stance[:, column] >= low) & (stance[:, column] <= high)
+                counts[ending["id"]] = counts.get(ending["id"], 0) + int(match.sum())
+                remaining &= ~match
+            if remaining.any():
+                counts[NO_ENDING] = counts.get(NO_ENDING, 0) + int(remaining.sum())
+
+        return counts
+
+    # -- Report --------------------------------------------------------------
+
+    def unmet_conditions(self, ending: Dict[str, Any], ranges: Dict[str, List[int]]) -> List[str]:
+        unmet = []
+        for column, low, high in ending["bounds"]:
+            label = self.labels[column]
+            reached_low, reached_high = ranges[label]
+            if reached_high < low or reached_low > high:
+                unmet.append(f"{label} needs {low}..{high}, reaches {reached_low}..{reached_high}")
+        return unmet
+
+    def run(self, runs: int, batch: int):
+        print(f"Endings: {len(self.endings)}, seals: {', '.join(self.seals)}, "
+              f"interrogation outcomes: {', '.join(f'{k} {len(v)}' for k, v in self.interrogations.items())}")
+
+        if self.errors:
+            self.print_report({})
+            return
+
+        print("\n[Exact] Exploring stance space...")
+        start = time.perf_counter()
+        exact = self.explore()
+        exact_seconds = time.perf_counter() - start
+        print(f"  [OK] {exact['states_expanded']:,} states expanded in {exact_seconds:.2f}s")
+
+        print(f"\n[Sampled] {runs:,} playthroughs...")
+        start = time.perf_counter()
+        counts = self.sample(runs, batch)
+        sample_seconds = time.perf_counter() - start
+        print(f"  [OK] {sample_seconds:.2f}s ({runs / sample_seconds:,.0f} playthroughs/s)")
+
+        endings = {}
+        for ending in self.endings + [{"id": NO_ENDING, "bounds": []}]:
+            probability = exact["probabilities"].get(ending["id"], 0.0)
+            if ending["id"] == NO_ENDING and not probability and not counts.get(NO_ENDING):
+                continue
+            endings[ending["id"]] = {
+                "reachable": probability > 0,
+                "probability": round(probability, 6),
+                "sampled_probability": round(counts.get(ending["id"], 0) / runs, 6),
+            }
+            if probability == 0 and ending["id"] != NO_ENDING:
+                unmet = self.unmet_conditions(ending, exact["ranges"])
+                if unmet:
+                    endings[ending["id"]]["unmet"] = unmet
+                else:
+                    # Every bound is met by some run, just never all at once
+                    endings[ending["id"]]["unmet"] = ["conditions never hold together (or an earlier ending always wins)"]
+                self.errors.append(f"{ending['id']} is unreachable")
+
+        report = {
+            "generated_at": datetime.now().isoformat(),
+            "parameters": {"runs": runs, "seed": self.seed, "seals": self.seals},
+            "exact": {
+                "states_expanded": exact["states_expanded"],
+                "final_stances": exact["final_stances"],
+                "dropped_probability": exact["dropped_probability"],
+                "seconds": round(exact_seconds, 3)
+            },
+            "sampled": {
+                "seconds": round(sample_seconds, 3),
+                "playthroughs_per_second": round(runs / sample_seconds) if sample_seconds else 0
+            },
+            "stance_ranges": exact["ranges"],
+            "endings": endings
+        }
+
+        REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        write_json(REPORT_PATH, report, indent=2)
+
+        self.print_report(report)
+
+    def print_report(self, report: Dict[str, Any]):
+        print("\n" + "="*60)
+        print("ENDING SIMULATION REPORT")
+        print("="*60)
+
+        for ending_id, ending in report.get("endings", {}).items():
+            if ending["reachable"]:
+                print(f"  [OK] {ending_id}: {ending['probability']:.2%} (sampled {ending['sampled_probability']:.2%})")
+            else:
+                print(f"  [X] {ending_id}: unreachable - {'; '.join(ending.get('unmet', []))}")
+
+        if report.get("stance_ranges"):
+            print("\nFinal stance ranges:")
+            for label, (low, high) in report["stance_ranges"].items():
+                print(f"  {label}: {low:+d}..{high:+d}")
+
+        if self.errors:
+            print(f"\n[X] ERRORS ({len(self.errors)}):")
+            for error in self.errors:
+                print(f"  - {error}")
+
+        if self.warnings:
+            print(f"\n[!] WARNINGS ({len(self.warnings)}):")
+            for warning in self.warnings:
+                print(f"  - {warning}")
+
+        if self.errors:
+            sys.exit(1)
+        print(f"\n[OK] Report: {REPORT_PATH}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ending reachability and probability over the full run")
+    parser.add_argument("--runs", type=int, default=1_000_000, help="Monte Carlo playthroughs")
+    parser.add_argument("--batch", type=int, default=250_000, help="Playthroughs simulated at once")
+    parser.add_argument("--seed", type=int, default=14, help="Random seed")
+
+    args = parser.parse_args()
+
+    print("="*60)
+    print("ENDING SIMULATION")
+    print("="*60)
+
+    simulator = EndingSimulator(args.seed)
+    simulator.run(args.runs, args.batch)
+
+
+if __name__ == "__main__":
+    main()
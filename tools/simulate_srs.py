@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+SRS Scheduler Simulator
+Simulates virtual learners for every tier in srs_config.json over a year of play
+Reports review queue growth, daily review load and retention curves per tier
+"""
+
+import sys
+import time
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any
+
+from json_io import read_json, write_json
+
+try:
+    import numpy as np
+except ImportError:
+    print("[X] NumPy not installed")
+    print("    Install with: pip install numpy")
+    sys.exit(1)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SRS_CONFIG_PATH = PROJECT_ROOT / "content" / "side" / "srs_config.json"
+REPORT_PATH = PROJECT_ROOT / "tools" / "logs" / "srs_simulation.json"
+
+# Memory model: recall probability is TARGET_RETENTION ** (elapsed / stability),
+# i.e. stability is the number of days until recall drops to 90%
+TARGET_RETENTION = 0.9
+INITIAL_STABILITY = 1.0
+SUCCESS_GROWTH = 2.5
+LAPSE_FACTOR = 0.3
+# Learner variation: ability scales stability growth, play_rate is the
+# chance of opening the game on a given day
+ABILITY_SIGMA = 0.25
+PLAY_RATE_RANGE = (0.5, 0.95)
+
+REPORT_DAYS = [7, 30, 90, 180, 365]
+NEVER = np.iinfo(np.int32).max
+
+
+class SRSSimulator:
+    def __init__(self, learners: int, deck_size: int, days: int, seed: int, curve_step: int = 7):
+        self.learners = learners
+        self.deck_size = deck_size
+        self.days = days
+        self.seed = seed
+        self.curve_step = curve_step
+
+    def simulate_tier(self, tier: Dict[str, Any]) -> Dict[str, Any]:
+        """Run every learner through `days` days of one tier's quotas"""
+        new_per_day = tier["newPerDay"]
+        review_per_day = min(tier["reviewPerDay"], self.deck_size)
+
+        rng = np.random.default_rng(self.seed)
+        shape = (self.learners, self.deck_size)
+
+        # Per-card state, one row per learner; due == NEVER means not learned yet
+        due = np.full(shape, NEVER, dtype=np.int32)
+        last_review = np.zeros(shape, dtype=np.int32)
+        stability = np.full(shape, INITIAL_STABILITY, dtype=np.float32)
+
+        # Per-learner state
+        ability = rng.lognormal(0.0, ABILITY_SIGMA, self.learners).astype(np.float32)
+        play_rate = rng.uniform(*PLAY_RATE_RANGE, self.learners)
+        next_card = np.zeros(self.learners, dtype=np.int64)
+
+        new_offsets = np.arange(new_per_day)
+        log_retention = np.float32(np.log(TARGET_RETENTION))
+
+        queue_mean = np.zeros(self.days)
+        queue_p95 = np.zeros(self.days)
+        reviews_mean = np.zeros(self.days)
+        retention_mean = np.full(self.days, np.nan)
+
+        for day in range(self.days):
+            plays = rng.random(self.learners) < play_rate
+            due_now = (due <= day).sum(axis=1)
+
+            # Reviews: the most overdue cards first, capped by reviewPerDay.
+            # Only the picked (learners x reviewPerDay) cells are touched.
+            picked = np.argpartition(due, review_per_day - 1, axis=1)[:, :review_per_day]
+            picked_due = np.take_along_axis(due, picked, axis=1)
+            picked_last = np.take_along_axis(last_review, picked, axis=1)
+            picked_stability = np.take_along_axis(stability, picked, axis=1)
+            review = (picked_due <= day) & plays[:, None]
+
+            elapsed = (day - picked_last).astype(np.float32)
+            recall = np.exp(log_retention * elapsed / picked_stability)
+            success = rng.random(picked.shape, dtype=np.float32) < recall
+
+            grown = picked_stability * SUCCESS_GROWTH * ability[:, None]
+            lapsed = np.maximum(INITIAL_STABILITY, picked_stability * LAPSE_FACTOR)
+            picked_stability = np.where(review, np.where(success, grown, lapsed), picked_stability)
+            picked_due = np.where(review, day + np.ceil(picked_stability).astype(np.int32), picked_due)
+            picked_last = np.where(review, day, picked_last)
+
+            np.put_along_axis(stability, picked, picked_stability, axis=1)
+            np.put_along_axis(due, picked, picked_due, axis=1)
+            np.put_along_axis(last_review, picked, picked_last, axis=1)
+
+            # New cards are introduced in deck order
+            new_count = np.where(plays, np.minimum(new_per_day, self.deck_size - next_card), 0)
+            if new_count.any():
+                learner, offset = np.nonzero(new_offsets < new_count[:, None])
+                card = next_card[learner] + offset
+                due[learner, card] = day + 1
+                last_review[learner, card] = day
+                next_card += new_count
+
+            reviewed = review.sum(axis=1)
+            backlog = due_now - reviewed
+            queue_mean[day] = backlog.mean()
+            queue_p95[day] = np.percentile(backlog, 95)
+            reviews_mean[day] = reviewed.mean()
+
+            # Predicted recall across everything learned so far; sampled
+            # because it is the only full-matrix float pass per day
+            if (day + 1) % self.curve_step == 0 or day + 1 in REPORT_DAYS or day + 1 == self.days:
+                learned = due != NEVER
+                if learned.any():
+                    elapsed = (day - last_review[learned]).astype(np.float32)
+                    retention_mean[day] = np.exp(log_retention * elapsed / stability[learned]).mean()
+
+        return {
+            "newPerDay": new_per_day,
+            "reviewPerDay": tier["reviewPerDay"],
+            "cards_learned_mean": float(next_card.mean()),
+            "queue_final_mean": float(queue_mean[-1]),
+            "queue_final_p95": float(queue_p95[-1]),
+            "queue_peak_mean": float(queue_mean.max()),
+            "daily_reviews_mean": float(reviews_mean.mean()),
+            "daily_reviews_peak": float(reviews_mean.max()),
+            "retention_at": {
+                str(d): float(retention_mean[d - 1]) for d in REPORT_DAYS if d <= self.days
+            },
+            "curve_step_days": self.curve_step,
+            "curves": {
+                "queue_mean": queue_mean.round(3).tolist(),
+                "queue_p95": queue_p95.round(3).tolist(),
+                "reviews_mean": reviews_mean.round(3).tolist(),
+                "retention_mean": [
+                    round(float(value), 4) for value in retention_mean if not np.isnan(value)
+                ]
+            }
+        }
+
+
+def load_srs_config() -> Dict[str, Any]:
+    if not SRS_CONFIG_PATH.exists():
+        print(f"[X] SRS config not found: {SRS_CONFIG_PATH}")
+        sys.exit(1)
+
+    return read_json(SRS_CONFIG_PATH)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Simulate SRS review load per srs_config tier")
+    parser.add_argument("--learners", type=int, default=1000, help="Virtual learners per tier")
+    parser.add_argument("--days", type=int, default=365, help="Days of play to simulate")
+    parser.add_argument("--deck-size", type=int, default=2000, help="Cards available to learn")
+    parser.add_argument("--seed", type=int, default=14, help="Random seed")
+    parser.add_argument("--tier", action="append", help="Only simulate these tiers")
+
+    args = parser.parse_args()
+
+    for flag, value in (("--learners", args.learners), ("--days", args.days), ("--deck-size", args.deck_size)):
+        if value <= 0:
+            print(f"[X] {flag} must be positive, got {value}")
+            sys.exit(1)
+
+    print("="*60)
+    print("SRS SCHEDULER SIMULATION")
+    print("="*60)
+    print(f"{args.learners} learners x {args.deck_size} cards x {args.days} days")
+
+    tiers = load_srs_config().get("tiers", {})
+    if args.tier:
+        tiers = {name: tier for name, tier in tiers.items() if name in args.tier}
+
+    simulator = SRSSimulator(args.learners, args.deck_size, args.days, args.seed)
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "parameters": {
+            "learners": args.learners,
+            "days": args.days,
+            "deck_size": args.deck_size,
+            "seed": args.seed
+        },
+        "tiers": {}
+    }
+
+    for name, tier in tiers.items():
+        print(f"\n[{name}] new {tier['newPerDay']}/day, review {tier['reviewPerDay']}/day")
+
+        start = time.perf_counter()
+        result = simulator.simulate_tier(tier)
+        elapsed = time.perf_counter() - start
+
+        learner_days = args.learners * args.days
+        result["benchmark"] = {
+            "seconds": round(elapsed, 3),
+            "learner_days_per_second": round(learner_days / elapsed) if elapsed else 0
+        }
+        report["tiers"][name] = result
+
+        retention = ", ".join(f"d{day}={value:.1%}" for day, value in result["retention_at"].items())
+        print(f"  Learned: {result['cards_learned_mean']:.0f} cards")
+        print(f"  Queue:   final {result['queue_final_mean']:.1f} (p95 {result['queue_final_p95']:.0f}), peak {result['queue_peak_mean']:.1f}")
+        print(f"  Reviews: {result['daily_reviews_mean']:.1f}/day (peak {result['daily_reviews_peak']:.1f})")
+        print(f"  Retention: {retention}")
+        print(f"  [OK] {elapsed:.2f}s ({result['benchmark']['learner_days_per_second']:,} learner-days/s)")
+
+    REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    write_json(REPORT_PATH, report, indent=2)
+
+    print(f"\n[OK] Report: {REPORT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
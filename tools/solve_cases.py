@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Turtle Soup Case Solver
+Explores the question/unlock structure of compiled side cases to measure
+minimum turns to solve, expected turns under random play and hint impact
+Used by compile_content.py to set each case's difficulty
+"""
+
+import math
+import random
+import sys
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Any
+
+from json_io import read_json, write_json
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SIDE_DIR = PROJECT_ROOT / "content" / "side"
+
+SOLUTION_ID = "SOLUTION"
+
+# Exact search memoizes on the asked-question bitmask; past this many
+# questions the state space gets too large and play is sampled instead
+MAX_EXACT_QUESTIONS = 16
+SAMPLE_GAMES = 4000
+
+# Expected random-play turns at or below each bound get that difficulty
+DIFFICULTY_BOUNDS = [("easy", 6.0), ("medium", 12.0)]
+HARDEST = "hard"
+
+
+class CaseSolver:
+    """Search over which questions have been asked
+
+    A question becomes available once any asked question (or the initial
+    frontier) unlocks it; the case is solvable once SOLUTION is unlocked.
+    Hints are modelled as steering one choice each onto a shortest path.
+    """
+
+    def __init__(self, case: Dict[str, Any], seed: int = 14):
+        questions = case["questions"]
+        self.count = len(questions)
+        self.seed = seed
+        index = {question["id"]: i for i, question in enumerate(questions)}
+
+        # Bit `count` stands for SOLUTION in unlocked masks
+        self.solution_bit = 1 << self.count
+        self.unlock_masks = []
+        for question in questions:
+            mask = 0
+            for target in question.get("unlocks", []):
+                if target == SOLUTION_ID:
+                    mask |= self.solution_bit
+                elif target in index:
+                    mask |= 1 << index[target]
+            self.unlock_masks.append(mask)
+
+        targets = 0
+        for mask in self.unlock_masks:
+            targets |= mask
+        self.initial = ((1 << self.count) - 1) & ~targets
+        # A SOLUTION question nothing unlocks is available from the start
+        if SOLUTION_ID in index and not targets & (1 << index[SOLUTION_ID]):
+            self.initial |= self.solution_bit
+
+        self.hint_count = len(case.get("hints", []))
+        self.distance = self._distances_to_solution()
+        self.memo = {}
+
+    def _distances_to_solution(self) -> List[float]:
+        """Fewest asks, starting with question i, until SOLUTION is unlocked"""
+        parents = [[] for _ in range(self.count)]
+        distance = [math.inf] * self.count
+        queue = deque()
+
+        for i, mask in enumerate(self.unlock_masks):
+            if mask & self.solution_bit:
+                distance[i] = 1
+                queue.append(i)
+            for j in range(self.count):
+                if mask & (1 << j):
+                    parents[j].append(i)
+
+        while queue:
+            j = queue.popleft()
+            for i in parents[j]:
+                if distance[i] == math.inf:
+                    distance[i] = distance[j] + 1
+                    queue.append(i)
+
+        return distance
+
+    def min_turns(self) -> float:
+        if self.initial & self.solution_bit:
+            return 0
+        return min((self.distance[i] for i in self._bits(self.initial)), default=math.inf)
+
+    @staticmethod
+    def _bits(mask: int) -> List[int]:
+        bits = []
+        while mask:
+            low = mask & -mask
+            bits.append(low.bit_length() - 1)
+            mask ^= low
+        return bits
+
+    def _choices(self, available: int, hints: int) -> List[int]:
+        options = self._bits(available)
+        if hints and options:
+            best = min(self.distance[i] for i in options)
+            options = [i for i in options if self.distance[i] == best]
+        return options
+
+    def _expected(self, asked: int, unlocked: int, hints: int) -> float:
+        if unlocked & self.solution_bit:
+            return 0.0
+
+        key = (asked, hints)
+        if key in self.memo:
+            return self.memo[key]
+
+        options = self._choices(unlocked & ~asked & ~self.solution_bit, hints)
+        if not options:
+            value = math.inf
+        else:
+            next_hints = max(0, hints - 1)
+            value = 1.0 + sum(
+                self._expected(asked | (1 << i), unlocked | self.unlock_masks[i], next_hints) for i in options
+            ) / len(options)
+
+        self.memo[key] = value
+        return value
+
+    def _sampled(self, hints: int) -> float:
+        rng = random.Random(self.seed)
+        total = 0
+        for _ in range(SAMPLE_GAMES):
+            asked, unlocked, left, turns = 0, self.initial, hints, 0
+            while not unlocked & self.solution_bit:
+                options = self._choices(unlocked & ~asked & ~self.solution_bit, left)
+                if not options:
+                    return math.inf
+                pick = rng.choice(options)
+                asked |= 1 << pick
+                unlocked |= self.unlock_masks[pick]
+                left = max(0, left - 1)
+                turns += 1
+            total += turns
+        return total / SAMPLE_GAMES
+
+    def expected_turns(self, hints: int = 0) -> float:
+        """Mean turns to unlock SOLUTION picking uniformly among available questions"""
+        if self.count <= MAX_EXACT_QUESTIONS:
+            return self._expected(0, self.initial, hints)
+        return self._sampled(hints)
+
+    def solve(self) -> Dict[str, Any]:
+        expected = [self.expected_turns(hints) for hints in range(self.hint_count + 1)]
+        return {
+            "questions": self.count,
+            "method": "exact" if self.count <= MAX_EXACT_QUESTIONS else "sampled",
+            "min_turns": self.min_turns(),
+            "expected_turns": round(expected[0], 2),
+            # Index = hints used
+            "expected_turns_with_hints": [round(value, 2) for value in expected],
+            "hint_impact": round(expected[0] - expected[-1], 2)
+        }
+
+
+def rate_difficulty(expected_turns: float) -> str:
+    for difficulty, bound in DIFFICULTY_BOUNDS:
+        if expected_turns <= bound:
+            return difficulty
+    return HARDEST
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Measure turtle soup case difficulty")
+    parser.add_argument("cases", nargs="*", type=Path, help="Case files (default: content/side/case_*.json)")
+    parser.add_argument("--write", action="store_true", help="Write difficulty and solver stats into the case files")
+
+    args = parser.parse_args()
+
+    print("="*60)
+    print("TURTLE SOUP CASE SOLVER")
+    print("="*60)
+
+    failed = False
+    for path in args.cases or sorted(SIDE_DIR.glob("case_*.json")):
+        case = read_json(path)
+
+        start = time.perf_counter()
+        stats = CaseSolver(case).solve()
+        elapsed = time.perf_counter() - start
+        difficulty = rate_difficulty(stats["expected_turns"])
+
+        if math.isinf(stats["min_turns"]):
+            print(f"  [X] {case['case_id']}: {SOLUTION_ID} unreachable")
+            failed = True
+            continue
+
+        hints = " -> ".join(f"{value:g}" for value in stats["expected_turns_with_hints"])
+        print(f"  [OK] {case['case_id']}: {difficulty} - min {stats['min_turns']} turns, "
+              f"expected {stats['expected_turns']:g} ({stats['method']}), with hints {hints} [{elapsed * 1000:.1f} ms]")
+        if difficulty != case.get("difficulty"):
+            print(f"       authored difficulty was '{case.get('difficulty')}'")
+
+        if args.write:
+            case["difficulty"] = difficulty
+            case["solver"] = stats
+            write_json(path, case, indent=2)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
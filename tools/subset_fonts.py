@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Font Subsetter
+Collects the exact codepoints each language uses across compiled content,
+locale bundles and vocabulary, then subsets every registry font_family to
+the codepoints of the languages that use it and reports the bytes saved
+"""
+
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Set
+
+from json_io import JSONDecodeError, read_json, write_json
+
+try:
+    from fontTools import subset
+    from fontTools.ttLib import TTFont, TTCollection
+except ImportError:
+    print("[X] fontTools not installed")
+    print("    Install with: pip install fonttools")
+    sys.exit(1)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CONTENT_DIR = PROJECT_ROOT / "content"
+LOCALES_DIR = PROJECT_ROOT / "locales"
+LANGUAGE_REGISTRY_PATH = LOCALES_DIR / "_meta" / "language_registry.json"
+FONT_DIR = PROJECT_ROOT / "assets" / "fonts"
+SUBSET_DIR = FONT_DIR / "subset"
+SUBSET_MANIFEST_PATH = SUBSET_DIR / "fonts.json"
+CACHE_PATH = PROJECT_ROOT / ".build_cache" / "subset_fonts.json"
+REPORT_PATH = PROJECT_ROOT / "tools" / "logs" / "font_subset_report.json"
+
+FONT_EXTENSIONS = {".ttf", ".otf", ".ttc", ".otc"}
+
+# Always kept: printable ASCII (numbers, format strings in scripts) and the
+# punctuation UI code inserts around content
+BASE_CHARS = "".join(chr(c) for c in range(0x20, 0x7F)) + "…—–·“”‘’，。！？：；、（）《》「」"
+BASE_CODEPOINTS = set(map(ord, BASE_CHARS))
+
+
+def collect_strings(value: Any, languages: Set[str], into: Dict[str, Set[int]], language: Optional[str] = None):
+    """Walk JSON; strings under a registry language key belong to that language"""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            collect_strings(item, languages, into, key if key in languages else language)
+    elif isinstance(value, list):
+        for item in value:
+            collect_strings(item, languages, into, language)
+    elif isinstance(value, str) and language is not None:
+        # Control characters (newlines, tabs) have no glyphs
+        into.setdefault(language, set()).update(ord(char) for char in value if char >= " ")
+
+
+def font_families(path: Path) -> List[str]:
+    """Family names of each font in a file (TTC/OTC collections have several)"""
+    if path.suffix.lower() in {".ttc", ".otc"}:
+        fonts = TTCollection(str(path), lazy=True).fonts
+    else:
+        fonts = [TTFont(str(path), lazy=True)]
+
+    families = []
+    for font in fonts:
+        # Typographic family (16) groups weights; legacy family (1) otherwise
+        name = font["name"].getDebugName(16) or font["name"].getDebugName(1)
+        families.append(name or "")
+    return families
+
+
+def subset_font(path_str: str, font_number: int, codepoints: List[int], output_str: str,
+                flavor: Optional[str] = None) -> Dict[str, Any]:
+    """Subset one font to codepoints; runs in a worker process
+
+    flavor "woff2" or "woff" writes a web font (woff2 needs the brotli module).
+    """
+    path = Path(path_str)
+    # Keep the source's head.modified so identical input gives identical bytes
+    font = TTFont(path_str, fontNumber=font_number, recalcTimestamp=False)
+    cmap = font.getBestCmap() or {}
+    # Base characters a font lacks are left to fallback fonts, not reported
+    missing = [codepoint for codepoint in codepoints if codepoint not in cmap and codepoint not in BASE_CODEPOINTS]
+
+    options = subset.Options()
+    options.layout_features = ["*"]
+    options.name_IDs = ["*"]
+    options.notdef_outline = True
+    options.glyph_names = False
+    options.hinting = False
+    options.desubroutinize = True
+
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=[codepoint for codepoint in codepoints if codepoint in cmap])
+    subsetter.subset(font)
+
+    output = Path(output_str)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    font.flavor = flavor
+    font.save(output_str)
+
+    return {
+        "original_size": path.stat().st_size,
+        "subset_size": output.stat().st_size,
+        "glyphs": len(font.getGlyphOrder()),
+        "missing": missing
+    }
+
+
+class FontSubsetter:
+    def __init__(self, margins: Dict[str, Path], jobs: Optional[int] = None):
+        self.margins = margins
+        self.jobs = jobs or os.cpu_count() or 1
+        self.registry = self.load_registry()
+        self.codepoints = {}
+        self.results = {}
+        self.missing_fonts = {}
+        self.errors = []
+        self.warnings = []
+
+    def load_registry(self) -> Dict[str, Any]:
+        return read_json(LANGUAGE_REGISTRY_PATH)["languages"]
+
+    def collect_codepoints(self):
+        """Codepoints per language from content, locales/<lang>/ and margins"""
+        languages = set(self.registry)
+        web_langs = {entry.get("web_lang"): language for language, entry in self.registry.items()}
+        per_language = {}
+
+        sources = sorted(CONTENT_DIR.rglob("*.json"))
+        for path in sources:
+            data = read_json(path)
+            # Single-language files (e.g. vocab_ko.json) declare it at the top
+            declared = data.get("language") if isinstance(data, dict) else None
+            collect_strings(data, languages, per_language, web_langs.get(declared, declared if declared in languages else None))
+
+        for language in languages:
+            for path in sorted((LOCALES_DIR / language).glob("*.json")):
+                collect_strings(read_json(path), languages, per_language, language)
+
+        for language, margin_path in self.margins.items():
+            if language not in languages:
+                self.errors.append(f"--margin: unknown language '{language}'")
+                continue
+            text = margin_path.read_text(encoding='utf-8')
+            per_language.setdefault(language, set()).update(ord(char) for char in text if not char.isspace())
+
+        self.codepoints = per_language
+        print(f"[FontSubsetter] Scanned {len(sources)} content files")
+        for language, codepoints in sorted(per_language.items()):
+            print(f"  {language}: {len(codepoints):,} codepoints")
+
+    def family_codepoints(self) -> Dict[str, Dict[str, Any]]:
+        """Union of the codepoints of every language sharing a font_family"""
+        families = {}
+        for language, codepoints in self.codepoints.items():
+            family = self.registry[language].get("font_family")
+            if not family:
+                continue
+            entry = families.setdefault(family, {"languages": [], "codepoints": set(BASE_CODEPOINTS)})
+            entry["languages"].append(language)
+            entry["codepoints"] |= codepoints
+        return families
+
+    def find_fonts(self) -> Dict[str, List[Any]]:
+        """family name -> [(path, font number)], one per weight/style file"""
+        found = {}
+        if not FONT_DIR.exists():
+            return found
+        for path in sorted(FONT_DIR.rglob("*")):
+            if path.suffix.lower() not in FONT_EXTENSIONS or SUBSET_DIR in path.parents:
+                continue
+            try:
+                for number, family in enumerate(font_families(path)):
+                    found.setdefault(family, []).append((path, number))
+            except Exception as e:
+                self.warnings.append(f"{path.name}: unreadable font - {e}")
+        return found
+
+    def load_cache(self) -> Dict[str, Any]:
+        if not CACHE_PATH.exists():
+            return {}
+        try:
+            return read_json(CACHE_PATH)
+        except (JSONDecodeError, OSError):
+            print("[!] Font cache unreadable, starting fresh")
+            return {}
+
+    def run(self):
+        self.collect_codepoints()
+        families = self.family_codepoints()
+        fonts = self.find_fonts()
+        cache = self.load_cache()
+
+        pending = {}
+        for family, entry in sorted(families.items()):
+            codepoints = sorted(entry["codepoints"])
+            languages = sorted(entry["languages"])
+            if family not in fonts:
+                self.warnings.append(f"no font file for '{family}' ({', '.join(languages)}) under {FONT_DIR}")
+                self.missing_fonts[family] = len(codepoints)
+                continue
+
+            for path, number in fonts[family]:
+                # Collections are split into one subset file per face
+                stem = path.stem if path.suffix.lower() in {".ttf", ".otf"} else f"{path.stem}-{number}"
+                suffix = ".otf" if path.suffix.lower() in {".otf", ".otc"} else ".ttf"
+                output = SUBSET_DIR / f"{stem}{suffix}"
+
+                # Same source font and same codepoints: the existing subset is current.
+                # Keyed on the standard library's encoding so existing caches stay valid
+                key = hashlib.sha256(path.read_bytes() + f"#{number}:".encode() + json.dumps(codepoints).encode()).hexdigest()
+                base = {"family": family, "languages": languages, "codepoints": len(codepoints),
+                        "source": str(path.relative_to(FONT_DIR))}
+                if cache.get(output.name, {}).get("key") == key and output.exists():
+                    self.results[output.name] = dict(cache[output.name]["result"], **base, cached=True)
+                else:
+                    pending[output.name] = (path, number, codepoints, output, key, base)
+
+        if pending:
+            with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+                futures = {
+                    pool.submit(subset_font, str(path), number, codepoints, str(output)): name
+                    for name, (path, number, codepoints, output, _, _) in pending.items()
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
+                    _, _, _, _, key, base = pending[name]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        self.errors.append(f"{base['source']}: {e}")
+                        continue
+                    cache[name] = {"key": key, "result": result}
+                    self.results[name] = dict(result, **base, cached=False)
+
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        write_json(CACHE_PATH, cache, indent=2)
+
+        if self.results:
+            # What a theme needs to point each language at its subset files
+            manifest = {}
+            for name, result in sorted(self.results.items()):
+                entry = manifest.setdefault(result["family"], {"languages": result["languages"], "files": []})
+                entry["files"].append(name)
+            write_json(SUBSET_MANIFEST_PATH, manifest, indent=2)
+
+    def print_report(self):
+        print("\n" + "="*60)
+        print("FONT SUBSET REPORT")
+        print("="*60)
+
+        total_before = 0
+        total_after = 0
+        for family, count in sorted(self.missing_fonts.items()):
+            print(f"  [--] {family}: {count:,} codepoints needed, no font file")
+
+        for name, result in sorted(self.results.items()):
+            before, after = result["original_size"], result["subset_size"]
+            total_before += before
+            total_after += after
+            cached = " (cached)" if result["cached"] else ""
+            print(f"  [OK] {result['source']}: {before:,} -> {after:,} bytes (-{1 - after / before:.1%}), "
+                  f"{result['codepoints']:,} codepoints, {result['glyphs']:,} glyphs{cached}")
+            if result["missing"]:
+                sample = "".join(chr(codepoint) for codepoint in result["missing"][:20])
+                self.warnings.append(f"{result['source']}: {len(result['missing'])} codepoints not in font: {sample}")
+
+        if self.errors:
+            print(f"\n[X] ERRORS ({len(self.errors)}):")
+            for error in self.errors:
+                print(f"  - {error}")
+
+        if self.warnings:
+            print(f"\n[!] WARNINGS ({len(self.warnings)}):")
+            for warning in self.warnings:
+                print(f"  - {warning}")
+
+        if total_before:
+            saved = total_before - total_after
+            print(f"\nTotal: {total_before:,} -> {total_after:,} bytes (saved {saved:,}, {saved / total_before:.1%})")
+            print(f"Subsets: {SUBSET_DIR}")
+
+        REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        write_json(REPORT_PATH, {
+            "languages": {language: len(codepoints) for language, codepoints in sorted(self.codepoints.items())},
+            "fonts": self.results,
+            "missing_fonts": self.missing_fonts,
+            "total_original": total_before,
+            "total_subset": total_after,
+            "errors": self.errors,
+            "warnings": self.warnings
+        }, indent=2)
+        print(f"Report: {REPORT_PATH}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Subset registry fonts to the codepoints content actually uses")
+    parser.add_argument("--margin", action="append", default=[], metavar="LANG=FILE",
+                        help="Extra characters to keep for a language, e.g. a common-character list")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+
+    args = parser.parse_args()
+
+    margins = {}
+    for item in args.margin:
+        language, _, path = item.partition("=")
+        if not path:
+            parser.error(f"--margin expects LANG=FILE, got '{item}'")
+        margins[language] = Path(path)
+
+    print("="*60)
+    print("FONT SUBSETTER")
+    print("="*60)
+
+    subsetter = FontSubsetter(margins, jobs=args.jobs)
+    subsetter.run()
+    subsetter.print_report()
+
+    sys.exit(1 if subsetter.errors else 0)
+
+
+if __name__ == "__main__":
+    main()
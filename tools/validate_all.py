@@ -17,7 +17,7 @@ VALIDATORS = [
 ]
 
 
-def run_validator(name, script):
+def run_validator(name, script, extra_args):
     """Run a validation script"""
     print(f"\n{'='*60}")
     print(f"Running: {name}")
@@ -31,7 +31,7 @@ def run_validator(name, script):
 
     try:
         result = subprocess.run(
-            [sys.executable, str(script_path)],
+            [sys.executable, str(script_path)] + extra_args,
             cwd=TOOLS_DIR,
             capture_output=False,
             text=True
@@ -45,6 +45,13 @@ def run_validator(name, script):
 
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run all validation suites")
+    parser.add_argument("--profile", action="store_true", help="Profile each validator (traces in tools/logs/profile)")
+    args = parser.parse_args()
+    extra_args = ["--profile"] if args.profile else []
+
     print("="*60)
     print("MASTER VALIDATION - ALL CHECKS")
     print("="*60)
@@ -53,7 +60,7 @@ def main():
     results = []
 
     for name, script in VALIDATORS:
-        passed = run_validator(name, script)
+        passed = run_validator(name, script, extra_args)
         results.append((name, passed))
 
     # Final summary
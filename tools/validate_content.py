@@ -4,14 +4,17 @@ Validate Content
 Checks compiled story content for completeness and consistency
 """
 
-import json
 import sys
 from pathlib import Path
 
+from json_io import JSONDecodeError, read_json
+from profiling import profiler, add_profile_arguments, start_profiling
+
 PROJECT_ROOT = Path(__file__).parent.parent
 CONTENT_DIR = PROJECT_ROOT / "content"
 
 
+@profiler.timed()
 def check_manifest():
     """Check content manifest"""
     print("[Validate Content] Checking manifest...")
@@ -23,8 +26,7 @@ def check_manifest():
         print("    Run compile_content.py first")
         return False
 
-    with open(manifest_path, 'r', encoding='utf-8') as f:
-        manifest = json.load(f)
+    manifest = read_json(manifest_path)
 
     expected_chapters = 7
     actual_chapters = manifest.get("content", {}).get("main_chapters", 0)
@@ -38,6 +40,7 @@ def check_manifest():
     return True
 
 
+@profiler.timed()
 def check_chapters():
     """Check all chapter files"""
     print("\n[Validate Content] Checking chapters...")
@@ -52,8 +55,9 @@ def check_chapters():
             continue
 
         try:
-            with open(chapter_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Cached: check_node_links reads the chapters again
+            data = read_json(chapter_file, cached=True)
+            profiler.count("files read")
 
             # Validate structure
             if "nodes" not in data:
@@ -71,6 +75,7 @@ def check_chapters():
                 errors.append(f"Chapter {chapter}: missing start node {start_node}")
 
             # Check node structure
+            profiler.count("nodes checked", len(nodes))
             for node_id, node_data in nodes.items():
                 if "type" not in node_data:
                     errors.append(f"Chapter {chapter}, node {node_id}: missing 'type'")
@@ -80,7 +85,7 @@ def check_chapters():
 
             print(f"    Chapter {chapter}: {len(nodes)} nodes")
 
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             errors.append(f"Chapter {chapter}: invalid JSON - {e}")
         except Exception as e:
             errors.append(f"Chapter {chapter}: error - {e}")
@@ -95,6 +100,7 @@ def check_chapters():
     return True
 
 
+@profiler.timed()
 def check_side_stories():
     """Check side story files"""
     print("\n[Validate Content] Checking side stories...")
@@ -115,8 +121,8 @@ def check_side_stories():
 
     for case_file in case_files:
         try:
-            with open(case_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = read_json(case_file)
+            profiler.count("files read")
 
             # Validate structure
             required_keys = ["case_id", "title", "scenario", "questions", "solution"]
@@ -126,7 +132,7 @@ def check_side_stories():
 
             print(f"    {case_file.name}: {data.get('case_id', 'unknown')}")
 
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             errors.append(f"{case_file.name}: invalid JSON - {e}")
         except Exception as e:
             errors.append(f"{case_file.name}: error - {e}")
@@ -141,6 +147,7 @@ def check_side_stories():
     return True
 
 
+@profiler.timed()
 def check_node_links():
     """Check that node links are valid"""
     print("\n[Validate Content] Checking node links...")
@@ -153,8 +160,7 @@ def check_node_links():
         if not chapter_file.exists():
             continue
 
-        with open(chapter_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = read_json(chapter_file, cached=True)
 
         nodes = data.get("nodes", {})
 
@@ -180,6 +186,12 @@ def check_node_links():
 
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Validate compiled content")
+    add_profile_arguments(parser)
+    start_profiling("validate_content", parser.parse_args())
+
     print("="*60)
     print("CONTENT VALIDATION")
     print("="*60)
@@ -8,9 +8,12 @@ import subprocess
 import sys
 from pathlib import Path
 
+from profiling import profiler, add_profile_arguments, start_profiling
+
 REQUIRED_VERSION = "4.6.stable.official.89cea1439"
 
 
+@profiler.timed()
 def check_godot_version():
     """Check if Godot is installed and has correct version"""
     print("[Validate Engine] Checking Godot version...")
@@ -53,6 +56,7 @@ def check_godot_version():
         return False
 
 
+@profiler.timed()
 def check_project_file():
     """Check if project.godot exists and is valid"""
     print("\n[Validate Engine] Checking project file...")
@@ -79,6 +83,12 @@ def check_project_file():
 
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check the Godot engine version")
+    add_profile_arguments(parser)
+    start_profiling("validate_engine", parser.parse_args())
+
     print("="*60)
     print("GODOT ENGINE VALIDATION")
     print("="*60)
@@ -6,9 +6,13 @@ Checks that Demo and Full versions are correctly configured
 
 import os
 import sys
-import json
 from pathlib import Path
 
+from content_pack import ContentPack, ContentPackError
+from export_demo_full import PACK_NAME
+from json_io import read_json
+from profiling import profiler, add_profile_arguments, start_profiling
+
 PROJECT_ROOT = Path(__file__).parent.parent
 EXPORT_DIR = PROJECT_ROOT / "export"
 
@@ -20,6 +24,7 @@ def print_header(text):
     print("=" * 60)
 
 
+@profiler.timed()
 def validate_build(build_dir, expected_config):
     """Validate a build directory"""
     print(f"\n[Validate] Checking {build_dir.name} build...")
@@ -34,8 +39,7 @@ def validate_build(build_dir, expected_config):
         return errors, warnings
 
     # Load config
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = json.load(f)
+    config = read_json(config_path)
 
     # Validate build flavor
     if config.get("build_flavor") != expected_config["build_flavor"]:
@@ -48,15 +52,28 @@ def validate_build(build_dir, expected_config):
     if expected_chapters != actual_chapters:
         errors.append(f"Chapter mismatch: expected {expected_chapters}, got {actual_chapters}")
 
-    # Check chapter files exist
-    content_dir = build_dir / "content" / "main"
-    if content_dir.exists():
+    # Check chapter files are packed, and nothing beyond the flavor
+    pack_path = build_dir / PACK_NAME
+    packed = set()
+    if pack_path.exists():
+        try:
+            with ContentPack(pack_path) as pack:
+                packed = set(pack.names())
+                with profiler.phase("verify pack"):
+                    errors.extend(f"Corrupt pack entry: {error}" for error in pack.verify())
+                profiler.count("entries verified", pack.count)
+        except ContentPackError as e:
+            errors.append(str(e))
+
         for chapter in expected_config["chapters"]:
-            chapter_file = content_dir / f"chapter_{chapter}.json"
-            if not chapter_file.exists():
+            if f"content/main/chapter_{chapter}.json" not in packed:
                 errors.append(f"Missing chapter file: chapter_{chapter}.json")
+        extra = sorted(name for name in packed if name.startswith("content/main/chapter_")
+                       and int(name[len("content/main/chapter_"):-len(".json")]) not in expected_chapters)
+        if extra:
+            errors.append(f"Pack contains chapters outside this build: {', '.join(extra)}")
     else:
-        warnings.append("Content directory not found (may not be exported yet)")
+        warnings.append(f"{PACK_NAME} not found (may not be exported yet)")
 
     # Validate side stories
     expected_stories = set(expected_config["side_stories"])
@@ -65,12 +82,10 @@ def validate_build(build_dir, expected_config):
     if expected_stories != actual_stories:
         errors.append(f"Side story mismatch: expected {expected_stories}, got {actual_stories}")
 
-    # Check side story files exist
-    side_dir = build_dir / "content" / "side"
-    if side_dir.exists():
+    # Check side story files are packed
+    if packed:
         for case_num in expected_config["side_stories"]:
-            case_file = side_dir / f"case_{case_num}.json"
-            if not case_file.exists():
+            if f"content/side/case_{case_num}.json" not in packed:
                 errors.append(f"Missing side story file: case_{case_num}.json")
 
     # Validate save slots
@@ -81,6 +96,18 @@ def validate_build(build_dir, expected_config):
     if config.get("max_achievements") != expected_config["achievements"]:
         errors.append(f"Achievement mismatch: expected {expected_config['achievements']}, got {config.get('max_achievements')}")
 
+    # Check the packed achievement table matches (see compile_achievements.py)
+    if packed:
+        table_name = f"content/achievements/achievements_{expected_config['build_flavor']}.json"
+        if table_name not in packed:
+            errors.append(f"Missing achievement table: {table_name}")
+        else:
+            with ContentPack(pack_path) as pack:
+                table = pack.read_json(table_name)
+            if len(table.get("achievements", [])) != expected_config["achievements"]:
+                errors.append(f"Achievement table has {len(table.get('achievements', []))} achievements, "
+                              f"expected {expected_config['achievements']}")
+
     # Check README exists
     readme_path = build_dir / "README.txt"
     if not readme_path.exists():
@@ -109,6 +136,12 @@ def validate_build(build_dir, expected_config):
 
 def main():
     """Main validation function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Validate Demo and Full export builds")
+    add_profile_arguments(parser)
+    start_profiling("validate_export", parser.parse_args())
+
     print_header("EXPORT VALIDATION")
 
     # Demo config
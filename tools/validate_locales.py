@@ -4,11 +4,13 @@ Validate Locales
 Checks all 29 languages for missing keys and consistency
 """
 
-import json
 import sys
 from pathlib import Path
 from collections import defaultdict
 
+from json_io import JSONDecodeError, read_json, write_json
+from profiling import profiler, add_profile_arguments, start_profiling
+
 PROJECT_ROOT = Path(__file__).parent.parent
 LOCALES_DIR = PROJECT_ROOT / "locales"
 META_DIR = LOCALES_DIR / "_meta"
@@ -32,12 +34,12 @@ def load_language_registry():
         print(f"[X] Language registry not found: {registry_path}")
         return None
 
-    with open(registry_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = read_json(registry_path, cached=True)
 
     return data.get("languages", {})
 
 
+@profiler.timed()
 def check_registry():
     """Check language registry"""
     print("[Validate Locales] Checking language registry...")
@@ -60,6 +62,7 @@ def check_registry():
     return True
 
 
+@profiler.timed()
 def check_locale_files():
     """Check locale files exist for all languages"""
     print("\n[Validate Locales] Checking locale files...")
@@ -86,6 +89,7 @@ def check_locale_files():
     return True
 
 
+@profiler.timed()
 def check_translation_keys():
     """Check for missing translation keys"""
     print("\n[Validate Locales] Checking translation keys...")
@@ -97,8 +101,7 @@ def check_translation_keys():
         print("[X] English locale file not found (needed as reference)")
         return False
 
-    with open(english_file, 'r', encoding='utf-8') as f:
-        english_keys = set(json.load(f).keys())
+    english_keys = set(read_json(english_file).keys())
 
     print(f"    Reference keys (English): {len(english_keys)}")
 
@@ -111,18 +114,19 @@ def check_translation_keys():
         if not locale_file.exists():
             continue
 
-        with open(locale_file, 'r', encoding='utf-8') as f:
-            try:
-                lang_data = json.load(f)
-                lang_keys = set(lang_data.keys())
+        try:
+            lang_data = read_json(locale_file)
+        except JSONDecodeError as e:
+            print(f"[X] Invalid JSON in {lang}: {e}")
+            return False
 
-                missing = english_keys - lang_keys
-                if missing:
-                    missing_keys_report[lang] = list(missing)
+        lang_keys = set(lang_data.keys())
+        profiler.count("files read")
+        profiler.count("keys checked", len(lang_keys))
 
-            except json.JSONDecodeError as e:
-                print(f"[X] Invalid JSON in {lang}: {e}")
-                return False
+        missing = english_keys - lang_keys
+        if missing:
+            missing_keys_report[lang] = list(missing)
 
     # Report missing keys
     if missing_keys_report:
@@ -135,8 +139,7 @@ def check_translation_keys():
         report_path = PROJECT_ROOT / "tools" / "logs" / "missing_keys_report.json"
         report_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(missing_keys_report, f, ensure_ascii=False, indent=2)
+        write_json(report_path, missing_keys_report, indent=2)
 
         print(f"\n    Detailed report: {report_path}")
         return False
@@ -145,6 +148,7 @@ def check_translation_keys():
     return True
 
 
+@profiler.timed()
 def check_rtl_languages():
     """Check RTL language configuration"""
     print("\n[Validate Locales] Checking RTL languages...")
@@ -166,6 +170,7 @@ def check_rtl_languages():
     return True
 
 
+@profiler.timed()
 def check_fallback_rules():
     """Check fallback rules"""
     print("\n[Validate Locales] Checking fallback rules...")
@@ -176,8 +181,7 @@ def check_fallback_rules():
         print(f"[X] Fallback rules not found: {fallback_path}")
         return False
 
-    with open(fallback_path, 'r', encoding='utf-8') as f:
-        rules = json.load(f).get("rules", {})
+    rules = read_json(fallback_path).get("rules", {})
 
     # Check all languages have fallback rules
     missing_rules = []
@@ -194,6 +198,12 @@ def check_fallback_rules():
 
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Validate locale registry and translations")
+    add_profile_arguments(parser)
+    start_profiling("validate_locales", parser.parse_args())
+
     print("="*60)
     print("LOCALIZATION VALIDATION")
     print("="*60)
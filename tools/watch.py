@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Watch Mode - Recompile and revalidate content as it is edited
+Watches the content _source, locales/ and assets/ trees (inotify on Linux,
+mtime polling elsewhere), debounces bursts of edits and reruns only the
+compile and validation steps the changed files feed
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import subprocess
+import sys
+import time
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from compile_content import SOURCE_DIR
+
+PROJECT_ROOT = Path(__file__).parent.parent
+TOOLS_DIR = Path(__file__).parent
+
+WATCH_ROOTS = [
+    SOURCE_DIR,
+    PROJECT_ROOT / "content",
+    PROJECT_ROOT / "locales",
+    PROJECT_ROOT / "assets",
+]
+
+# Wait this long after the last change before building
+DEBOUNCE_SECONDS = 0.3
+# ...but never hold a change back longer than this during a stream of edits
+MAX_DELAY_SECONDS = 2.0
+POLL_INTERVAL_SECONDS = 1.0
+
+# Editor swap/backup files and generated output never trigger a build
+IGNORED_PATTERNS = ["*~", "*.swp", "*.swx", "*.tmp", "*/.#*", "*/4913", "*/__pycache__/*", "*.import",
+                    str(PROJECT_ROOT / "assets" / "fonts" / "subset") + "/*"]
+
+
+def _under(root: Path, pattern: str) -> str:
+    return f"{root.as_posix()}/{pattern}"
+
+
+# (name, script, arguments, trigger patterns, steps whose run also triggers this one)
+# Listed in run order; `*` in a pattern also matches `/`. Compiled outputs are
+# not triggers, so a build never retriggers itself.
+STEPS = [
+    ("content", "compile_content.py", [], [
+        _under(SOURCE_DIR, "*"),
+        _under(PROJECT_ROOT, "locales/_meta/language_registry.json"),
+        _under(PROJECT_ROOT, "content/vocabulary/vocab_database.json"),
+    ], []),
+    ("vocabulary", "compile_vocab.py", [], [
+        _under(PROJECT_ROOT, "content/vocabulary/vocab_database.json"),
+        _under(PROJECT_ROOT, "content/side/srs_config.json"),
+        _under(PROJECT_ROOT, "content/side/vocab*.json"),
+    ], []),
+    ("evidence", "compile_evidence.py", [], [
+        _under(PROJECT_ROOT, "content/evidence/documents.json"),
+    ], []),
+    ("interrogations", "compile_interrogations.py", [], [
+        _under(PROJECT_ROOT, "content/interrogation/interrogations.json"),
+    ], []),
+    ("achievements", "compile_achievements.py", [], [
+        _under(PROJECT_ROOT, "content/achievements/achievements.json"),
+        _under(PROJECT_ROOT, "content/main/endings.json"),
+        _under(PROJECT_ROOT, "content/evidence/documents.json"),
+    ], ["content", "interrogations"]),
+    ("endings", "simulate_endings.py", ["--runs", "100000"], [
+        _under(PROJECT_ROOT, "content/main/endings.json"),
+    ], ["content", "interrogations"]),
+    ("validate content", "validate_content.py", [], [], ["content", "vocabulary"]),
+    ("locales", "compile_locales.py", [], [
+        _under(PROJECT_ROOT, "locales/*/ui.json"),
+        _under(PROJECT_ROOT, "locales/_meta/language_registry.json"),
+    ], []),
+    ("validate locales", "validate_locales.py", [], [
+        _under(PROJECT_ROOT, "locales/*.json"),
+    ], []),
+    # Gets the changed images as arguments; dry run, reports savings only
+    ("images", "optimize_images.py", [], [
+        _under(PROJECT_ROOT, f"assets/*{extension}") for extension in [".png", ".jpg", ".jpeg", ".webp"]
+    ], []),
+]
+PATH_ARGUMENT_STEPS = {"images"}
+
+
+def is_ignored(path: Path) -> bool:
+    text = path.as_posix()
+    return any(fnmatch(text, pattern) for pattern in IGNORED_PATTERNS)
+
+
+def affected_steps(changed: Set[Path]) -> Dict[str, List[Path]]:
+    """Steps to run for a set of changed paths, with the paths that triggered each"""
+    affected = {}
+    for name, _, _, triggers, after in STEPS:
+        matched = [path for path in sorted(changed) if any(fnmatch(path.as_posix(), pattern) for pattern in triggers)]
+        if matched or any(step in affected for step in after):
+            affected[name] = matched
+    return affected
+
+
+class PollingWatcher:
+    """Portable fallback: compare (mtime, size) snapshots of every watched file"""
+
+    def __init__(self, roots: List[Path], interval: float = POLL_INTERVAL_SECONDS):
+        self.roots = roots
+        self.interval = interval
+        self.snapshot = self.scan()
+
+    def scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for root in self.roots:
+            for dirpath, _, filenames in os.walk(root):
+                for filename in filenames:
+                    path = Path(dirpath) / filename
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def wait(self, timeout: Optional[float]) -> Set[Path]:
+        time.sleep(self.interval if timeout is None else min(timeout, self.interval))
+        current = self.scan()
+        changed = {path for path in current.keys() | self.snapshot.keys()
+                   if current.get(path) != self.snapshot.get(path)}
+        self.snapshot = current
+        return changed
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify through libc; one watch per directory, added as directories appear"""
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT = struct.Struct("iIII")
+
+    def __init__(self, roots: List[Path]):
+        library = ctypes.util.find_library("c")
+        if not library:
+            raise OSError("libc not found")
+        self.libc = ctypes.CDLL(library, use_errno=True)
+        if not hasattr(self.libc, "inotify_init1"):
+            raise OSError("inotify not available")
+
+        self.fd = self.libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.roots = roots
+        self.directories = {}
+        for root in roots:
+            self.add_tree(root)
+
+    def add_tree(self, root: Path) -> Set[Path]:
+        """Watch root and its subdirectories; returns the files already inside"""
+        files = set()
+        for dirpath, _, filenames in os.walk(root):
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(dirpath), self.MASK)
+            if wd >= 0:
+                self.directories[wd] = Path(dirpath)
+            files.update(Path(dirpath) / filename for filename in filenames)
+        return files
+
+    def wait(self, timeout: Optional[float]) -> Set[Path]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        data = os.read(self.fd, 64 * 1024)
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self.EVENT.unpack_from(data, offset)
+            offset += self.EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & self.IN_Q_OVERFLOW:
+                # Events were dropped: treat every watched file as changed
+                for root in self.roots:
+                    changed.update(path for path in root.rglob("*") if path.is_file())
+                continue
+            if mask & self.IN_IGNORED:
+                self.directories.pop(wd, None)
+                continue
+
+            directory = self.directories.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    changed.update(self.add_tree(path))
+            else:
+                changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+def run_step(script: str, arguments: List[str], verbose: bool) -> Tuple[bool, str]:
+    result = subprocess.run(
+        [sys.executable, str(TOOLS_DIR / script)] + arguments,
+        cwd=TOOLS_DIR,
+        capture_output=not verbose,
+        text=True
+    )
+    return result.returncode == 0, "" if verbose else (result.stdout + result.stderr)
+
+
+def build(changed: Set[Path], verbose: bool = False) -> bool:
+    affected = affected_steps(changed)
+    if not affected:
+        return True
+
+    stamp = time.strftime("%H:%M:%S")
+    names = ", ".join(path.name for path in sorted(changed)[:3]) + (" ..." if len(changed) > 3 else "")
+    print(f"\n[{stamp}] {len(changed)} changed ({names})")
+
+    all_passed = True
+    for name, script, arguments, _, _ in STEPS:
+        if name not in affected:
+            continue
+        if name in PATH_ARGUMENT_STEPS:
+            arguments = arguments + [str(path) for path in affected[name] if path.exists()]
+            if not arguments:
+                continue
+
+        start = time.perf_counter()
+        passed, output = run_step(script, arguments, verbose)
+        elapsed = time.perf_counter() - start
+
+        if passed:
+            print(f"  [OK] {name} ({elapsed:.1f}s)")
+        else:
+            all_passed = False
+            print(f"  [X] {name} ({elapsed:.1f}s)")
+            # Failing tools end with their report; show it
+            for line in output.rstrip().splitlines()[-25:]:
+                print(f"      {line}")
+    return all_passed
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Recompile and revalidate content on change")
+    parser.add_argument("--poll", action="store_true", help="Poll file times instead of using inotify")
+    parser.add_argument("--interval", type=float, default=POLL_INTERVAL_SECONDS, help="Polling interval in seconds")
+    parser.add_argument("--initial", action="store_true", help="Run every step once before watching")
+    parser.add_argument("--verbose", action="store_true", help="Show full tool output, not just failures")
+    args = parser.parse_args()
+
+    roots = [root for root in WATCH_ROOTS if root.is_dir()]
+    for root in WATCH_ROOTS:
+        if root not in roots:
+            print(f"[--] Not found, not watched: {root}")
+
+    watcher = None
+    if not args.poll:
+        try:
+            watcher = InotifyWatcher(roots)
+            print(f"[OK] Watching {len(watcher.directories)} directories (inotify)")
+        except (OSError, AttributeError) as e:
+            print(f"[!] inotify unavailable ({e}), polling instead")
+    if watcher is None:
+        watcher = PollingWatcher(roots, args.interval)
+        print(f"[OK] Watching {len(watcher.snapshot)} files (polling every {args.interval:g}s)")
+
+    if args.initial:
+        build({path for root in roots for path in root.rglob("*") if path.is_file()}, args.verbose)
+
+    print("Press Ctrl+C to stop")
+    pending = set()
+    first_change = last_change = 0.0
+
+    try:
+        while True:
+            if pending:
+                now = time.monotonic()
+                remaining = min(last_change + DEBOUNCE_SECONDS, first_change + MAX_DELAY_SECONDS) - now
+                if remaining <= 0:
+                    build(pending, args.verbose)
+                    pending = set()
+                    continue
+                changed = watcher.wait(remaining)
+            else:
+                changed = watcher.wait(None)
+
+            changed = {path for path in changed if not is_ignored(path)}
+            if changed:
+                last_change = time.monotonic()
+                if not pending:
+                    first_change = last_change
+                pending |= changed
+    except KeyboardInterrupt:
+        print("\n[OK] Stopped")
+    finally:
+        watcher.close()
+
+
+if __name__ == "__main__":
+    main()